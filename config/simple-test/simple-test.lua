@@ -13,6 +13,23 @@ local src_mac = os.getenv("PKTGEN_SRC_MAC")
 local dst_mac = os.getenv("PKTGEN_DST_MAC")
 local sleeptime_str = os.getenv("PKTGEN_DURATION")
 local packet_size_str = os.getenv("PKTGEN_PACKET_SIZE")
+local rate_str = os.getenv("PKTGEN_RATE")  -- optional: % of line rate (default 100)
+local stop_file = os.getenv("PKTGEN_STOP_FILE")  -- optional: stop early once this file exists
+-- optional latency mode: sampled round-trip latencies (ns) are written to PKTGEN_LATENCY_FILE,
+-- sampling starts once PKTGEN_LATENCY_START_FILE exists (steady state) or right away
+local latency_file = os.getenv("PKTGEN_LATENCY_FILE")
+local latency_start_file = os.getenv("PKTGEN_LATENCY_START_FILE")
+local latency_rate = tonumber(os.getenv("PKTGEN_LATENCY_RATE") or "1000")
+local latency_samples = tonumber(os.getenv("PKTGEN_LATENCY_SAMPLES") or "50000")
+-- optional traffic shape: PKTGEN_FLOWS distinct flows (TCP source ports PKTGEN_SRC_PORT, +1, ...)
+-- and PKTGEN_IMIX "size:weight,..." frame mix (sent as sequence packets instead of range mode)
+local flows = tonumber(os.getenv("PKTGEN_FLOWS") or "50000")
+local imix_str = os.getenv("PKTGEN_IMIX")
+local dst_ip = os.getenv("PKTGEN_DST_IP") or "198.18.0.1"
+local src_ip = os.getenv("PKTGEN_SRC_IP") or "192.168.0.1"
+local min_src_port = tonumber(os.getenv("PKTGEN_SRC_PORT") or "10000")
+local dst_port = tonumber(os.getenv("PKTGEN_DST_PORT") or "20000")
+local max_seq_pkts = 16
 
 -- Validate required environment variables
 if not src_mac or src_mac == "" then
@@ -36,13 +53,52 @@ end
 
 local sleeptime = tonumber(sleeptime_str)
 local packet_size = tonumber(packet_size_str)
+local rate = 100
+if rate_str and rate_str ~= "" then
+    rate = tonumber(rate_str)
+end
 
 print("=== PKTGEN Configuration ===")
 print("  Source MAC (PKTGEN): " .. src_mac)
 print("  Dest MAC (L3FWD):    " .. dst_mac)
 print("  Packet Size:         " .. packet_size .. " bytes")
 print("  Duration:            " .. sleeptime .. " sec")
-print("  Dest IP:             198.18.0.1 (L3FWD LPM route)")
+print("  Rate:                " .. rate .. " %")
+if stop_file and stop_file ~= "" then
+    print("  Stop file:           " .. stop_file .. " (duration is an upper bound)")
+end
+
+-- IMIX: expand "size:weight" pairs into one sequence packet per weight unit
+local imix = {}
+if imix_str and imix_str ~= "" then
+    for size, weight in string.gmatch(imix_str, "(%d+):(%d+)") do
+        for _ = 1, tonumber(weight) do
+            table.insert(imix, tonumber(size))
+        end
+    end
+    if #imix == 0 or #imix > max_seq_pkts then
+        print("ERROR: PKTGEN_IMIX must expand to 1-" .. max_seq_pkts .. " sequence packets: " .. imix_str)
+        os.exit(1)
+    end
+    if not pktgen.seqTable then
+        print("ERROR: this Pktgen build has no sequence packets, cannot send IMIX")
+        os.exit(1)
+    end
+    flows = math.min(flows, #imix)
+end
+if flows < 1 or min_src_port + flows - 1 > 65535 then
+    print("ERROR: PKTGEN_FLOWS must be 1-" .. (65536 - min_src_port) .. ": " .. flows)
+    os.exit(1)
+end
+if latency_file and latency_file ~= "" then
+    print("  Latency samples:     " .. latency_file .. " (" .. latency_rate .. " pkts/s)")
+end
+if #imix > 0 then
+    print("  IMIX:                " .. imix_str .. " (" .. #imix .. " sequence packets)")
+end
+print("  Flows:               " .. flows .. " (TCP src ports " .. min_src_port .. "-" .. (min_src_port + flows - 1) .. ")")
+print("  Source IP:           " .. src_ip)
+print("  Dest IP:             " .. dst_ip .. " (L3FWD LPM route), TCP dst port " .. dst_port)
 print("============================")
 
 pktgen.stop(port)
@@ -52,7 +108,7 @@ pktgen.delay(100)
 
 -- Configuration (same as measure-tx-rate.lua)
 pktgen.set(port, "size", packet_size)
-pktgen.set(port, "rate", 100)  -- 100% rate to utilize multiple cores
+pktgen.set(port, "rate", rate)  -- 100% by default to utilize multiple cores
 pktgen.set(port, "count", 0)   -- Continuous transmission (0 = infinite)
 
 -- Set MAC addresses
@@ -60,8 +116,8 @@ pktgen.set_mac(port, "src", src_mac)
 pktgen.set_mac(port, "dst", dst_mac)
 
 -- Set IP addresses (dst must match L3FWD's LPM route: 198.18.0.0/24)
-pktgen.set_ipaddr(port, "src", "192.168.0.1")
-pktgen.set_ipaddr(port, "dst", "198.18.0.1/24")
+pktgen.set_ipaddr(port, "src", src_ip)
+pktgen.set_ipaddr(port, "dst", dst_ip .. "/24")
 
 -- Set up Range configuration for TCP (same as measure-tx-rate.lua)
 pktgen.range.ip_proto("all", "tcp")
@@ -71,28 +127,29 @@ pktgen.range.src_mac(port, "start", src_mac)
 pktgen.range.dst_mac(port, "start", dst_mac)
 
 -- Set source IP (fixed)
-pktgen.range.src_ip(port, "start", "192.168.0.1")
+pktgen.range.src_ip(port, "start", src_ip)
 pktgen.range.src_ip(port, "inc", "0.0.0.0")
-pktgen.range.src_ip(port, "min", "192.168.0.1")
-pktgen.range.src_ip(port, "max", "192.168.0.1")
+pktgen.range.src_ip(port, "min", src_ip)
+pktgen.range.src_ip(port, "max", src_ip)
 
 -- Set destination IP (must match L3FWD's LPM route: 198.18.0.0/24)
-pktgen.range.dst_ip(port, "start", "198.18.0.1")
+pktgen.range.dst_ip(port, "start", dst_ip)
 pktgen.range.dst_ip(port, "inc", "0.0.0.0")
-pktgen.range.dst_ip(port, "min", "198.18.0.1")
-pktgen.range.dst_ip(port, "max", "198.18.0.1")
+pktgen.range.dst_ip(port, "min", dst_ip)
+pktgen.range.dst_ip(port, "max", dst_ip)
 
--- Set source TCP port (20000-20255, increment by 1, same as measure-tx-rate.lua)
-pktgen.range.src_port(port, "start", 20000)
-pktgen.range.src_port(port, "inc", 1)
-pktgen.range.src_port(port, "min", 10000)
-pktgen.range.src_port(port, "max", 60000)
+-- Set source TCP port: one port per flow, cycled packet by packet for RSS spread
+local max_src_port = min_src_port + flows - 1
+pktgen.range.src_port(port, "start", min_src_port)
+pktgen.range.src_port(port, "inc", flows > 1 and 1 or 0)
+pktgen.range.src_port(port, "min", min_src_port)
+pktgen.range.src_port(port, "max", max_src_port)
 
--- Set destination TCP port (fixed at 20000, same as measure-tx-rate.lua)
-pktgen.range.dst_port(port, "start", 20000)
+-- Set destination TCP port (fixed)
+pktgen.range.dst_port(port, "start", dst_port)
 pktgen.range.dst_port(port, "inc", 0)
-pktgen.range.dst_port(port, "min", 20000)
-pktgen.range.dst_port(port, "max", 20000)
+pktgen.range.dst_port(port, "min", dst_port)
+pktgen.range.dst_port(port, "max", dst_port)
 
 -- Set TTL (same as measure-tx-rate.lua)
 pktgen.range.ttl(port, "start", 64)
@@ -106,16 +163,88 @@ pktgen.range.pkt_size(port, "inc", 0)
 pktgen.range.pkt_size(port, "min", packet_size)
 pktgen.range.pkt_size(port, "max", packet_size)
 
--- Enable range mode (same as measure-tx-rate.lua)
-pktgen.set_range(port, "on")
+if #imix > 0 then
+    -- IMIX: sequence packets are sent in order, so each size repeats per its weight;
+    -- flows are spread over the sequence packets' source ports
+    for i, size in ipairs(imix) do
+        pktgen.seqTable(i - 1, port, {
+            ["eth_dst_addr"] = dst_mac,
+            ["eth_src_addr"] = src_mac,
+            ["ip_dst_addr"] = dst_ip,
+            ["ip_src_addr"] = src_ip .. "/24",
+            ["sport"] = min_src_port + (i - 1) % flows,
+            ["dport"] = dst_port,
+            ["ethType"] = "ipv4",
+            ["ipProto"] = "tcp",
+            ["vlanid"] = 1,
+            ["pktSize"] = size,
+            ["gtpu_teid"] = 0,
+        })
+    end
+    pktgen.set(port, "seq_cnt", #imix)
+else
+    -- Enable range mode (same as measure-tx-rate.lua)
+    pktgen.set_range(port, "on")
+end
+
+-- Latency mode: timestamped packets + sampler
+local latency_on = false
+local function file_exists(path)
+    local file = io.open(path, "r")
+    if file then
+        file:close()
+        return true
+    end
+    return false
+end
+local function start_latency_sampler()
+    pktgen.latsampler_params(port, "simple", latency_samples, latency_rate, latency_file)
+    pktgen.latsampler(port, "on")
+    latency_on = true
+    print("Latency sampler started")
+end
+if latency_file and latency_file ~= "" then
+    if not pktgen.latsampler then
+        print("WARNING: this Pktgen build has no latency sampler, latency mode disabled")
+        latency_file = nil
+    elseif pktgen.latency then
+        pktgen.latency(port, "enable")
+    end
+end
 
 pktgen.delay(100)
 
 -- Start transmission
 print("Starting packet transmission for " .. sleeptime .. " seconds")
 pktgen.start(port)
+if latency_file and (not latency_start_file or latency_start_file == "") then
+    start_latency_sampler()
+end
+
+-- Emit cumulative port counters once per second for the live telemetry
+-- collector (scripts/benchmark/telemetry.py): "TELEMETRY <sec> <tx_pkts> <rx_pkts>"
+-- and stop early once the profilers are done (run_test.py creates PKTGEN_STOP_FILE)
+for sec = 1, sleeptime do
+    pktgen.delay(1000)
+    local stats = pktgen.portStats(port, "port")[port]
+    print(string.format("TELEMETRY %d %d %d", sec, stats.opackets, stats.ipackets))
+    io.stdout:flush()
+    if latency_file and not latency_on and file_exists(latency_start_file) then
+        start_latency_sampler()
+    end
+    if stop_file and stop_file ~= "" and file_exists(stop_file) then
+        print("Stop file found after " .. sec .. " seconds")
+        break
+    end
+end
 
-pktgen.delay(sleeptime * 1000) -- sleep time in milliseconds
+-- Stopping the sampler writes the sampled latencies to latency_file
+if latency_on then
+    pktgen.latsampler(port, "off")
+    if pktgen.latency then
+        pktgen.latency(port, "disable")
+    end
+end
 
 -- Stop transmission BEFORE reading statistics
 print("Stopping packet transmission...")
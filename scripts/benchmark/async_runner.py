@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Asyncio runner core for PKTGEN/L3FWD tests
+Every process of a test (DPDK apps, profilers, telemetry pollers), local or
+remote, runs as a supervised ProcessTask: its own asyncio subprocess with its
+stdout stream (written to a log file, matched against readiness patterns),
+exit code and cancellation. Remote commands run over ssh in their own process
+group on the node, so stopping a task kills exactly its processes instead of
+pkill -f; a Supervisor stops whatever is still running when a test ends,
+fails or is interrupted
+"""
+
+import asyncio
+import collections
+import os
+import re
+import shlex
+import signal
+import time
+
+# One multiplexed SSH connection per node, reused by every remote task
+SSH_OPTS = ('-o', 'BatchMode=yes', '-o', 'ControlMaster=auto',
+            '-o', 'ControlPath=/tmp/dpdk-bench-ssh-%r@%h:%p', '-o', 'ControlPersist=120')
+PGID_RE = re.compile(r'^@@pgid (\d+)$')  # First line of a remote task: its process group on the node
+
+
+async def wait_for_file(path, timeout, non_empty=False, poll_interval=0.2):
+    """Wait until path exists (non_empty: has content); False after timeout seconds"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if os.path.exists(path) and (not non_empty or os.path.getsize(path) > 0):
+            return True
+        await asyncio.sleep(poll_interval)
+    return False
+
+
+class ProcessTask:
+    """One supervised local or remote shell command
+
+    stdout and stderr are merged, written to log_file (if given) and split into
+    lines: the last log_lines are kept in lines, on_line(line) is called for
+    each, and watch [(what, regex)] patterns set ready[what] when they match.
+    """
+
+    def __init__(self, name, cmd, node=None, log_file=None, watch=None, on_line=None, log_lines=200):
+        self.name = name
+        self.cmd = cmd
+        self.node = node
+        self.log_file = log_file
+        self.watch = {what: re.compile(pattern) for what, pattern in (watch or [])}
+        self.on_line = on_line
+        self.lines = collections.deque(maxlen=log_lines)
+        self.ready = {}  # what -> local time the pattern matched
+        self.started_at = None
+        self.first_output_at = None
+        self._proc = None
+        self._pgid = None
+        self._reader = None
+        self._changed = asyncio.Event()
+
+    @property
+    def returncode(self):
+        return self._proc.returncode if self._proc else None
+
+    @property
+    def running(self):
+        return self._proc is not None and self._proc.returncode is None
+
+    async def start(self):
+        """Launch the command (locally in a new session, or over ssh in a new process group)"""
+        if self.node:
+            # setsid: the remote shell's PID is the process group stop() signals
+            remote = 'echo "@@pgid $$"; exec sh -c ' + shlex.quote(self.cmd)
+            self._proc = await asyncio.create_subprocess_exec(
+                'ssh', *SSH_OPTS, self.node, f'setsid sh -c {shlex.quote(remote)}',
+                stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+        else:
+            self._proc = await asyncio.create_subprocess_shell(
+                self.cmd, stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT, start_new_session=True)
+            self._pgid = self._proc.pid
+        self.started_at = time.time()
+        self._reader = asyncio.create_task(self._read(), name=f'{self.name}-stdout')
+        return self
+
+    async def _read(self):
+        log = open(self.log_file, 'wb') if self.log_file else None
+        pending = ''
+        try:
+            while True:
+                chunk = await self._proc.stdout.read(65536)
+                if not chunk:
+                    break
+                text = chunk.decode('utf-8', errors='ignore')
+                if self.node and self._pgid is None:
+                    # Strip the remote process group line before anything reaches the log
+                    line, sep, rest = (pending + text).partition('\n')
+                    if not sep:
+                        pending += text
+                        continue
+                    match = PGID_RE.match(line.strip())
+                    if match:
+                        self._pgid = int(match.group(1))
+                        pending, text = '', rest
+                        chunk = rest.encode()
+                    else:
+                        self._pgid = 0
+                        pending, text = '', pending + text
+                        chunk = text.encode()
+                    if not text:
+                        continue
+                if log:
+                    log.write(chunk)
+                    log.flush()
+                if self.first_output_at is None:
+                    self.first_output_at = time.time()
+                pending += text
+                *lines, pending = re.split(r'[\r\n]', pending)
+                for line in lines:
+                    self._on_line(line)
+                self._changed.set()
+            if pending:
+                self._on_line(pending)
+        finally:
+            if log:
+                log.close()
+            await self._proc.wait()
+            self._changed.set()
+
+    def _on_line(self, line):
+        self.lines.append(line)
+        for what, pattern in list(self.watch.items()):
+            if pattern.search(line):
+                del self.watch[what]
+                self.ready[what] = time.time()
+        if self.on_line:
+            self.on_line(line)
+
+    async def _wait_until(self, condition, timeout):
+        """Wait until condition() holds (re-checked on every output or exit); False on timeout"""
+        deadline = None if timeout is None else time.time() + timeout
+        while not condition():
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                return condition()
+        return True
+
+    async def wait_ready(self, whats, timeout):
+        """Wait until every readiness pattern in whats matched; False on timeout or exit"""
+        await self._wait_until(lambda: all(what in self.ready for what in whats) or not self.running, timeout)
+        return all(what in self.ready for what in whats)
+
+    async def wait_output(self, timeout):
+        """Wait for the first output (e.g. a profiler printed its first sample); False on timeout or exit"""
+        await self._wait_until(lambda: self.first_output_at is not None or not self.running, timeout)
+        return self.first_output_at is not None
+
+    async def wait(self, timeout=None):
+        """Wait for exit and all output; returns the exit code (None on timeout)"""
+        try:
+            await asyncio.wait_for(asyncio.shield(self._reader), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return self.returncode
+
+    async def signal(self, sig):
+        """Send sig to the task's whole process group (sudo'ed processes included)"""
+        if not self.running or not self._pgid:
+            return
+        kill_cmd = f'sudo -n kill -{sig.name[3:]} -{self._pgid} 2>/dev/null || kill -{sig.name[3:]} -{self._pgid}'
+        if self.node:
+            proc = await asyncio.create_subprocess_exec('ssh', *SSH_OPTS, self.node, kill_cmd,
+                                                        stdout=asyncio.subprocess.DEVNULL,
+                                                        stderr=asyncio.subprocess.DEVNULL)
+        elif os.geteuid() == 0:
+            try:
+                os.killpg(self._pgid, sig)
+            except ProcessLookupError:
+                pass
+            return
+        else:
+            proc = await asyncio.create_subprocess_shell(kill_cmd, stdout=asyncio.subprocess.DEVNULL,
+                                                         stderr=asyncio.subprocess.DEVNULL)
+        await proc.wait()
+
+    async def stop(self, grace=5):
+        """SIGTERM the process group, SIGKILL it after grace seconds; returns the exit code"""
+        if self.running:
+            await self.signal(signal.SIGTERM)
+            if await self.wait(grace) is None:
+                await self.signal(signal.SIGKILL)
+                if self.node and await self.wait(grace) is None:
+                    self._proc.kill()  # Unreachable node: drop the ssh session
+        return await self.wait()
+
+
+class Supervisor:
+    """Owns the ProcessTasks of one test; stops all still-running tasks on exit
+
+    Use as `async with Supervisor(local_node) as supervisor:`. Tasks whose
+    node is local_node (or None) run as local subprocesses.
+    """
+
+    def __init__(self, local_node=None, grace=5):
+        self.local_node = local_node
+        self.grace = grace
+        self.tasks = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop_all()
+        return False
+
+    async def spawn(self, name, cmd, node=None, **kwargs):
+        """Start cmd as a supervised task named name"""
+        if node == self.local_node:
+            node = None
+        task = ProcessTask(name, cmd, node, **kwargs)
+        self.tasks[name] = task
+        return await task.start()
+
+    async def stop_all(self):
+        """Stop every running task concurrently"""
+        # Shielded: cleanup must finish even when the test itself was cancelled
+        await asyncio.shield(asyncio.gather(*(task.stop(self.grace) for task in self.tasks.values()),
+                                            return_exceptions=True))
+
+    def exit_codes(self):
+        return {name: task.returncode for name, task in self.tasks.items()}
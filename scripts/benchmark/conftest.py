@@ -0,0 +1,3 @@
+# pytest setup for the benchmark scripts' unit tests (tests/): test_config.py is
+# the benchmark configuration, not a test module
+collect_ignore = ['test_config.py']
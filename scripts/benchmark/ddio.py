@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+DDIO control for the DDIO sweep
+Sets and reads back Data Direct I/O on a node: the allocating-write flow of
+the NIC's PCIe root port (perfctrlsts_0 in its config space, the register
+ddio-modify flips) and the LLC way mask DDIO may allocate into (IIO_LLC_WAYS
+MSR), using setpci and rdmsr/wrmsr (msr-tools). DRAM write bandwidth per
+packet cross-checks the state: with DDIO off every received packet is
+written to DRAM
+
+Remote nodes are driven by running this file there: `ddio.py get <pci>`,
+`ddio.py set <pci> on|off [way_mask]`
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+PERFCTRLSTS_0 = 0x180                 # Root port config space register
+USE_ALLOCATING_FLOW_WR = 1 << 7       # Inbound writes allocate in the LLC (DDIO on)
+NOSNOOP_OP_WR_EN = 1 << 3             # Inbound writes go to memory (DDIO off)
+IIO_LLC_WAYS_MSR = 0xC8B              # LLC ways DDIO allocates into (bit mask)
+DRAM_WR_OFF_RATIO = 0.5               # DDIO off: DRAM writes >= this fraction of the frame size per packet
+
+
+def _run(cmd):
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if result.returncode:
+        raise RuntimeError(f'{" ".join(cmd)}: {(result.stderr or result.stdout).strip()}')
+    return result.stdout.strip()
+
+
+def _device(pci_address):
+    return pci_address if pci_address.count(':') == 2 else f'0000:{pci_address}'
+
+
+def root_port(pci_address, sys_root='/sys'):
+    """PCI address of the root port above the NIC (None if the NIC sits on the root bus)"""
+    path = os.path.realpath(f'{sys_root}/bus/pci/devices/{_device(pci_address)}')
+    parts = path.split('/')
+    # /sys/devices/pci0000:17/0000:17:00.0/0000:18:00.0 -> 0000:17:00.0
+    bus_index = next((i for i, part in enumerate(parts) if part.startswith('pci')), None)
+    if bus_index is None or bus_index + 2 >= len(parts):
+        return None
+    return parts[bus_index + 1]
+
+
+def _msr_cpu(pci_address, sys_root='/sys'):
+    """A CPU on the NIC's socket (IIO_LLC_WAYS is per package)"""
+    cpus = ''
+    try:
+        with open(f'{sys_root}/bus/pci/devices/{_device(pci_address)}/local_cpulist', 'r') as file:
+            cpus = file.read().strip()
+    except OSError:
+        pass
+    return cpus.split(',')[0].split('-')[0] or '0'
+
+
+def read_state(pci_address):
+    """{'root_port', 'perfctrlsts', 'enabled', 'way_mask'} of the NIC's DDIO (raises RuntimeError)"""
+    port = root_port(pci_address)
+    if not port:
+        raise RuntimeError(f'no PCIe root port found for {pci_address}')
+    perfctrlsts = int(_run(['sudo', 'setpci', '-s', port, f'{PERFCTRLSTS_0:#x}.L']), 16)
+    way_mask = int(_run(['sudo', 'rdmsr', '-p', _msr_cpu(pci_address), f'{IIO_LLC_WAYS_MSR:#x}']), 16)
+    return {
+        'root_port': port,
+        'perfctrlsts': perfctrlsts,
+        'enabled': bool(perfctrlsts & USE_ALLOCATING_FLOW_WR) and not perfctrlsts & NOSNOOP_OP_WR_EN,
+        'way_mask': way_mask,
+    }
+
+
+def write_state(pci_address, enabled, way_mask=None):
+    """Turn DDIO on/off for the NIC (and set the LLC way mask); returns read_state() afterwards"""
+    state = read_state(pci_address)
+    perfctrlsts = state['perfctrlsts']
+    if enabled:
+        perfctrlsts = (perfctrlsts | USE_ALLOCATING_FLOW_WR) & ~NOSNOOP_OP_WR_EN
+    else:
+        perfctrlsts = (perfctrlsts & ~USE_ALLOCATING_FLOW_WR) | NOSNOOP_OP_WR_EN
+    _run(['sudo', 'setpci', '-s', state['root_port'], f'{PERFCTRLSTS_0:#x}.L={perfctrlsts:08x}'])
+    if way_mask is not None:
+        _run(['sudo', 'wrmsr', '-a', f'{IIO_LLC_WAYS_MSR:#x}', f'{way_mask:#x}'])
+    return read_state(pci_address)
+
+
+def ddio_control(pci_address, node=None, enabled=None, way_mask=None,
+                 ssh_opts=('-o', 'BatchMode=yes'), timeout=20):
+    """read_state() (enabled=None) or write_state() locally (node=None) or on node over ssh
+
+    Returns the state read back, or {'error': message}.
+    """
+    args = ['get', pci_address] if enabled is None else \
+        ['set', pci_address, 'on' if enabled else 'off'] + ([] if way_mask is None else [f'{way_mask:#x}'])
+    if node is None:
+        return _main(args)
+    cmd = ['ssh', *ssh_opts, node, ' '.join(['python3', os.path.abspath(__file__)] + args)]
+    try:
+        output = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False).stdout
+        return json.loads(output)
+    except (OSError, subprocess.TimeoutExpired, ValueError) as e:
+        return {'error': f'{node}: {e}'}
+
+
+def check_dram_writes(enabled, dram_wr_bpp, frame_size, off_ratio=DRAM_WR_OFF_RATIO):
+    """Whether DRAM write bytes per packet agree with the DDIO state (None if either is unknown)
+
+    DDIO off: received packets land in DRAM, so writes per packet approach
+    the frame size; DDIO on (and the ways not thrashed): far below it.
+    """
+    if enabled is None or not dram_wr_bpp or not frame_size:
+        return None
+    return (dram_wr_bpp >= frame_size * off_ratio) != bool(enabled)
+
+
+def _main(args):
+    try:
+        if len(args) == 2 and args[0] == 'get':
+            return read_state(args[1])
+        if len(args) in (3, 4) and args[0] == 'set' and args[2] in ('on', 'off'):
+            return write_state(args[1], args[2] == 'on', int(args[3], 16) if len(args) == 4 else None)
+    except (RuntimeError, OSError, ValueError) as e:
+        return {'error': str(e)}
+    return {'error': f'usage: {sys.argv[0]} get <pci> | set <pci> on|off [way_mask]'}
+
+
+if __name__ == '__main__':
+    state = _main(sys.argv[1:])
+    print(json.dumps(state))
+    sys.exit(1 if 'error' in state else 0)
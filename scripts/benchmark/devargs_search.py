@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Budgeted search over NIC devargs (mlx5 inline/MPW knobs) for the devargs tuning mode
+Samples knob combinations from a search space, merges them into devargs
+strings and ranks candidates by Mpps, breaking near-ties by PCIe bytes per
+packet; run_test.py runs successive halving on top (the better half of the
+candidates gets more runs each rung)
+"""
+
+import math
+import random
+
+import numpy as np
+
+
+def parse_devargs(devargs):
+    """'txqs_min_inline=0,txq_mpw_en=1' -> {'txqs_min_inline': '0', 'txq_mpw_en': '1'}"""
+    knobs = {}
+    for part in (devargs or '').split(','):
+        if part.strip():
+            key, _, value = part.partition('=')
+            knobs[key.strip()] = value.strip()
+    return knobs
+
+
+def format_devargs(base, knobs):
+    """Devargs string of base (string) with knobs (dict) added or overriding its keys"""
+    merged = parse_devargs(base)
+    merged.update({key: str(value) for key, value in knobs.items()})
+    return ','.join(f'{key}={value}' for key, value in merged.items())
+
+
+def sample_candidates(space, count, seed=None):
+    """count distinct knob combinations of space {knob: [values]} (all of them if there are fewer)"""
+    knobs = list(space)
+    total = math.prod(len(space[knob]) for knob in knobs)
+    rng = random.Random(seed)
+    if total <= count:
+        indexes = range(total)
+    else:
+        indexes = sorted(rng.sample(range(total), count))
+    candidates = []
+    for index in indexes:
+        combination = {}
+        for knob in reversed(knobs):
+            index, choice = divmod(index, len(space[knob]))
+            combination[knob] = space[knob][choice]
+        candidates.append({knob: combination[knob] for knob in knobs})
+    return candidates
+
+
+def rank_candidates(stats, tolerance=0.01):
+    """Rank devargs by their runs: [{'devargs', 'mpps', 'pcie_bpp', 'runs'}], best first
+
+    stats: {devargs: [(mpps, pcie_bytes_per_packet or None)]}. Candidates whose
+    mean Mpps is within tolerance (relative) of the best are ordered by mean
+    PCIe bytes per packet (unknown last), the rest by Mpps.
+    """
+    ranked = []
+    for devargs, runs in stats.items():
+        bpp = [value for _, value in runs if value is not None]
+        ranked.append({
+            'devargs': devargs,
+            'mpps': round(float(np.mean([mpps for mpps, _ in runs])), 3),
+            'pcie_bpp': round(float(np.mean(bpp)), 1) if bpp else None,
+            'runs': len(runs),
+        })
+    if not ranked:
+        return ranked
+    best = max(row['mpps'] for row in ranked)
+
+    def key(row):
+        near_best = row['mpps'] >= best * (1 - tolerance)
+        return (not near_best,
+                row['pcie_bpp'] is None if near_best else False,
+                (row['pcie_bpp'] or 0) if near_best else -row['mpps'])
+    return sorted(ranked, key=key)
+
+
+def survivors(ranked, eta):
+    """Devargs kept for the next successive halving rung: the best ceil(n / eta)"""
+    return [row['devargs'] for row in ranked[:math.ceil(len(ranked) / eta)]]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+HDR-style latency histograms for latency mode (run_test.py latency)
+simple-test.lua runs pktgen's latency sampler once traffic is steady and dumps
+sampled round-trip latencies (ns, one per line) to <experiment_id>.latency;
+they are bucketed into a LatencyHistogram saved as <experiment_id>.latency-hist.npz
+so histograms from repeated runs can be merged before computing percentiles
+"""
+
+import os
+
+import numpy as np
+
+PRECISION_BITS = 8  # 2^8 sub-buckets per power of two: < 0.8% relative bucket error
+
+
+def _bucket_indices(values, precision_bits):
+    """Map non-negative integer values to HDR bucket indices (vectorized)
+
+    Values below 2^precision_bits map 1:1; above, each power-of-two range is
+    split into 2^(precision_bits-1) equal-width buckets.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    sub_count = 1 << precision_bits
+    half = sub_count >> 1
+    bit_length = np.frexp(values.astype(np.float64))[1]
+    shift = np.maximum(bit_length - precision_bits, 0)
+    top = values >> shift
+    return np.where(shift == 0, values, sub_count + (shift - 1) * half + (top - half))
+
+
+def _bucket_upper_bounds(count, precision_bits):
+    """Highest value that maps to each of the first count buckets"""
+    sub_count = 1 << precision_bits
+    half = sub_count >> 1
+    index = np.arange(count, dtype=np.int64)
+    shift = np.where(index < sub_count, 0, (index - sub_count) // half + 1)
+    top = np.where(index < sub_count, index, half + (index - sub_count) % half)
+    return ((top + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear (HDR-style) histogram of integer latencies in nanoseconds"""
+
+    def __init__(self, precision_bits=PRECISION_BITS, counts=None, min_value=None, max_value=None):
+        self.precision_bits = precision_bits
+        self.counts = np.zeros(0, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        self.min_value = min_value
+        self.max_value = max_value
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def record(self, values):
+        """Add an array of latency samples (ns); negative samples are dropped"""
+        values = np.asarray(values, dtype=np.int64)
+        values = values[values >= 0]
+        if not len(values):
+            return self
+        counts = np.bincount(_bucket_indices(values, self.precision_bits))
+        self._add_counts(counts)
+        low, high = int(values.min()), int(values.max())
+        self.min_value = low if self.min_value is None else min(self.min_value, low)
+        self.max_value = high if self.max_value is None else max(self.max_value, high)
+        return self
+
+    def merge(self, other):
+        """Add another histogram's counts (same precision) into this one"""
+        if other.precision_bits != self.precision_bits:
+            raise ValueError(f'Cannot merge histograms with precision {other.precision_bits} and {self.precision_bits}')
+        if other.total:
+            self._add_counts(other.counts)
+            self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+            self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+        return self
+
+    def _add_counts(self, counts):
+        if len(counts) > len(self.counts):
+            self.counts = np.pad(self.counts, (0, len(counts) - len(self.counts)))
+        self.counts[:len(counts)] += counts
+
+    def percentile(self, q):
+        """Value at percentile q (0-100): upper bound of the bucket holding it, capped at max"""
+        total = self.total
+        if not total:
+            return None
+        rank = max(int(np.ceil(q / 100.0 * total)), 1)
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        upper = int(_bucket_upper_bounds(index + 1, self.precision_bits)[index])
+        return min(upper, self.max_value)
+
+    def summary(self, unit_ns=1000):
+        """p50/p99/p99.9/max (and min, samples), converted from ns to unit_ns (default: us)"""
+        if not self.total:
+            return {'samples': 0, 'min': None, 'p50': None, 'p99': None, 'p99.9': None, 'max': None}
+        return {
+            'samples': self.total,
+            'min': round(self.min_value / unit_ns, 3),
+            'p50': round(self.percentile(50) / unit_ns, 3),
+            'p99': round(self.percentile(99) / unit_ns, 3),
+            'p99.9': round(self.percentile(99.9) / unit_ns, 3),
+            'max': round(self.max_value / unit_ns, 3),
+        }
+
+    def save(self, path):
+        """Save counts (trimmed) and min/max to an .npz file"""
+        nonzero = np.flatnonzero(self.counts)
+        counts = self.counts[:nonzero[-1] + 1] if len(nonzero) else self.counts[:0]
+        np.savez(path, counts=counts, precision_bits=self.precision_bits,
+                 min_value=-1 if self.min_value is None else self.min_value,
+                 max_value=-1 if self.max_value is None else self.max_value)
+
+    @classmethod
+    def load(cls, path):
+        """Load a histogram written by save()"""
+        with np.load(path) as data:
+            min_value, max_value = int(data['min_value']), int(data['max_value'])
+            return cls(int(data['precision_bits']), data['counts'],
+                       None if min_value < 0 else min_value, None if max_value < 0 else max_value)
+
+
+def merge_histograms(paths):
+    """Merge saved histograms (e.g. repeated runs of one sweep point)"""
+    merged = None
+    for path in paths:
+        histogram = LatencyHistogram.load(path)
+        merged = histogram if merged is None else merged.merge(histogram)
+    return merged
+
+
+def load_latency_samples(path):
+    """Read pktgen latency sampler output: one latency (ns) per line, headers ignored"""
+    samples = []
+    if not os.path.exists(path):
+        return np.zeros(0, dtype=np.int64)
+    with open(path, 'r', encoding='utf-8', errors='ignore') as file:
+        for line in file:
+            line = line.strip()
+            if line.isdigit():
+                samples.append(int(line))
+    return np.array(samples, dtype=np.int64)
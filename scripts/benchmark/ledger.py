@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Persistent run ledger for resumable sweeps
+Every finished sweep point is appended to a JSON-lines ledger keyed by a hash of
+its full configuration (sweep parameters, devargs, binary build IDs, profiler
+set, ...). A rerun skips points that already have valid results, retries
+failed ones, and re-parses cached raw logs when the parser version changed
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+def config_key(config):
+    """Stable short hash of a JSON-serializable configuration dict"""
+    blob = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=None)
+def build_id(path):
+    """GNU build ID of an ELF binary, else SHA-1 of its contents ('missing' if absent)"""
+    if not os.path.exists(path):
+        return 'missing'
+    try:
+        notes = subprocess.run(['readelf', '-n', path], capture_output=True, text=True, check=False).stdout
+        match = re.search(r'Build ID:\s*([0-9a-f]+)', notes)
+        if match:
+            return match.group(1)
+    except OSError:
+        pass
+    sha = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class RunLedger:
+    """Append-only JSON-lines ledger; the last entry per key wins
+
+    Entries: {'key', 'status' ('done'/'failed'), 'parser_version', 'time',
+    'result', ...caller fields (experiment_id, point, testbed)}. Lines cut
+    short by an interrupted write are ignored on load.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8', errors='ignore') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and 'key' in entry:
+                        self.entries[entry['key']] = entry
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def record(self, key, status, parser_version, result=None, **fields):
+        """Append an entry and flush it to disk immediately"""
+        entry = dict(fields, key=key, status=status, parser_version=parser_version,
+                     time=time.time(), result=result)
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a') as file:
+                file.write(line + '\n')
+                file.flush()
+                os.fsync(file.fileno())
+            self.entries[key] = entry
+        return entry
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Line-rate and per-packet cost reporting for PKTGEN/L3FWD results
+Converts packet rates (Mpps) to L2/L1 Gbps and % of line rate for a frame
+size, wire overhead and link speed, and normalizes pcm-pcie and pcm-memory
+bandwidth to bytes per packet: the per-packet PCIe and DRAM cost that shows
+whether a DDIO or inline setting helped
+"""
+
+# Derived columns (efficiency_columns) -> source bandwidth column and its bytes per second
+PER_PACKET_COLUMNS = {
+    'pcie_rd_bpp': ('pcie_rd_total', 1),       # pcm-pcie: bytes per 1 s sample
+    'pcie_wr_bpp': ('pcie_wr_total', 1),
+    'dram_rd_bpp': ('dram_rd_bw', 1_000_000),  # pcm-memory: MB/s
+    'dram_wr_bpp': ('dram_wr_bw', 1_000_000),
+}
+
+
+def l2_gbps(mpps, frame_size):
+    """Ethernet frame bits per second (frame_size includes the CRC)"""
+    return mpps * frame_size * 8 / 1000
+
+
+def l1_gbps(mpps, frame_size, overhead):
+    """Bits per second on the wire, overhead (preamble/SFD and inter-frame gap bytes per frame) included"""
+    return mpps * (frame_size + overhead) * 8 / 1000
+
+
+def line_rate_mpps(link_gbps, frame_size, overhead):
+    """Maximum packet rate of a link_gbps link at frame_size"""
+    return link_gbps * 1000 / ((frame_size + overhead) * 8)
+
+
+def bytes_per_packet(bytes_per_sec, mpps):
+    """Bandwidth normalized by packet rate (None without packets or without a measurement)"""
+    if not mpps or not bytes_per_sec:
+        return None
+    return bytes_per_sec / (mpps * 1_000_000)
+
+
+def efficiency_columns(record, link_gbps, overhead):
+    """Derived columns of one result record
+
+    Uses the record's tx_rate (packets pktgen sent / L3FWD forwarded),
+    packet_size (mean frame size) and whichever PCIe/DRAM bandwidth columns
+    it has. Returns {'l2_gbps', 'l1_gbps', 'line_rate_pct', 'pcie_rd_bpp',
+    'pcie_wr_bpp', 'dram_rd_bpp', 'dram_wr_bpp'} (None where not computable).
+    """
+    mpps = record.get('tx_rate') or 0
+    frame_size = record.get('packet_size')
+    columns = {'l2_gbps': None, 'l1_gbps': None, 'line_rate_pct': None}
+    if frame_size:
+        columns['l2_gbps'] = round(l2_gbps(mpps, frame_size), 3)
+        columns['l1_gbps'] = round(l1_gbps(mpps, frame_size, overhead), 3)
+        if link_gbps:
+            columns['line_rate_pct'] = round(mpps / line_rate_mpps(link_gbps, frame_size, overhead) * 100, 2)
+    for name, (source, scale) in PER_PACKET_COLUMNS.items():
+        value = record.get(source)
+        per_packet = bytes_per_packet(None if value is None else value * scale, mpps)
+        columns[name] = None if per_packet is None else round(per_packet, 1)
+    return columns
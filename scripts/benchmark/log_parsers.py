@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Single-pass streaming parsers for profiler logs (pcm-pcie, pcm-memory, perf stat, NeoHost)
+Each iter_*_samples() reads its file line by line with precompiled patterns and
+yields typed per-sample records; aggregation is left to the callers in run_test.py
+"""
+
+import re
+from collections import namedtuple
+
+# kind: 'total', 'miss' or 'hit' (pcm-pcie -e rows); counts are raw events, bytes are bytes
+PcmPcieSample = namedtuple('PcmPcieSample', ['socket', 'kind', 'rdcur', 'rd_bytes', 'wr_bytes'])
+# metric: 'read' or 'write' (MB/s)
+PcmMemorySample = namedtuple('PcmMemorySample', ['socket', 'metric', 'value'])
+# item: perf event name or derived metric name (MB/s for bandwidth metrics)
+PerfSample = namedtuple('PerfSample', ['timestamp', 'item', 'value'])
+# metric: 'outbound_stalled_reads', 'pcie_inbound_bw' or 'pcie_outbound_bw' (Gb/s)
+NeohostSample = namedtuple('NeohostSample', ['metric', 'value'])
+
+################## TOKENIZERS #####################
+PCM_PCIE_SOCKET_RE = re.compile(r'^\s*(\d+)\s+')
+PCM_PCIE_VALUE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([KMG]?)')
+
+# Newer tabular format: "  0 | 12345 | 12345 | 123.4 | 123.4 | ..."
+PCM_MEMORY_TABLE_RE = re.compile(r'^\s*(\d+)\s*\|\s*\d+\s*\|\s*\d+\s*\|\s*([\d\.]+)\s*\|\s*([\d\.]+)')
+# SKT format: "|-- SKT  0 Mem Read (MB/s) :  1197.75 --||-- SKT  1 Mem Read (MB/s) : ..."
+PCM_MEMORY_SKT_READ_RE = re.compile(r'SKT\s*(\d+)\s*Mem Read \(MB/s\)\s*:\s*([\d\.]+)')
+PCM_MEMORY_SKT_WRITE_RE = re.compile(r'SKT\s*(\d+)\s*Mem Write\(MB/s\)\s*:\s*([\d\.]+)')
+# Older NODE format: "NODE 0 Mem Read (MB/s):   1234.5"
+PCM_MEMORY_NODE_READ_RE = re.compile(r'NODE\s*(\d+)\s*Mem Read \(MB/s\):\s*([\d\.]+)')
+PCM_MEMORY_NODE_WRITE_RE = re.compile(r'NODE\s*(\d+)\s*Mem Write \(MB/s\):\s*([\d\.]+)')
+
+# "1.001096320 S0       32            571,500      LLC-load-misses"
+PERF_COUNT_RE = re.compile(r'\s*([\d\.]+)\s+S\d+\s+\d+\s+([\d,]+)\s+(\S+?)(?:\s|$)')
+# "1.001096320 S0  1  2,513,972  UNC_CHA_REQUESTS.WRITES_LOCAL  #  160.9 MB/s  llc_miss_local_memory_bandwidth_write"
+PERF_BW_RE = re.compile(r'\s*([\d\.]+)\s+S\d+\s+\d+\s+([\d,]+)\s+\S+\s+#\s+([\d\.]+)\s+MB/s\s+(\S+)')
+
+# "|| Outbound Stalled Reads                                    || 0               ||"
+NEOHOST_STALLED_READS_RE = re.compile(r'\|\|\s*Outbound Stalled Reads\s*\|\|\s*([\d,]+)\s*\|\|')
+# "||| PCIe Inbound Used BW                || 8.8684        [Gb/s]             ||"
+NEOHOST_INBOUND_BW_RE = re.compile(r'\|\|\|\s*PCIe Inbound Used BW\s*\|\|\s*([\d,\.]+)\s*\[Gb/s\]')
+NEOHOST_OUTBOUND_BW_RE = re.compile(r'\|\|\|\s*PCIe Outbound Used BW\s*\|\|\s*([\d,\.]+)\s*\[Gb/s\]')
+
+_COUNT_SCALE = {'': 1, 'K': 1000, 'M': 1000 ** 2, 'G': 1000 ** 3}
+_BYTES_SCALE = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def iter_lines(path):
+    """Yield lines of a (possibly very large) log file without loading it into memory"""
+    with open(path, "r", encoding='utf-8', errors='ignore') as file:
+        for line in file:
+            yield line.rstrip('\n')
+
+
+def iter_pcm_pcie_samples(path, target_socket=0):
+    """Stream pcm-pcie -B -e rows for target_socket
+
+    Column positions come from the "Skt | PCIRdCur | ... | PCIe Rd (B) | PCIe Wr (B)"
+    header, which varies by machine; rows before the header are ignored.
+    """
+    rdcur_idx = pcie_rd_idx = pcie_wr_idx = None
+    for line in iter_lines(path):
+        if 'Skt' in line:
+            if rdcur_idx is None and 'PCIRdCur' in line and 'PCIe Rd (B)' in line:
+                header_cols = [col.strip() for col in line.split('|')]
+                rdcur_idx = header_cols.index('PCIRdCur')
+                pcie_rd_idx = header_cols.index('PCIe Rd (B)')
+                pcie_wr_idx = header_cols.index('PCIe Wr (B)') if 'PCIe Wr (B)' in header_cols else None
+                if pcie_wr_idx is None:
+                    rdcur_idx = None
+            continue
+        if rdcur_idx is None or '---' in line:
+            continue
+
+        socket_match = PCM_PCIE_SOCKET_RE.match(line)
+        if not socket_match or int(socket_match.group(1)) != target_socket:
+            continue
+
+        if '(Total)' in line or '(Aggregate)' in line:
+            kind = 'total'
+        elif '(Miss)' in line:
+            kind = 'miss'
+        elif '(Hit)' in line:
+            kind = 'hit'
+        else:
+            continue
+
+        values = PCM_PCIE_VALUE_RE.findall(line)
+        if len(values) < max(rdcur_idx, pcie_rd_idx, pcie_wr_idx) + 1:
+            continue
+        num, unit = values[rdcur_idx]
+        rdcur = float(num) * _COUNT_SCALE[unit]
+        num, unit = values[pcie_rd_idx]
+        rd_bytes = float(num) * _BYTES_SCALE[unit]
+        num, unit = values[pcie_wr_idx]
+        wr_bytes = float(num) * _BYTES_SCALE[unit]
+        yield PcmPcieSample(target_socket, kind, rdcur, rd_bytes, wr_bytes)
+
+
+def iter_pcm_memory_samples(path, target_socket=0):
+    """Stream pcm-memory DRAM read/write bandwidth samples (MB/s) for target_socket
+
+    Handles the tabular, SKT and NODE output formats.
+    """
+    for line in iter_lines(path):
+        table_match = PCM_MEMORY_TABLE_RE.match(line)
+        if table_match:
+            if int(table_match.group(1)) == target_socket:
+                yield PcmMemorySample(target_socket, 'read', float(table_match.group(2)))
+                yield PcmMemorySample(target_socket, 'write', float(table_match.group(3)))
+            continue
+
+        for metric, pattern in (('read', PCM_MEMORY_SKT_READ_RE), ('write', PCM_MEMORY_SKT_WRITE_RE),
+                                ('read', PCM_MEMORY_NODE_READ_RE), ('write', PCM_MEMORY_NODE_WRITE_RE)):
+            found = False
+            for match in pattern.finditer(line):
+                found = True
+                if int(match.group(1)) == target_socket:
+                    yield PcmMemorySample(target_socket, metric, float(match.group(2)))
+                    break
+            if found:
+                break
+
+
+def iter_perf_samples(path):
+    """Stream perf stat -I samples (per-socket counts and MB/s metrics)"""
+    for line in iter_lines(path):
+        match_count = PERF_COUNT_RE.match(line)
+        if match_count:
+            event = match_count.group(3)
+            # Skip lines with percentage or other non-event patterns
+            if '%' not in event and not event.startswith('#'):
+                yield PerfSample(match_count.group(1), event, int(match_count.group(2).replace(',', '')))
+
+        match_bw = PERF_BW_RE.match(line)
+        if match_bw:
+            yield PerfSample(match_bw.group(1), match_bw.group(4), float(match_bw.group(3)))
+
+
+def iter_neohost_samples(path):
+    """Stream NeoHost counter / performance analysis samples"""
+    for line in iter_lines(path):
+        if '||' not in line:
+            continue
+        if 'Outbound Stalled Reads' in line:
+            match = NEOHOST_STALLED_READS_RE.search(line)
+            if match:
+                yield NeohostSample('outbound_stalled_reads', int(match.group(1).replace(',', '')))
+        elif 'PCIe Inbound Used BW' in line:
+            match = NEOHOST_INBOUND_BW_RE.search(line)
+            if match:
+                yield NeohostSample('pcie_inbound_bw', float(match.group(1).replace(',', '')))
+        elif 'PCIe Outbound Used BW' in line:
+            match = NEOHOST_OUTBOUND_BW_RE.search(line)
+            if match:
+                yield NeohostSample('pcie_outbound_bw', float(match.group(1).replace(',', '')))
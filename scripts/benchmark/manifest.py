@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Per-experiment manifests: run provenance and offline re-analysis (run_test.py analyze)
+Every experiment writes <experiment_id>.manifest.json next to its raw logs
+before launch and finalizes it after exit: the sweep point and testbed, what
+parse_dpdk_results() needs but the logs do not hold (NIC sockets, DDIO state,
+devargs), record fields only known live (lcore placement, warm-up) and the
+run's provenance - command lines, profilers, durations, git commits of the
+sources, binary build IDs and each node's kernel, CPU frequency governor and
+hugepage state. Experiments are discovered by their raw log files, so a
+results directory can be re-parsed without the testbed
+
+Remote host state is read by running this file there: `manifest.py host`
+"""
+
+import functools
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from ledger import config_key
+
+MANIFEST_SUFFIX = '.manifest.json'
+RAW_LOG_SUFFIXES = ('.pktgen', '.l3fwd', '.pcm-pcie', '.l3fwd-pcm-pcie', '.pcm-memory', '.l3fwd-pcm-memory',
+                    '.neohost', '.perf')
+EXPERIMENT_ID_PATTERN = re.compile(r'\d{8}-\d{6}\.\d{6}')  # new_experiment_id(): %Y%m%d-%H%M%S.%f
+
+
+def manifest_path(data_path, experiment_id):
+    return f'{data_path}/{experiment_id}{MANIFEST_SUFFIX}'
+
+
+def write_manifest(data_path, experiment_id, manifest):
+    """Write (replace) an experiment's manifest atomically"""
+    path = manifest_path(data_path, experiment_id)
+    with open(f'{path}.tmp', 'w') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True, default=str)
+    os.replace(f'{path}.tmp', path)
+    return path
+
+
+def read_manifest(data_path, experiment_id):
+    """An experiment's manifest dict (None if missing or unreadable)"""
+    try:
+        with open(manifest_path(data_path, experiment_id), 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _merge(target, fields):
+    for key, value in fields.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def update_manifest(data_path, experiment_id, **fields):
+    """Merge fields into an existing manifest (nested dicts merged key by key); no-op without one"""
+    manifest = read_manifest(data_path, experiment_id)
+    if manifest is None:
+        return None
+    _merge(manifest, fields)
+    return write_manifest(data_path, experiment_id, manifest)
+
+
+def finalize_manifest(data_path, experiment_id, status, **fields):
+    """Mark an experiment's manifest finished ('done'/'failed') with fields merged in"""
+    return update_manifest(data_path, experiment_id, status=status,
+                           finished=time.strftime('%Y-%m-%dT%H:%M:%S'), **fields)
+
+
+@functools.lru_cache(maxsize=None)
+def source_version(path):
+    """{'commit', 'dirty'} of the git checkout at path (commit None if it is not one)"""
+    try:
+        commit = subprocess.run(['git', '-C', path, 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                check=False).stdout.strip()
+        status = subprocess.run(['git', '-C', path, 'status', '--porcelain', '--untracked-files=no'],
+                                capture_output=True, text=True, check=False).stdout.strip()
+    except OSError:
+        return {'commit': None, 'dirty': None}
+    return {'commit': commit or None, 'dirty': bool(status) if commit else None}
+
+
+def _read(path):
+    try:
+        with open(path, 'r') as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def host_state(sys_root='/sys', proc_root='/proc'):
+    """Kernel, CPU model, frequency governors and hugepage state of this host"""
+    cpu_model = re.search(r'^model name\s*:\s*(.+)$', _read(f'{proc_root}/cpuinfo') or '', re.MULTILINE)
+    meminfo = dict(re.findall(r'^(Huge\w+):\s+(\d+)', _read(f'{proc_root}/meminfo') or '', re.MULTILINE))
+    governors = set()
+    for cpu in os.listdir(f'{sys_root}/devices/system/cpu') if os.path.isdir(f'{sys_root}/devices/system/cpu') else []:
+        if re.fullmatch(r'cpu\d+', cpu):
+            governors.add(_read(f'{sys_root}/devices/system/cpu/{cpu}/cpufreq/scaling_governor'))
+    return {
+        'hostname': os.uname().nodename,
+        'kernel': os.uname().release,
+        'cmdline': _read(f'{proc_root}/cmdline'),
+        'cpu_model': cpu_model.group(1) if cpu_model else None,
+        'governors': sorted(governor for governor in governors if governor),
+        'hugepage_size_kb': int(meminfo['Hugepagesize']) if 'Hugepagesize' in meminfo else None,
+        'hugepages_total': int(meminfo['HugePages_Total']) if 'HugePages_Total' in meminfo else None,
+        'hugepages_free': int(meminfo['HugePages_Free']) if 'HugePages_Free' in meminfo else None,
+    }
+
+
+def collect_host_state(node=None, ssh_opts=('-o', 'BatchMode=yes'), timeout=20):
+    """host_state() locally (node=None) or on node over ssh; {'error': message} if unavailable"""
+    if node is None:
+        return host_state()
+    cmd = ['ssh', *ssh_opts, node, f'python3 {os.path.abspath(__file__)} host']
+    try:
+        output = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False).stdout
+        return json.loads(output)
+    except (OSError, subprocess.TimeoutExpired, ValueError) as e:
+        return {'error': f'{node}: {e}'}
+
+
+# Host state that changes between runs without the machine having changed
+_VOLATILE_HOST_KEYS = ('hostname', 'hugepages_free', 'error')
+
+
+def provenance_keys(manifest):
+    """{'code_key', 'host_key'}: short hashes of a manifest's sources/builds and node state (None without one)
+
+    Records carry them so that results differing in throughput can be told
+    apart by code (commits, build IDs) and machine drift (kernel, governor, ...).
+    """
+    if not manifest or 'sources' not in manifest:
+        return {'code_key': None, 'host_key': None}
+    hosts = {role: {key: value for key, value in state.items() if key not in _VOLATILE_HOST_KEYS}
+             for role, state in manifest.get('hosts', {}).items()}
+    return {
+        'code_key': config_key({'sources': manifest['sources'], 'builds': manifest.get('builds')}),
+        'host_key': config_key(hosts),
+    }
+
+
+def discover_experiments(data_path):
+    """Sorted experiment IDs with at least one raw log file in data_path"""
+    experiment_ids = set()
+    for name in os.listdir(data_path):
+        for suffix in RAW_LOG_SUFFIXES:
+            if name.endswith(suffix) and EXPERIMENT_ID_PATTERN.fullmatch(name[:-len(suffix)]):
+                experiment_ids.add(name[:-len(suffix)])
+                break
+    return sorted(experiment_ids)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 2 and sys.argv[1] == 'host':
+        print(json.dumps(host_state()))
+    else:
+        print(f'Usage: {sys.argv[0]} host')
+        sys.exit(1)
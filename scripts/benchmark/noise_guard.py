@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Host noise guard: pre-flight and in-flight checks of a node's polling lcores
+Before a run, checks the CPU frequency governor and turbo state, deep
+C-states, IRQs and isolcpus/nohz_full on the polling lcores and whether other
+tasks keep them busy; during the run a watcher samples their frequency,
+governor, turbo state and foreign runnable tasks once per interval. assess()
+turns both into issues: misconfiguration (a static setup off the limits, e.g.
+the wrong governor - every run is affected until it is fixed), drift (a
+condition that changed or may clear, e.g. a governor reset or a neighbour job,
+so a rerun can help) and warnings (a noisy but stable setup, e.g. no isolcpus)
+
+Remote nodes are checked by running this file there: `noise_guard.py
+preflight <cpus>`, `noise_guard.py watch <cpus> <duration> <interval>`
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from topology import format_cpu_list, parse_cpu_list
+
+# Threads expected on polling lcores: DPDK apps and their EAL/service threads, profilers, idle
+DEFAULT_ALLOWED_TASKS = r'^(dpdk-|pktgen|lcore-|rte[-_]|eal-|telemetry|pcm|perf|swapper)'
+
+PF_KTHREAD = 0x00200000  # Task flag (stat field 9) of kernel threads
+
+
+def _read(path, default=None):
+    try:
+        with open(path, 'r') as file:
+            return file.read().strip()
+    except OSError:
+        return default
+
+
+def _cpu_dir(cpu, sys_root):
+    return f'{sys_root}/devices/system/cpu/cpu{cpu}'
+
+
+def turbo_enabled(sys_root='/sys'):
+    """Turbo/boost state (None if the driver exposes none)"""
+    no_turbo = _read(f'{sys_root}/devices/system/cpu/intel_pstate/no_turbo')
+    if no_turbo is not None:
+        return no_turbo == '0'
+    boost = _read(f'{sys_root}/devices/system/cpu/cpufreq/boost')
+    return None if boost is None else boost == '1'
+
+
+def _cpu_times(proc_root):
+    """{cpu: (busy, total)} jiffies from /proc/stat"""
+    times = {}
+    for line in (_read(f'{proc_root}/stat') or '').splitlines():
+        match = re.match(r'cpu(\d+)\s+(.*)', line)
+        if match:
+            values = [int(value) for value in match.group(2).split()]
+            idle = values[3] + (values[4] if len(values) > 4 else 0)
+            times[int(match.group(1))] = (sum(values[:8]) - idle, sum(values[:8]))
+    return times
+
+
+def foreign_tasks(cpus, allowed=DEFAULT_ALLOWED_TASKS, proc_root='/proc'):
+    """Runnable user tasks last run on one of cpus whose name does not match allowed: ['comm/pid@cpu']
+
+    Kernel threads (per-CPU kworkers, ksoftirqd, ...) are left out: they run on
+    every CPU and are covered by the IRQ and isolation checks.
+    """
+    pattern = re.compile(allowed)
+    cpus = set(cpus)
+    found = []
+    for pid in os.listdir(proc_root):
+        if not pid.isdigit() or int(pid) == os.getpid():
+            continue
+        try:
+            tids = os.listdir(f'{proc_root}/{pid}/task')
+        except OSError:
+            continue
+        for tid in tids:
+            stat = _read(f'{proc_root}/{pid}/task/{tid}/stat')
+            if not stat or ')' not in stat:
+                continue
+            comm = stat[stat.index('(') + 1:stat.rindex(')')]
+            fields = stat[stat.rindex(')') + 2:].split()
+            # fields[0] = state, fields[6] = flags, fields[36] = CPU last run on (stat fields 3, 9 and 39)
+            if len(fields) <= 36 or int(fields[6]) & PF_KTHREAD:
+                continue
+            if fields[0] == 'R' and int(fields[36]) in cpus and not pattern.match(comm):
+                found.append(f'{comm}/{tid}@{fields[36]}')
+    return found
+
+
+def preflight(cpus, busy_window=1.0, allowed=DEFAULT_ALLOWED_TASKS, sys_root='/sys', proc_root='/proc'):
+    """Pre-flight state of the polling lcores cpus (list of CPU ids)
+
+    Returns {'cpus', 'governors', 'turbo', 'deep_cstates' {cpu: [(name, latency)]},
+    'irqs' (IRQs whose effective affinity includes a polling lcore), 'isolated',
+    'nohz_full' (polling lcores in either list), 'busy_pct' {cpu: %} over
+    busy_window seconds and 'foreign' tasks on them}.
+    """
+    deep_cstates = {}
+    for cpu in cpus:
+        states = []
+        cpuidle = f'{_cpu_dir(cpu, sys_root)}/cpuidle'
+        for state in sorted(os.listdir(cpuidle)) if os.path.isdir(cpuidle) else []:
+            if _read(f'{cpuidle}/{state}/disable', '1') == '0':
+                states.append((_read(f'{cpuidle}/{state}/name', state), int(_read(f'{cpuidle}/{state}/latency', '0'))))
+        deep_cstates[cpu] = states
+
+    irqs = []
+    for irq in os.listdir(f'{proc_root}/irq') if os.path.isdir(f'{proc_root}/irq') else []:
+        if not irq.isdigit():
+            continue
+        affinity = _read(f'{proc_root}/irq/{irq}/effective_affinity_list') or \
+            _read(f'{proc_root}/irq/{irq}/smp_affinity_list') or ''
+        try:
+            if set(parse_cpu_list(affinity)) & set(cpus):
+                irqs.append(int(irq))
+        except ValueError:
+            pass
+
+    before = _cpu_times(proc_root)
+    time.sleep(busy_window)
+    after = _cpu_times(proc_root)
+    busy_pct = {}
+    for cpu in cpus:
+        if cpu in before and cpu in after and after[cpu][1] > before[cpu][1]:
+            busy_pct[cpu] = round((after[cpu][0] - before[cpu][0]) / (after[cpu][1] - before[cpu][1]) * 100, 1)
+
+    isolated = set(parse_cpu_list(_read(f'{sys_root}/devices/system/cpu/isolated', '')))
+    nohz_full = set(parse_cpu_list(_read(f'{sys_root}/devices/system/cpu/nohz_full', '')))
+    return {
+        'cpus': list(cpus),
+        'governors': {cpu: _read(f'{_cpu_dir(cpu, sys_root)}/cpufreq/scaling_governor', '-') for cpu in cpus},
+        'turbo': turbo_enabled(sys_root),
+        'deep_cstates': deep_cstates,
+        'irqs': sorted(irqs),
+        'isolated': sorted(isolated & set(cpus)),
+        'nohz_full': sorted(nohz_full & set(cpus)),
+        'busy_pct': busy_pct,
+        'foreign': foreign_tasks(cpus, allowed, proc_root),
+    }
+
+
+def sample(cpus, allowed=DEFAULT_ALLOWED_TASKS, sys_root='/sys', proc_root='/proc'):
+    """One in-flight sample: {'time', 'freq_mhz' {cpu: MHz}, 'governors', 'turbo', 'foreign'}"""
+    freq = {}
+    for cpu in cpus:
+        khz = _read(f'{_cpu_dir(cpu, sys_root)}/cpufreq/scaling_cur_freq')
+        if khz and khz.isdigit():
+            freq[cpu] = int(khz) // 1000
+    return {
+        'time': round(time.time(), 1),
+        'freq_mhz': freq,
+        'governors': sorted({_read(f'{_cpu_dir(cpu, sys_root)}/cpufreq/scaling_governor') or '-' for cpu in cpus}),
+        'turbo': turbo_enabled(sys_root),
+        'foreign': foreign_tasks(cpus, allowed, proc_root),
+    }
+
+
+def watch(cpus, duration, interval=1.0, allowed=DEFAULT_ALLOWED_TASKS):
+    """Print a JSON line per sample for duration seconds (run as a supervised task)"""
+    end = time.time() + duration
+    while time.time() < end:
+        print(json.dumps(sample(cpus, allowed)), flush=True)
+        time.sleep(interval)
+
+
+def watch_cmd(cpus, duration, interval=1.0):
+    """Shell command running watch() on a node (this file at the same path there)"""
+    return f'python3 {os.path.abspath(__file__)} watch {format_cpu_list(cpus)} {duration} {interval}'
+
+
+def load_watch_samples(path):
+    """Samples of a watch() log (lines that are not JSON objects are skipped)"""
+    samples = []
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as file:
+            for line in file:
+                try:
+                    value = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(value, dict) and 'freq_mhz' in value:
+                    samples.append(value)
+    except OSError:
+        pass
+    return samples
+
+
+def collect_preflight(cpus, node=None, ssh_opts=('-o', 'BatchMode=yes'), timeout=30):
+    """preflight() locally (node=None) or on node over ssh; {'error': message} if unavailable"""
+    if node is None:
+        return preflight(cpus)
+    cmd = ['ssh', *ssh_opts, node, f'python3 {os.path.abspath(__file__)} preflight {format_cpu_list(cpus)}']
+    try:
+        output = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False).stdout
+        state = json.loads(output)
+    except (OSError, subprocess.TimeoutExpired, ValueError) as e:
+        return {'error': f'{node}: {e}'}
+    # JSON object keys are strings
+    for key in ('governors', 'deep_cstates', 'busy_pct'):
+        state[key] = {int(cpu): value for cpu, value in state.get(key, {}).items()}
+    return state
+
+
+def assess(state, samples, limits):
+    """(misconfig, drift, warnings): lists of issue strings for a node's preflight() state and watch samples
+
+    limits: {'governor', 'turbo', 'max_cstate_latency', 'max_busy_pct',
+    'max_freq_drop', 'require_isolation'} (test_config.NOISE_LIMITS)
+    """
+    misconfig, drift, warnings = [], [], []
+    if not state or 'error' in state:
+        warnings.append(f'pre-flight unavailable ({(state or {}).get("error", "not run")})')
+        state = {}
+
+    governors = set(state.get('governors', {}).values()) - {'-'}  # '-': no cpufreq driver
+    if limits['governor'] and governors and governors != {limits['governor']}:
+        misconfig.append(f'governor {"/".join(sorted(governors))} (expected {limits["governor"]})')
+    if limits['turbo'] is not None and state.get('turbo') is not None and state['turbo'] != limits['turbo']:
+        misconfig.append(f'turbo {"on" if state["turbo"] else "off"} (expected {"on" if limits["turbo"] else "off"})')
+    busy = {cpu: pct for cpu, pct in state.get('busy_pct', {}).items() if pct > limits['max_busy_pct']}
+    if busy:
+        drift.append(f'busy before launch: {", ".join(f"cpu{cpu} {pct}%" for cpu, pct in sorted(busy.items()))}')
+    if state.get('foreign'):
+        drift.append(f'foreign tasks before launch: {" ".join(state["foreign"][:5])}')
+
+    deep = sorted({name for states in state.get('deep_cstates', {}).values()
+                   for name, latency in states if latency > limits['max_cstate_latency']})
+    if deep:
+        warnings.append(f'deep C-states enabled: {"/".join(deep)}')
+    if state.get('irqs'):
+        warnings.append(f'{len(state["irqs"])} IRQs on polling lcores')
+    cpus = state.get('cpus', [])
+    unisolated = [cpu for cpu in cpus if cpu not in state.get('isolated', []) and cpu not in state.get('nohz_full', [])]
+    if cpus and unisolated:
+        (misconfig if limits['require_isolation'] else warnings).append(
+            f'not in isolcpus/nohz_full: {format_cpu_list(unisolated)}')
+
+    if samples:
+        if governors and any(set(entry['governors']) - {'-'} != governors for entry in samples):
+            drift.append('governor changed during the run')
+        if state.get('turbo') is not None and {entry['turbo'] for entry in samples} - {state['turbo']}:
+            drift.append('turbo state changed during the run')
+        means = [sum(entry['freq_mhz'].values()) / len(entry['freq_mhz']) for entry in samples if entry['freq_mhz']]
+        if means:
+            median = sorted(means)[len(means) // 2]
+            if min(means) < median * (1 - limits['max_freq_drop']):
+                drift.append(f'frequency dip {min(means):.0f} MHz (median {median:.0f} MHz)')
+        foreign = sorted({task.split('/')[0] for entry in samples for task in entry['foreign']})
+        if foreign:
+            drift.append(f'foreign tasks during the run: {" ".join(foreign[:5])}')
+    return misconfig, drift, warnings
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == 'preflight':
+        print(json.dumps(preflight(parse_cpu_list(sys.argv[2]))))
+    elif len(sys.argv) == 5 and sys.argv[1] == 'watch':
+        watch(parse_cpu_list(sys.argv[2]), float(sys.argv[3]), float(sys.argv[4]))
+    else:
+        print(f'Usage: {sys.argv[0]} preflight <cpus> | watch <cpus> <duration> <interval>')
+        sys.exit(1)
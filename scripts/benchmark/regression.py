@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Regression detection against a stored baseline (run_test.py compare)
+Candidate and baseline result records are matched by a configuration key
+built from their sweep columns; each metric's difference is tested with
+Welch's t-test on per-run values (one per run, so each side needs repeats;
+fewer leave the metric untested) and sized by relative change and Hedges' g.
+A metric regresses when the change is significant and worse than the minimum
+change in its bad direction
+"""
+
+import math
+
+import numpy as np
+
+from ledger import config_key
+
+# Record columns identifying a sweep point (missing columns count as None)
+KEY_COLUMNS = ('stage', 'node', 'l3fwd_lcore_count', 'l3fwd_tx_desc', 'l3fwd_rx_desc', 'pktgen_lcore_count',
+               'pktgen_tx_desc', 'packet_size', 'imix', 'flows', 'ddio_enabled', 'ddio_way_mask', 'devargs')
+
+# Compared record metric -> higher is better
+COMPARE_METRICS = {
+    'tx_rate': True,
+    'ddio_rd_miss': False,
+    'ddio_wr_miss': False,
+    'dram_rd_bw': False,
+    'dram_wr_bw': False,
+}
+
+
+def point_key(record):
+    """Configuration key of a result record (same sweep point and node -> same key)"""
+    return config_key({column: record.get(column) for column in KEY_COLUMNS})
+
+
+def _betacf(a, b, x, iterations=200, eps=1e-12):
+    """Continued fraction of the incomplete beta function (Lentz's method)"""
+    qab, qap, qam = a + b, a + 1, a - 1
+    c, d = 1.0, 1 - qab * x / qap
+    d = 1 / (d if abs(d) > 1e-300 else 1e-300)
+    h = d
+    for m in range(1, iterations + 1):
+        m2 = 2 * m
+        for numerator in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                          -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+            d = 1 + numerator * d
+            d = 1 / (d if abs(d) > 1e-300 else 1e-300)
+            c = 1 + numerator / c
+            c = c if abs(c) > 1e-300 else 1e-300
+            h *= d * c
+        if abs(d * c - 1) < eps:
+            break
+    return h
+
+
+def betainc(a, b, x):
+    """Regularized incomplete beta function I_x(a, b)"""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1 - x))
+    if x < (a + 1) / (a + b + 2):
+        return front * _betacf(a, b, x) / a
+    return 1 - front * _betacf(b, a, 1 - x) / b
+
+
+def welch_test(baseline, candidate):
+    """Welch's two-sided t-test: (t, df, p); p is None with fewer than 2 values on a side"""
+    a = np.asarray(baseline, dtype=np.float64)
+    b = np.asarray(candidate, dtype=np.float64)
+    if len(a) < 2 or len(b) < 2:
+        return None, None, None
+    va, vb = a.var(ddof=1) / len(a), b.var(ddof=1) / len(b)
+    diff = b.mean() - a.mean()
+    if va + vb == 0:
+        return (0.0, None, 1.0) if diff == 0 else (math.copysign(math.inf, diff), None, 0.0)
+    t = diff / math.sqrt(va + vb)
+    df = (va + vb) ** 2 / (va ** 2 / (len(a) - 1) + vb ** 2 / (len(b) - 1))
+    return float(t), float(df), float(betainc(df / 2, 0.5, df / (df + t * t)))
+
+
+def hedges_g(baseline, candidate):
+    """Standardized mean difference (candidate - baseline), small-sample corrected; None if undefined"""
+    a = np.asarray(baseline, dtype=np.float64)
+    b = np.asarray(candidate, dtype=np.float64)
+    n = len(a) + len(b)
+    if len(a) < 2 or len(b) < 2:
+        return None
+    pooled = math.sqrt(((len(a) - 1) * a.var(ddof=1) + (len(b) - 1) * b.var(ddof=1)) / (n - 2))
+    if pooled == 0:
+        return None
+    return float((b.mean() - a.mean()) / pooled * (1 - 3 / (4 * n - 9)))
+
+
+def compare_metric(baseline, candidate, higher_is_better, alpha=0.05, min_change=0.01, min_values=2):
+    """Compare one metric's values: {'baseline', 'candidate', 'change_pct', 'g', 'p', 'n', 'verdict'}
+
+    verdict: 'regression' / 'improvement' when p < alpha and the relative
+    change exceeds min_change in the bad / good direction, 'pass' otherwise,
+    'untested' when either side has fewer than min_values (at least 2) values.
+    """
+    base_mean = float(np.mean(baseline)) if len(baseline) else None
+    cand_mean = float(np.mean(candidate)) if len(candidate) else None
+    change = None
+    if base_mean and cand_mean is not None:
+        change = (cand_mean - base_mean) / abs(base_mean)
+    p = None
+    if min(len(baseline), len(candidate)) >= max(min_values, 2):
+        _, _, p = welch_test(baseline, candidate)
+    verdict = 'untested'
+    if p is not None:
+        verdict = 'pass'
+        if p < alpha and change is not None and abs(change) > min_change:
+            verdict = 'improvement' if (change > 0) == higher_is_better else 'regression'
+    return {
+        'baseline': None if base_mean is None else round(base_mean, 3),
+        'candidate': None if cand_mean is None else round(cand_mean, 3),
+        'change_pct': None if change is None else round(change * 100, 2),
+        'g': None if hedges_g(baseline, candidate) is None else round(hedges_g(baseline, candidate), 2),
+        'p': None if p is None else float(f'{p:.3g}'),
+        'n': (len(baseline), len(candidate)),
+        'verdict': verdict,
+    }
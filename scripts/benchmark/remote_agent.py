@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Persistent remote agent for the L3FWD node
+run_test.py starts `remote_agent.py serve` once per remote node over a
+single SSH session and exchanges JSON lines over its stdin/stdout to run
+setup commands (kill_procs, ARP tables) without a new SSH session each.
+Starting and stopping DPDK apps and profilers, readiness detection and log
+streaming are not done here: async_runner.py supervises them as tasks over
+multiplexed (ControlMaster) SSH, which covers the same needs
+
+Requests:  {"id": n, "op": "ping" | "run" | "shutdown", ...}
+Replies:   {"id": n, "event": "pong" | "exit", ...}
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+
+################## AGENT (runs on the remote node) #####################
+class _Agent:
+    """Serve requests read from stdin; write replies and events to stdout"""
+
+    def __init__(self, infile, outfile):
+        self.infile = infile
+        self.outfile = outfile
+        self._out_lock = threading.Lock()
+
+    def send(self, message):
+        with self._out_lock:
+            self.outfile.write(json.dumps(message) + '\n')
+            self.outfile.flush()
+
+    def serve(self):
+        for line in self.infile:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                continue
+            op = request.get('op')
+            if op == 'ping':
+                self.send({'id': request.get('id'), 'event': 'pong', 'pid': os.getpid()})
+            elif op == 'run':
+                threading.Thread(target=self._run, args=(request,), daemon=True).start()
+            elif op == 'shutdown':
+                break
+
+    def _run(self, request):
+        """Run a shell command to completion and reply with its exit code and output tail"""
+        try:
+            proc = subprocess.run(request['cmd'], shell=True, capture_output=True, text=True,
+                                  timeout=request.get('timeout'), check=False)
+            code, output = proc.returncode, (proc.stdout + proc.stderr)[-4096:]
+        except subprocess.TimeoutExpired:
+            code, output = None, 'timeout'
+        self.send({'id': request.get('id'), 'event': 'exit', 'code': code, 'output': output})
+
+
+################## CLIENT (runs in run_test.py) #####################
+class RemoteAgent:
+    """Client for one node's agent over a single persistent SSH connection"""
+
+    def __init__(self, node, agent_path, python='python3'):
+        self.node = node
+        self.agent_path = agent_path
+        self.python = python
+        self._proc = None
+        self._next_id = 0
+        self._replies = {}
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._send_lock = threading.Lock()
+
+    def start(self, timeout=15):
+        """Launch the agent and wait for it to answer a ping"""
+        agent_cmd = ['ssh', '-o', 'BatchMode=yes', self.node, f'{self.python} -u {self.agent_path} serve']
+        self._proc = subprocess.Popen(agent_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      text=True, bufsize=1)
+        threading.Thread(target=self._read, name=f'agent-{self.node}', daemon=True).start()
+        reply = self.request('ping', reply_timeout=timeout)
+        if reply is None:
+            self.close()
+            raise RuntimeError(f'Remote agent on {self.node} did not respond')
+        return self
+
+    @property
+    def alive(self):
+        return self._proc is not None and self._proc.poll() is None
+
+    def request(self, op, reply_timeout=None, **fields):
+        """Send a request and wait up to reply_timeout for its reply (None on timeout or lost connection)"""
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+        message = json.dumps(dict(fields, id=request_id, op=op))
+        with self._send_lock:
+            try:
+                self._proc.stdin.write(message + '\n')
+                self._proc.stdin.flush()
+            except (OSError, ValueError):
+                return None
+        deadline = None if reply_timeout is None else time.time() + reply_timeout
+        with self._cond:
+            while request_id not in self._replies:
+                remaining = None if deadline is None else deadline - time.time()
+                if (remaining is not None and remaining <= 0) or not self.alive:
+                    return None
+                self._cond.wait(remaining if remaining is not None else 1.0)
+            return self._replies.pop(request_id)
+
+    def run(self, cmd, timeout=None):
+        """Run a command on the node; returns its exit code (None on timeout)"""
+        reply = self.request('run', reply_timeout=None if timeout is None else timeout + 5, cmd=cmd, timeout=timeout)
+        return reply.get('code') if reply else None
+
+    def close(self):
+        """Ask the agent to exit"""
+        if self.alive:
+            with self._send_lock:
+                try:
+                    self._proc.stdin.write(json.dumps({'op': 'shutdown'}) + '\n')
+                    self._proc.stdin.close()
+                except (OSError, ValueError):
+                    pass
+            try:
+                self._proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
+    def _read(self):
+        for line in self._proc.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            with self._cond:
+                if message.get('id') is not None:
+                    self._replies[message['id']] = message
+                self._cond.notify_all()
+        with self._cond:
+            self._cond.notify_all()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        _Agent(sys.stdin, sys.stdout).serve()
+    else:
+        print(f'Usage: {sys.argv[0]} serve')
+        sys.exit(1)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Repeat-and-aggregate support for sweeps (run_test.py repeat mode)
+Orders repeated runs of sweep points - sequentially, in interleaved rounds or
+randomized, so slow host drift spreads over all points instead of biasing
+one - and aggregates a point's repeats into the mean and Student-t confidence
+interval of each metric; run_test.py adds repeats to a point until its CI is
+narrow enough or its budget is spent
+"""
+
+import math
+
+import numpy as np
+
+from regression import betainc
+
+REPEAT_ORDERS = ('sequential', 'interleaved', 'randomized')
+
+
+def t_cdf(t, df):
+    """Student-t cumulative distribution function"""
+    tail = 0.5 * betainc(df / 2, 0.5, df / (df + t * t))
+    return 1 - tail if t > 0 else tail
+
+
+def t_quantile(p, df, iterations=100):
+    """Student-t quantile for p in (0.5, 1) by bisection"""
+    low, high = 0.0, 1e3
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        if t_cdf(mid, df) < p:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+def mean_ci(values, confidence=0.95):
+    """(mean, CI half-width) of values; half-width None with fewer than 2 values, mean None without any"""
+    values = np.asarray([value for value in values if value is not None], dtype=np.float64)
+    if not len(values):
+        return None, None
+    mean = float(values.mean())
+    if len(values) < 2:
+        return mean, None
+    sem = float(values.std(ddof=1)) / math.sqrt(len(values))
+    return mean, t_quantile((1 + confidence) / 2, len(values) - 1) * sem
+
+
+def relative_ci_width(values, confidence=0.95):
+    """Full CI width relative to the mean (None if undefined)"""
+    mean, half_width = mean_ci(values, confidence)
+    if half_width is None or not mean:
+        return None
+    return 2 * half_width / abs(mean)
+
+
+def repeat_point(point, repeat):
+    """Sweep point of one repeat (repeat 0 is the plain point, so single-shot results count as the first repeat)"""
+    return dict(point, repeat=repeat) if repeat else dict(point)
+
+
+def base_point(point):
+    """Sweep point without its repeat index"""
+    return {key: value for key, value in point.items() if key != 'repeat'}
+
+
+def order_runs(pending, order, rng):
+    """Run order for pending [(point, [repeat indices])] -> [repeat_point()]
+
+    sequential: each point's repeats back to back; interleaved: round-robin,
+    one repeat of every point per round; randomized: shuffled with rng
+    (random.Random).
+    """
+    if order not in REPEAT_ORDERS:
+        raise ValueError(f'unknown repeat order {order!r} (expected one of {", ".join(REPEAT_ORDERS)})')
+    if order == 'sequential':
+        return [repeat_point(point, repeat) for point, repeats in pending for repeat in repeats]
+    runs = []
+    for round_index in range(max((len(repeats) for _, repeats in pending), default=0)):
+        runs.extend(repeat_point(point, repeats[round_index]) for point, repeats in pending
+                    if round_index < len(repeats))
+    if order == 'randomized':
+        rng.shuffle(runs)
+    return runs
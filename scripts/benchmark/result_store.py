@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Columnar result store for DPDK benchmark results
+Each campaign (one run_test.py invocation) appends one NumPy .npz file under
+RESULT_STORE_PATH holding typed columns of raw values; units and per-column
+min/max live in the file's JSON metadata so query() can skip whole files
+(predicate pushdown) and load only the columns it needs
+"""
+
+import glob
+import json
+import operator
+import os
+
+import numpy as np
+
+# Units for raw result columns (columns not listed are unitless keys/labels)
+COLUMN_UNITS = {
+    'tx_rate': 'Mpps',
+    'rx_rate': 'Mpps',
+    'ddio_rd_miss': '%',
+    'pcie_rd_total': 'B per sample (1 s)',
+    'pcie_rd_miss': 'B per sample (1 s)',
+    'ddio_wr_miss': '%',
+    'pcie_wr_total': 'B per sample (1 s)',
+    'pcie_wr_miss': 'B per sample (1 s)',
+    'dram_rd_bw': 'MB/s',
+    'dram_wr_bw': 'MB/s',
+    'ndr_rate_pct': '% of line rate',
+    'max_cv': 'ratio',
+    'warmup_sec': 's',
+    'latency_min_us': 'us',
+    'latency_p50_us': 'us',
+    'latency_p99_us': 'us',
+    'latency_p999_us': 'us',
+    'latency_max_us': 'us',
+    'packet_size': 'B (mean frame size)',
+    'l3_hit': '%',
+    'mpps_per_core': 'Mpps',
+    'parallel_efficiency': 'ratio',
+    'marginal_efficiency': 'ratio',
+    'l2_gbps': 'Gbps',
+    'l1_gbps': 'Gbps',
+    'line_rate_pct': '% of line rate',
+    'pcie_rd_bpp': 'B/pkt',
+    'pcie_wr_bpp': 'B/pkt',
+    'dram_rd_bpp': 'B/pkt',
+    'dram_wr_bpp': 'B/pkt',
+}
+
+# Per-sample summary columns (<column>_<suffix>, see sample_stats.summary_columns)
+_SUMMARY_SUFFIXES = ('_p50', '_p99', '_min', '_max', '_std')
+
+_META_KEY = '__meta__'
+
+_OPS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+def _to_column(values):
+    """Convert a list of python values to a typed NumPy column (None -> NaN / '')"""
+    present = [v for v in values if v is not None]
+    if not present:
+        return np.full(len(values), np.nan, dtype=np.float64)
+    if all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in present):
+        if len(present) == len(values):
+            return np.array(values, dtype=np.int64)
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    if all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in present):
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return np.array(['' if v is None else str(v) for v in values], dtype=np.str_)
+
+
+def _column_unit(name):
+    """Unit of a raw or per-sample summary column (None if unitless)"""
+    if name in COLUMN_UNITS:
+        return COLUMN_UNITS[name]
+    if name.endswith('_cv'):
+        return 'ratio'
+    for suffix in _SUMMARY_SUFFIXES:
+        if name.endswith(suffix):
+            return COLUMN_UNITS.get(name[:-len(suffix)])
+    return None
+
+
+def _column_stats(column):
+    """Min/max used for predicate pushdown (strings: sorted distinct values, capped)"""
+    if column.dtype.kind in 'if':
+        finite = column[~np.isnan(column)] if column.dtype.kind == 'f' else column
+        if not len(finite):
+            return None
+        return {'min': finite.min().item(), 'max': finite.max().item()}
+    distinct = sorted(set(column.tolist()))
+    if len(distinct) > 64:
+        return {'min': distinct[0], 'max': distinct[-1]}
+    return {'min': distinct[0], 'max': distinct[-1], 'values': distinct} if distinct else None
+
+
+def append_records(store_path, campaign_id, records, metadata=None):
+    """Append records (list of dicts with raw values) as a new campaign file
+
+    Never overwrites: an existing campaign file gets a numeric suffix.
+    Returns the written file path.
+    """
+    if not records:
+        return None
+    os.makedirs(store_path, exist_ok=True)
+
+    names = []
+    for record in records:
+        for name in record:
+            if name not in names:
+                names.append(name)
+    columns = {name: _to_column([record.get(name) for record in records]) for name in names}
+
+    meta = dict(metadata or {})
+    meta.update({
+        'campaign_id': campaign_id,
+        'rows': len(records),
+        'units': {name: _column_unit(name) for name in names if _column_unit(name)},
+        'stats': {name: _column_stats(column) for name, column in columns.items()},
+    })
+
+    path = f'{store_path}/{campaign_id}.npz'
+    suffix = 1
+    while os.path.exists(path):
+        path = f'{store_path}/{campaign_id}.{suffix}.npz'
+        suffix += 1
+    np.savez(path, **columns, **{_META_KEY: np.array(json.dumps(meta))})
+    return path
+
+
+def read_metadata(path):
+    """Read a campaign file's metadata without loading its columns"""
+    with np.load(path) as data:
+        return json.loads(data[_META_KEY].item())
+
+
+def _campaign_files(store_path):
+    """Campaign file paths in append order: <campaign_id>.npz, then its .1.npz, .2.npz, ... suffixes"""
+    def key(path):
+        name = os.path.basename(path)[:-len('.npz')]
+        campaign_id, dot, suffix = name.rpartition('.')
+        return (campaign_id, int(suffix)) if dot and suffix.isdigit() else (name, 0)
+    return sorted(glob.glob(f'{store_path}/*.npz'), key=key)
+
+
+def _may_match(stats, op, value):
+    """Whether a file whose column has stats could contain rows matching (op, value)"""
+    if stats is None:
+        return False
+    # A string column never equals or orders against a number (nor a numeric one against a string)
+    if isinstance(stats['min'], str) != isinstance(value, str):
+        return op == '!='
+    if 'values' in stats:
+        return any(_OPS[op](v, value) for v in stats['values'])
+    if op == '==':
+        return stats['min'] <= value <= stats['max']
+    if op in ('<', '<='):
+        return _OPS[op](stats['min'], value)
+    if op in ('>', '>='):
+        return _OPS[op](stats['max'], value)
+    return True
+
+
+def query(store_path, columns=None, where=None):
+    """Load matching rows from every campaign file as a dict of NumPy columns
+
+    columns: column names to return (default: all)
+    where: list of (column, op, value) predicates ANDed together, op in ==, !=, <, <=, >, >=
+    Files whose metadata rules out a match are skipped without loading any
+    column; only requested and predicate columns are read from the rest.
+    Columns absent from a campaign are filled with NaN / ''.
+    """
+    where = where or []
+    parts = []
+    for path in _campaign_files(store_path):
+        meta = read_metadata(path)
+        stats = meta['stats']
+        if any(col not in stats or not _may_match(stats[col], op, value) for col, op, value in where):
+            continue
+
+        with np.load(path) as data:
+            names = columns or [name for name in data.files if name != _META_KEY]
+            mask = np.ones(meta['rows'], dtype=bool)
+            for col, op, value in where:
+                mask &= _OPS[op](data[col], value)
+            if not mask.any():
+                continue
+            parts.append((int(mask.sum()), {name: data[name][mask] if name in data.files else None for name in names}))
+
+    if not parts:
+        return {}
+
+    names = []
+    for _, part in parts:
+        for name in part:
+            if name not in names:
+                names.append(name)
+    result = {}
+    for name in names:
+        pieces = [part.get(name) for _, part in parts]
+        # A string column in any campaign makes it a string column: missing and NaN values become ''
+        strings = any(piece is not None and piece.dtype.kind == 'U' for piece in pieces)
+        filled = []
+        for (rows, _), piece in zip(parts, pieces):
+            if piece is None:
+                piece = np.full(rows, '' if strings else np.nan, dtype=np.str_ if strings else np.float64)
+            elif strings and piece.dtype.kind == 'f':
+                piece = np.where(np.isnan(piece), '', piece.astype(np.str_))
+            elif strings and piece.dtype.kind != 'U':
+                piece = piece.astype(np.str_)
+            filled.append(piece)
+        result[name] = np.concatenate(filled)
+    return result
+
+
+def list_campaigns(store_path):
+    """[(campaign_id, path)] of every campaign file, oldest first"""
+    paths = _campaign_files(store_path)
+    return [(read_metadata(path)['campaign_id'], path) for path in paths]
+
+
+def load_records(path):
+    """A campaign file's rows as record dicts (NaN / '' -> None)"""
+    with np.load(path) as data:
+        names = [name for name in data.files if name != _META_KEY]
+        columns = {name: data[name].tolist() for name in names}
+    rows = len(next(iter(columns.values()))) if columns else 0
+    return [{name: None if value == '' or (isinstance(value, float) and value != value) else value
+             for name, value in ((name, columns[name][row]) for name in names)}
+            for row in range(rows)]
@@ -1,71 +1,60 @@
 #!/usr/bin/env python3
 """
 DPDK Benchmark Test Runner
-Runs l3fwd and pktgen on configured cluster nodes, saves results to files with pyrem
+Runs l3fwd, pktgen and profilers on configured cluster nodes as supervised asyncio tasks (async_runner.py)
 Node configuration is defined in test_config.py CLUSTER CONFIG section
 """
 
-import argparse
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import io
 import os
 import time
 import math
-import operator
 import re
-import pyrem.host
-import pyrem.task
-from pyrem.host import RemoteHost
-import pyrem
 import sys
-import glob
-
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as tick
-from math import factorial, exp
-from datetime import datetime
-import signal
+import itertools
+import queue
+import random
+import threading
 import atexit
-from os.path import exists
 
 import subprocess
-from cycler import cycler
 
 import datetime
-import pty
 
 
 from test_config import *
+from topology import format_cpu_list, parse_cpu_list
+from async_runner import Supervisor, wait_for_file
+from telemetry import TelemetryCollector, l3fwd_telemetry_cmd, pktgen_traffic_seconds, steady_state_rates
+from log_parsers import iter_pcm_pcie_samples, iter_pcm_memory_samples
+from line_rate import efficiency_columns
+from ddio import check_dram_writes, ddio_control
+from noise_guard import assess, collect_preflight, load_watch_samples, watch_cmd
+from ledger import RunLedger, build_id, config_key, STATUS_DONE, STATUS_FAILED
+from manifest import (collect_host_state, discover_experiments, finalize_manifest, provenance_keys, read_manifest,
+                      source_version, update_manifest, write_manifest)
+from remote_agent import RemoteAgent
 
 final_result = []  # List of structured result dicts
-experiment_id = ''
-
-def fmt_count(n):
-    """Format count: <1K as-is, ≥1K as K, ≥1M as M"""
-    if n >= 1_000_000:
-        return f"{n/1_000_000:.1f}M"
-    elif n >= 1_000:
-        return f"{n/1_000:.1f}K"
-    return str(int(n))
-
-def fmt_small_value(value, unit='M'):
-    """Format small values with enough decimals to show first non-zero digit.
-    For values >= 0.1, show 1 decimal. For smaller values, show up to first non-zero digit (rounded)."""
-    if value == 0:
-        return f"0{unit}"
-    if value >= 0.1:
-        return f"{value:.1f}{unit}"
-    # Find first non-zero decimal place: e.g., 0.03 -> 2, 0.001 -> 3, 0.0004 -> 4
-    decimals = -int(math.floor(math.log10(value)))
-    decimals = min(decimals, 6)  # Cap at 6 decimal places
-    return f"{value:.{decimals}f}{unit}"
-
-def fmt_bw(value, unit='MB/s'):
-    """Format bandwidth with unit, auto-convert to GB if ≥1000MB"""
-    if unit == 'MB/s' and value >= 1000:
-        return f"{value/1000:.2f}GB/s"
-    elif unit == 'Gb/s' and value >= 1000:
-        return f"{value/1000:.2f}Tb/s"
-    return f"{value:.2f}{unit}"
+ndr_result = []  # List of NDR search result dicts (run_ndr)
+campaign_id = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')  # Result store file for this invocation
+final_result_lock = threading.Lock()  # final_result is appended from per-testbed workers
+noise_misconfig_reported = set()  # (node, issue) of static host misconfiguration already warned about
+_experiment_id_lock = threading.Lock()
+_ddio_original = {}  # (node, pci) -> DDIO state before the sweep first changed it (restored on exit)
+_ddio_lock = threading.Lock()
+LATENCY_PERCENTILES = ('p50', 'p99', 'p99.9', 'max')  # Latency columns in the results table
+PARSER_VERSION = 4  # Bump when parse_dpdk_results() output changes: cached ledger results get re-parsed
+LIVE_RECORD_FIELDS = ('repeat', 'warmup_sec', 'no_traffic', 'socket', 'numa_local', 'smt_shared', 'stage', 'bottleneck',
+                      'noise_drift', 'noise_issues', 'noise_retries')  # Not in the logs
+_last_experiment_id = ''
+_agents = {}  # node -> RemoteAgent (False if unreachable), one persistent connection per node
+_agents_lock = threading.Lock()
+_host_states = {}  # node (None: this host) -> collect_host_state(), read once per process
 
 def fmt_bytes(value):
     """Format bytes with K/M/G suffix for readability"""
@@ -77,45 +66,168 @@ def fmt_bytes(value):
         return f"{value/1_000:.1f}K"
     return str(int(value))
 
-def kill_procs():
-    """Kill DPDK processes (pktgen locally, l3fwd remotely if configured)"""
+def dpdk_process_pattern(config):
+    """pkill/pgrep -f pattern of a DPDK app of config (get_*_config()) on its NIC
+
+    Matches the binary itself (first word) with that NIC's -a argument only, not
+    other pairs' apps, the sudo/shell/ssh processes launching them or this pattern's shell.
+    """
+    binary = os.path.basename(config['binary_path'])
+    return f'^[^ ]*/{re.escape(binary)} .*-a {re.escape(config["pci_address"].split(",")[0])}'
+
+def wait_released_cmd(process_pattern, timeout):
+    """Shell command exiting 0 once no process matches and free hugepages stopped changing (1 on timeout)
+
+    Use a dpdk_process_pattern() so pgrep does not match this shell itself.
+    """
+    return (f'prev=; for i in $(seq {int(timeout * 5)}); do '
+            f'free=$(grep HugePages_Free /proc/meminfo); '
+            f'if ! pgrep -f "{process_pattern}" >/dev/null && [ "$free" = "$prev" ]; then exit 0; fi; '
+            f'prev=$free; sleep 0.2; done; exit 1')
+
+def new_experiment_id():
+    """Return a unique timestamp-based experiment ID (safe across testbed workers)"""
+    global _last_experiment_id
+    with _experiment_id_lock:
+        experiment_id = datetime.datetime.now().strftime('%Y%m%d-%H%M%S.%f')
+        while experiment_id == _last_experiment_id:
+            experiment_id = datetime.datetime.now().strftime('%Y%m%d-%H%M%S.%f')
+        _last_experiment_id = experiment_id
+    return experiment_id
+
+def get_agent(node):
+    """Persistent agent for a remote node over one SSH session, started on first use (None if disabled or unreachable)"""
+    if not USE_REMOTE_AGENT or not node:
+        return None
+    with _agents_lock:
+        agent = _agents.get(node)
+        if agent is False:
+            return None
+        if agent is None or not agent.alive:
+            try:
+                agent = RemoteAgent(node, f'{DPDK_BENCH_HOME}/scripts/benchmark/remote_agent.py').start()
+                print(f'Remote agent on {node} connected')
+            except (OSError, RuntimeError) as e:
+                print(f'WARNING: remote agent on {node} unavailable ({e}), falling back to ssh')
+                agent = False
+            _agents[node] = agent
+        return agent or None
+
+def close_agents():
+    """Shut down all agents"""
+    with _agents_lock:
+        for agent in _agents.values():
+            if agent:
+                agent.close()
+        _agents.clear()
+
+def run_on_node(node, cmd, quiet=True):
+    """Run a shell command on node: locally if it is this (PKTGEN_NODE) host, else via its agent (or ssh)
+
+    Returns the command's exit code (None if it could not be run to
+    completion, e.g. the agent connection was lost).
+    """
+    if node == PKTGEN_NODE:
+        return subprocess.run(cmd, shell=True, check=False).returncode
+    agent = get_agent(node)
+    if agent:
+        return agent.run(cmd)
+    ssh_cmd = ['ssh', '-o', 'BatchMode=yes', node, cmd]
+    return subprocess.run(ssh_cmd, stdout=subprocess.DEVNULL if quiet else None, check=False).returncode
+
+def kill_procs(testbed=None):
+    """Kill DPDK processes (pktgen and l3fwd) on both nodes of a testbed pair
+
+    Only a safety net before each test, for strays of crashed or foreign runs:
+    a test's own processes are stopped by its Supervisor. Returns once the processes are gone and their hugepages released on both
+    nodes (or PROCESS_RELEASE_TIMEOUT passed).
+    """
+    testbed = testbed or TESTBEDS[0]
     print('Killing processes...', end=' ', flush=True)
-    subprocess.run(['sudo', 'pkill', '-f', 'pktgen'], check=False)
-    if L3FWD_NODE:
-        l3fwd_cmd = ['sudo pkill dpdk-l3fwd']
-        l3fwd_host = pyrem.host.RemoteHost(L3FWD_NODE)
-        l3fwd_task = l3fwd_host.run(l3fwd_cmd, quiet=False)
-        pyrem.task.Parallel([l3fwd_task], aggregate=True).start(wait=True)
-    print('DONE')
+    # Only this pair's apps (by binary and NIC): other pairs may run on the same hosts
+    patterns = [(testbed['pktgen_node'], dpdk_process_pattern(get_pktgen_config(1, testbed=testbed)))]
+    if testbed['l3fwd_node']:
+        patterns.append((testbed['l3fwd_node'], dpdk_process_pattern(get_l3fwd_config(1, testbed=testbed))))
+    for node, pattern in patterns:
+        if node == PKTGEN_NODE:
+            subprocess.run(['sudo', 'pkill', '-f', pattern], check=False)
+        else:
+            run_on_node(node, f"sudo pkill -f '{pattern}'", quiet=False)
+
+    released = True
+    for node, pattern in patterns:
+        released &= run_on_node(node, wait_released_cmd(pattern, PROCESS_RELEASE_TIMEOUT)) == 0
+    print('DONE' if released else f'WARNING: processes/hugepages not released after {PROCESS_RELEASE_TIMEOUT}s')
 
 # Setup ARP tables
-def setup_arp_tables():
-    """Setup ARP tables (local for pktgen, remote for l3fwd if configured)"""
-    # Setup ARP on local pktgen node
-    print('Setting up local ARP table...')
+def setup_arp_tables(testbed=None):
+    """Setup ARP tables on both nodes of a testbed pair"""
+    testbed = testbed or TESTBEDS[0]
+    print(f'Setting up ARP tables on {testbed["name"]}...')
     arp_file = f'{DPDK_BENCH_HOME}/scripts/arp_table'
-    if os.path.exists(arp_file):
-        subprocess.run(['sudo', 'arp', '-f', arp_file], check=False)
+    if testbed['pktgen_node'] == PKTGEN_NODE:
+        if os.path.exists(arp_file):
+            subprocess.run(['sudo', 'arp', '-f', arp_file], check=False)
+    else:
+        run_on_node(testbed['pktgen_node'], f'sudo arp -f {arp_file}')
 
     # Setup ARP on remote L3FWD node if configured
-    if L3FWD_NODE and L3FWD_NODE != PKTGEN_NODE:
-        host = pyrem.host.RemoteHost(L3FWD_NODE)
-        cmd = [f'sudo arp -f {DPDK_BENCH_HOME}/scripts/arp_table']
-        task = host.run(cmd, quiet=True)
-        pyrem.task.Parallel([task], aggregate=True).start(wait=True)
+    if testbed['l3fwd_node'] and testbed['l3fwd_node'] != testbed['pktgen_node']:
+        run_on_node(testbed['l3fwd_node'], f'sudo arp -f {arp_file}')
 
-def run_l3fwd(tx_desc_value=None, rx_desc_value=None, l3fwd_config=None, duration=None):
-    """Run l3fwd on L3FWD node with profilers (pcm-pcie)"""
-    global experiment_id
-    if not l3fwd_config:
-        raise ValueError("l3fwd_config is required - use get_l3fwd_config()")
+def ddio_label(enabled, way_mask=None):
+    """'off', 'on/0x600' or '-' (unknown)"""
+    if enabled is None:
+        return '-'
+    return 'off' if not enabled else ('on' if way_mask is None else f'on/{way_mask:#x}')
 
-    config = l3fwd_config
-    host = pyrem.host.RemoteHost(config["node"])
+def apply_ddio(setting, testbed):
+    """Apply a DDIO_VALUES setting on the testbed's DDIO_NODES and read it back
 
-    # Calculate L3FWD duration (PKTGEN duration + 5 seconds buffer)
-    l3fwd_duration = (duration or PKTGEN_DURATION) + 5
+    Returns {role: state or None (unreadable)} for 'pktgen'/'l3fwd'; raises
+    RuntimeError when a setting cannot be applied or does not read back.
+    """
+    states = {}
+    for role in DDIO_NODES:
+        node, pci = testbed[f'{role}_node'], testbed[f'{role}_pci']
+        remote = None if node == PKTGEN_NODE else node
+        if setting is None:
+            state = ddio_control(pci, remote)
+        else:
+            with _ddio_lock:
+                if (node, pci) not in _ddio_original:
+                    original = ddio_control(pci, remote)
+                    if 'error' not in original:
+                        _ddio_original[(node, pci)] = original
+            enabled = setting != 'off'
+            way_mask = setting if enabled else None
+            state = ddio_control(pci, remote, enabled, way_mask)
+            if 'error' in state:
+                raise RuntimeError(f'DDIO {ddio_label(enabled, way_mask)} on {node} failed: {state["error"]}')
+            if state['enabled'] != enabled or (way_mask is not None and state['way_mask'] != way_mask):
+                raise RuntimeError(f'DDIO on {node} reads back {ddio_label(state["enabled"], state["way_mask"])}, '
+                                   f'expected {ddio_label(enabled, way_mask)}')
+        if 'error' in state:
+            print(f'WARNING: DDIO state of {node} unknown: {state["error"]}')
+            state = None
+        else:
+            print(f'DDIO on {node} ({pci}): {ddio_label(state["enabled"], state["way_mask"])}')
+        states[role] = state
+    return states
+
+def restore_ddio():
+    """Put back the DDIO state of every node the sweep changed"""
+    with _ddio_lock:
+        for (node, pci), state in _ddio_original.items():
+            restored = ddio_control(pci, None if node == PKTGEN_NODE else node, state['enabled'], state['way_mask'])
+            if 'error' in restored:
+                print(f'WARNING: could not restore DDIO on {node}: {restored["error"]}')
+            else:
+                print(f'DDIO on {node} restored: {ddio_label(restored["enabled"], restored["way_mask"])}')
+        _ddio_original.clear()
 
+def l3fwd_command(config, tx_desc_value=None, rx_desc_value=None, duration=None):
+    """L3FWD command line; its output is the task's stdout, timeout bounds it should the runner die"""
     # Build tx-queue-size and rx-queue-size arguments if specified
     tx_queue_arg = ""
     rx_queue_arg = ""
@@ -124,97 +236,76 @@ def run_l3fwd(tx_desc_value=None, rx_desc_value=None, l3fwd_config=None, duratio
     if rx_desc_value:
         rx_queue_arg = f" --rx-queue-size={rx_desc_value}"
 
-    # Build L3FWD command with timeout
-    l3fwd_cmd = (f'cd {os.path.dirname(config["binary_path"])} && '
-           f'timeout {l3fwd_duration} sudo -E {ENV} '
-           f'{config["binary_path"]} '
-           f'{config["lcores"]} '
-           f'{config["memory_channels"]} '
-           f'-a {config["pci_address"]} '
-           f'-- {config["port_mask"]} '
-           f'--config="{config["config"]}" '
-           f'--eth-dest=0,{config["eth_dest"]}'
-           f'{tx_queue_arg}'
-           f'{rx_queue_arg} '
-           f'> {DATA_PATH}/{experiment_id}.l3fwd 2>&1 & '
-           f'L3FWD_PID=$!; ')
-
-    # Add warmup delay before starting profilers
-    l3fwd_cmd += f'sleep {WARMUP_DELAY}; '
-
-    # Add PCM monitoring on L3FWD node if enabled
-    if ENABLE_PCM:
-        l3fwd_cmd += f'sleep {TOOL_INTERVAL}; '
-        l3fwd_cmd += (f'sudo timeout {PCM_DURATION} {DPDK_BENCH_HOME}/pcm/build/bin/pcm-pcie -B -e '
-                      f'> {DATA_PATH}/{experiment_id}.l3fwd-pcm-pcie 2>&1; ')
-        # Add pcm-memory monitoring for DDIO verification (DRAM bandwidth)
-        l3fwd_cmd += f'sleep {TOOL_INTERVAL}; '
-        l3fwd_cmd += (f'sudo timeout {PCM_DURATION} {DPDK_BENCH_HOME}/pcm/build/bin/pcm-memory 1 '
-                      f'> {DATA_PATH}/{experiment_id}.l3fwd-pcm-memory 2>&1; ')
-
-    # Wait for L3FWD to finish
-    l3fwd_cmd += f'wait $L3FWD_PID 2>/dev/null'
-
-    cmd = [l3fwd_cmd]
-    task = host.run(cmd, quiet=False)
-    print(f'L3FWD+PROFILERS command (duration={l3fwd_duration}s): {l3fwd_cmd[:200]}...')
-    pyrem.task.Parallel([task], aggregate=True).start(wait=False)
-    time.sleep(3)
-
-def run_pktgen(tx_desc_value=None, pktgen_config=None):
-    """Run pktgen locally and start profilers (perf/pcm/neohost) based on configuration"""
-    global experiment_id
-    if not pktgen_config:
-        raise ValueError("pktgen_config is required - use get_pktgen_config()")
-
-    config = pktgen_config
-
-    # Build list of enabled profilers
-    enabled_profilers = []
-    if ENABLE_PERF:
-        enabled_profilers.append('perf')
-    if ENABLE_PCM:
-        enabled_profilers.append('pcm')
-    if ENABLE_NEOHOST:
-        enabled_profilers.append('neohost')
-
-    profilers_str = '+'.join(enabled_profilers) if enabled_profilers else 'none'
-    print(f'Running pktgen with profilers: {profilers_str}')
+    return (f'cd {os.path.dirname(config["binary_path"])} && '
+            f'timeout {duration} sudo -E {ENV} '
+            f'{config["binary_path"]} '
+            f'{config["lcores"]} '
+            f'{config["memory_channels"]} '
+            f'-a {config["pci_address"]} '
+            f'--file-prefix={config["file_prefix"]} '
+            f'-- {config["port_mask"]} '
+            f'--config="{config["config"]}" '
+            f'--eth-dest=0,{config["eth_dest"]}'
+            f'{tx_queue_arg}'
+            f'{rx_queue_arg}')
+
+def pktgen_command(experiment_id, config, tx_desc_value=None, duration=None, rate=100, with_profilers=True,
+                   traffic=None, latency=False):
+    """Pktgen command line running simple-test.lua; its output is the task's stdout
+
+    traffic: get_traffic_profile() of the point (default: first PACKET_SIZE_VALUES/FLOW_COUNT_VALUES).
+    latency: turn on the latency sampler (with profilers only).
+    """
+    traffic = traffic or get_traffic_profile(PACKET_SIZE_VALUES[0], FLOW_COUNT_VALUES[0])
+    traffic_env = f'PKTGEN_PACKET_SIZE={traffic["frames"][0][0]} PKTGEN_FLOWS={traffic["flows"]} '
+    if len(traffic['frames']) > 1:
+        traffic_env += f'PKTGEN_IMIX={",".join(f"{size}:{weight}" for size, weight in traffic["frames"])} '
+    # Latency mode: sample timestamped packets once traffic is steady (simple-test.lua)
+    latency_env = ''
+    if latency and with_profilers:
+        latency_env = (f'PKTGEN_LATENCY_FILE={DATA_PATH}/{experiment_id}.latency '
+                       f'PKTGEN_LATENCY_RATE={LATENCY_SAMPLE_RATE} '
+                       f'PKTGEN_LATENCY_SAMPLES={LATENCY_MAX_SAMPLES} ')
+        if STEADY_STATE_DETECTION:
+            latency_env += f'PKTGEN_LATENCY_START_FILE={DATA_PATH}/{experiment_id}.steady '
 
     # Build TX descriptor argument if specified
     tx_desc_arg = ""
     if tx_desc_value and tx_desc_value != 1024:
         tx_desc_arg = f" --txd={tx_desc_value}"
 
-    # Extract PCI address (remove devargs like ",txqs_min_inline=0")
-    pci_address = config["pci_address"].split(',')[0]
-
-    # Build pktgen command (runs in background)
-    pktgen_cmd = (f'cd {config["working_dir"]} && '
-                  f'sudo -E {ENV} '
-                  f'ENABLE_PCM=0 '  # PCM disabled by default
-                  f'PKTGEN_DURATION={PKTGEN_DURATION} '
-                  f'PKTGEN_PACKET_SIZE={PKTGEN_PACKET_SIZE} '
-                  f'PKTGEN_SRC_MAC={PKTGEN_MAC} '
-                  f'PKTGEN_DST_MAC={L3FWD_MAC} '
-                  f'PKTGEN_DST_IP=198.18.0.1 '
-                  f'{config["binary_path"]} '
-                  f'{config["lcores"]} '
-                  f'{config["memory_channels"]} '
-                  f'-a {config["pci_address"]} '
-                  f'{config["proc_type"]} '
-                  f'--file-prefix={config["file_prefix"]} '
-                  f'-- -m "{config["port_map"]}" '
-                  f'{config["app_args"]}'
-                  f'{tx_desc_arg} '
-                  f'-f {config["script_file"]} '
-                  f'> {DATA_PATH}/{experiment_id}.pktgen 2>&1 & '
-                  f'PKTGEN_PID=$!; ')
-
-    # Add initial warmup delay
-    pktgen_cmd += f'sleep {WARMUP_DELAY}; '
-
-    # Add perf monitoring if enabled
+    return (f'cd {config["working_dir"]} && '
+            f'sudo -E {ENV} '
+            f'ENABLE_PCM=0 '  # PCM disabled by default
+            f'PKTGEN_DURATION={duration} '
+            f'PKTGEN_RATE={rate} '
+            f'{traffic_env}'
+            f'PKTGEN_SRC_MAC={config["src_mac"]} '
+            f'PKTGEN_DST_MAC={config["dst_mac"]} '
+            f'PKTGEN_SRC_IP={traffic["src_ip"]} '
+            f'PKTGEN_DST_IP={traffic["dst_ip"]} '
+            f'PKTGEN_SRC_PORT={traffic["src_ports"].split("-")[0]} '
+            f'PKTGEN_DST_PORT={traffic["dst_port"]} '
+            f'{f"PKTGEN_STOP_FILE={DATA_PATH}/{experiment_id}.done " if with_profilers else ""}'
+            f'{latency_env}'
+            f'{config["binary_path"]} '
+            f'{config["lcores"]} '
+            f'{config["memory_channels"]} '
+            f'-a {config["pci_address"]} '
+            f'{config["proc_type"]} '
+            f'--file-prefix={config["file_prefix"]} '
+            f'-- -m "{config["port_map"]}" '
+            f'{config["app_args"]}'
+            f'{tx_desc_arg} '
+            f'-f {config["script_file"]}')
+
+def profiler_commands(experiment_id, pktgen_config, l3fwd_config):
+    """Enabled profiler tasks per PROFILER_SCHEDULE tool: {tool: [(task name, node, command, output file)]}
+
+    perf and NeoHost run on the PKTGEN node; pcm-pcie/pcm-memory on both nodes.
+    """
+    pcm_bin = f'{PCM_PATH}/build/bin'
+    profilers = collections.defaultdict(list)
     if ENABLE_PERF:
         # Build event and metric lists from config
         perf_args = []
@@ -222,415 +313,234 @@ def run_pktgen(tx_desc_value=None, pktgen_config=None):
             perf_args.append(f'-e {",".join(PERF_EVENTS)}')
 
         perf_args_str = ' '.join(perf_args)
-        pktgen_cmd += (f'sudo timeout {PERF_DURATION} perf stat '
-                       f'{perf_args_str} '
-                       f'-I 1000 -a --per-socket '
-                       f'> {DATA_PATH}/{experiment_id}.perf 2>&1; ')
+        profilers['perf'].append(('pktgen.perf', pktgen_config['node'],
+                                  f'sudo timeout {PERF_DURATION} perf stat {perf_args_str} -I 1000 -a --per-socket',
+                                  f'{DATA_PATH}/{experiment_id}.perf'))
 
-    # Add PCM monitoring if enabled
     if ENABLE_PCM:
-        pktgen_cmd += f'sleep {TOOL_INTERVAL}; '
-        pktgen_cmd += (f'sudo timeout {PCM_DURATION} {DPDK_BENCH_HOME}/pcm/build/bin/pcm-pcie -B -e '
-                       f'> {DATA_PATH}/{experiment_id}.pcm-pcie 2>&1; ')
-        # Add pcm-memory monitoring for DDIO verification (DRAM bandwidth)
-        pktgen_cmd += f'sleep {TOOL_INTERVAL}; '
-        pktgen_cmd += (f'sudo timeout {PCM_DURATION} {DPDK_BENCH_HOME}/pcm/build/bin/pcm-memory 1 '
-                       f'> {DATA_PATH}/{experiment_id}.pcm-memory 2>&1; ')
-
-    # Add NeoHost monitoring if enabled
+        for prefix, config in (('', pktgen_config), ('l3fwd-', l3fwd_config)):
+            node_name = prefix.rstrip('-') or 'pktgen'
+            profilers['pcm-pcie'].append((f'{node_name}.pcm-pcie', config['node'],
+                                          f'sudo timeout {PCM_DURATION} {pcm_bin}/pcm-pcie -B -e',
+                                          f'{DATA_PATH}/{experiment_id}.{prefix}pcm-pcie'))
+            # pcm-memory monitoring for DDIO verification (DRAM bandwidth)
+            profilers['pcm-memory'].append((f'{node_name}.pcm-memory', config['node'],
+                                            f'sudo timeout {PCM_DURATION} {pcm_bin}/pcm-memory 1',
+                                            f'{DATA_PATH}/{experiment_id}.{prefix}pcm-memory'))
+
     if ENABLE_NEOHOST:
-        # Check if neohost is available
         neohost_python = f'{DPDK_BENCH_HOME}/neohost/miniconda3/envs/py27/bin/python'
         neohost_sdk = f'{DPDK_BENCH_HOME}/neohost/sdk/opt/neohost/sdk/get_device_performance_counters.py'
 
-        if os.path.exists(neohost_python) and os.path.exists(neohost_sdk):
-            pktgen_cmd += f'sleep {TOOL_INTERVAL}; '
-            pktgen_cmd += (f'sudo timeout {NEOHOST_DURATION} {neohost_python} '
-                           f'{neohost_sdk} '
-                           f'--dev-uid={pci_address} --get-analysis --run-loop 2>&1 | '
-                           f'sed "s/\\x1b\\[[0-9;]*m//g" '
-                           f'> {DATA_PATH}/{experiment_id}.neohost; ')
+        if 'neohost' in PROFILER_DURATIONS:
+            # Extract PCI address (remove devargs like ",txqs_min_inline=0")
+            pci_address = pktgen_config["pci_address"].split(',')[0]
+            profilers['neohost'].append(('pktgen.neohost', pktgen_config['node'],
+                                         f'sudo timeout {NEOHOST_DURATION} {neohost_python} {neohost_sdk} '
+                                         f'--dev-uid={pci_address} --get-analysis --run-loop 2>&1 | '
+                                         f'sed "s/\\x1b\\[[0-9;]*m//g"',
+                                         f'{DATA_PATH}/{experiment_id}.neohost'))
         else:
             print(f'WARNING: NeoHost enabled but not available at {neohost_python}')
+    return profilers
 
-    # Wait for pktgen to finish
-    pktgen_cmd += f'wait $PKTGEN_PID 2>/dev/null'
-
-    print(f'PKTGEN+PROFILERS command (duration={PKTGEN_DURATION}s): {pktgen_cmd[:]}...')
-
-    # Run locally using subprocess
-    result = subprocess.run(pktgen_cmd, shell=True, check=False)
-    if result.returncode != 0:
-        print(f'PKTGEN+PROFILERS exited with code {result.returncode}')
-
-def parse_perf_pktgen_results(experiment_id, txqs_min_inline, pktgen_tx_desc_value, pktgen_lcore_count):
-    """Parse pktgen and perf stat results"""
-    result_str = ''
-
-    # Parse Pktgen results for TX rate
-    pktgen_file = f'{DATA_PATH}/{experiment_id}.pktgen'
-    pktgen_tx_pkts = 0
-    pktgen_tx_rate = 0
-    pktgen_status = 'unknown'
-
-    if os.path.exists(pktgen_file):
-        try:
-            with open(pktgen_file, "r", encoding='utf-8', errors='ignore') as file:
-                pktgen_text = file.read()
-
-            # Look for Total TX packets in PKTGEN Packet Statistics Summary
-            packet_stats_pattern = r'PKTGEN Packet Statistics Summary.*?Total\s+\d+\s+(\d+).*?====='
-            packet_stats_match = re.search(packet_stats_pattern, pktgen_text, re.DOTALL)
-            if packet_stats_match:
-                pktgen_tx_pkts = int(packet_stats_match.group(1))
-                pktgen_status = 'success'
-                print(f"DEBUG Pktgen: Found TX packets: {pktgen_tx_pkts}")
-            else:
-                # Try to sum individual lcore TX stats
-                lcore_matches = re.findall(r'^\s*(\d+)\s+\d+\s+(\d+)\s+', pktgen_text, re.MULTILINE)
-                if lcore_matches:
-                    lcore_dict = {}
-                    for match in lcore_matches:
-                        lcore_id = int(match[0])
-                        lcore_dict[lcore_id] = int(match[1])  # TX
-                    pktgen_tx_pkts = sum(lcore_dict.values())
-                    pktgen_status = 'success'
-                    print(f"DEBUG Pktgen: Summed {len(lcore_dict)} lcore TX stats: {pktgen_tx_pkts}")
-                else:
-                    pktgen_status = 'error'
-                    print(f"DEBUG Pktgen: No TX packet data found")
-
-        except Exception as e:
-            print(f"ERROR parsing Pktgen file {pktgen_file}: {e}")
-            pktgen_status = 'error'
-
-    # Calculate TX rate (Mpps)
-    duration_sec = PKTGEN_DURATION
-    pktgen_tx_rate = round(pktgen_tx_pkts / (duration_sec * 1_000_000), 3) if pktgen_tx_pkts > 0 else 0
-
-    # Parse perf stat results dynamically based on config
-    perf_file = f'{DATA_PATH}/{experiment_id}.perf'
-    # Initialize perf_results with all items from config (default to 0)
-    perf_results = {item: 0 for item in PERF_EVENTS}
-
-    if os.path.exists(perf_file):
-        try:
-            with open(perf_file, "r", encoding='utf-8', errors='ignore') as file:
-                perf_text = file.read()
-
-            lines = perf_text.strip().split('\n')
-            timestamp_data = {}
-
-            for line in lines:
-                # Match pattern for count events: timestamp socket cpus value event_name
-                # Example: "1.001096320 S0       32            571,500      LLC-load-misses"
-                match_count = re.match(r'\s*([\d\.]+)\s+S\d+\s+\d+\s+([\d,]+)\s+(\S+?)(?:\s|$)', line)
-                if match_count:
-                    timestamp = match_count.group(1)
-                    value_str = match_count.group(2)
-                    event = match_count.group(3)
-
-                    # Skip lines with percentage or other non-event patterns
-                    if '%' not in event and not event.startswith('#'):
-                        try:
-                            value_count = int(value_str.replace(',', ''))
-                            if timestamp not in timestamp_data:
-                                timestamp_data[timestamp] = {}
-                            timestamp_data[timestamp][event] = value_count
-                        except ValueError:
-                            pass
-
-                # Match pattern for bandwidth metrics: timestamp socket cpus value event #    XXX.X MB/s  metric_name
-                # Example: "1.001096320 S0        1          2,513,972      UNC_CHA_REQUESTS.WRITES_LOCAL    #    160.9 MB/s  llc_miss_local_memory_bandwidth_write"
-                match_bw = re.match(r'\s*([\d\.]+)\s+S\d+\s+\d+\s+([\d,]+)\s+\S+\s+#\s+([\d\.]+)\s+MB/s\s+(\S+)', line)
-                if match_bw:
-                    timestamp = match_bw.group(1)
-                    bandwidth_mbs = float(match_bw.group(3))
-                    metric = match_bw.group(4)
-
-                    if timestamp not in timestamp_data:
-                        timestamp_data[timestamp] = {}
-                    timestamp_data[timestamp][metric] = bandwidth_mbs
-
-            # Collect values per event/metric from config
-            all_perf_items = PERF_EVENTS
-            event_values = {item: [] for item in all_perf_items}
-
-            for timestamp, events in timestamp_data.items():
-                for item in all_perf_items:
-                    if item in events:
-                        event_values[item].append(events[item])
-
-            # Calculate averages (skip first 2 samples for warm-up)
-            def avg_skip_first_n(values, n=2):
-                filtered = values[n:] if len(values) > n else values
-                return round(sum(filtered) / len(filtered), 3) if filtered else 0
-
-            # Store results in dictionary
-            for item in all_perf_items:
-                perf_results[item] = avg_skip_first_n(event_values[item])
-
-            # Print debug info
-            if event_values.get(all_perf_items[0] if all_perf_items else None):
-                print(f"DEBUG Perf: Found {len(event_values[all_perf_items[0]])} samples")
-            for item in all_perf_items:
-                if perf_results[item] > 0:
-                    print(f"DEBUG Perf: {item} = {perf_results[item]:,}")
-
-        except Exception as e:
-            print(f"ERROR parsing perf file {perf_file}: {e}")
-
-    # Parse pcm-pcie results (with -B -e options: includes Total/Miss/Hit rows)
-    pcm_file = f'{DATA_PATH}/{experiment_id}.pcm-pcie'
-    pcm_pcie_rdcur_total = 0
-    pcm_pcie_rdcur_miss = 0
-    pcm_pcie_ddio_miss_rate = 0
-    pcm_pcie_rd_mb = 0
-    pcm_pcie_wr_mb = 0
-
-    if os.path.exists(pcm_file):
-        try:
-            with open(pcm_file, "r", encoding='utf-8', errors='ignore') as file:
-                pcm_text = file.read()
-
-            # Parse pcm-pcie output - dynamic column detection
-            # Format varies by machine, but always has: Skt | PCIRdCur | ... | PCIe Rd (B) | PCIe Wr (B)
-            lines = pcm_text.strip().split('\n')
-
-            # Helper functions to parse values with K/M/G suffixes
-            def parse_count(s):
-                s = s.strip()
-                if 'K' in s:
-                    return float(s.replace('K', '').strip()) * 1000
-                elif 'M' in s:
-                    return float(s.replace('M', '').strip()) * 1000000
-                elif 'G' in s:
-                    return float(s.replace('G', '').strip()) * 1000000000
-                else:
-                    try:
-                        return float(s)
-                    except:
-                        return 0
-
-            def parse_bytes(s):
-                s = s.strip()
-                if 'K' in s:
-                    return float(s.replace('K', '').strip()) * 1024
-                elif 'M' in s:
-                    return float(s.replace('M', '').strip()) * 1024 * 1024
-                elif 'G' in s:
-                    return float(s.replace('G', '').strip()) * 1024 * 1024 * 1024
-                else:
-                    try:
-                        return float(s)
-                    except:
-                        return 0
-
-            # Find header line to determine column indices
-            header_cols = None
-            rdcur_idx = None
-            pcie_rd_idx = None
-            pcie_wr_idx = None
-
-            for line in lines:
-                if 'Skt' in line and 'PCIRdCur' in line and 'PCIe Rd (B)' in line:
-                    # Split header by | to get column names
-                    header_cols = [col.strip() for col in line.split('|')]
-                    for i, col in enumerate(header_cols):
-                        if col == 'PCIRdCur':
-                            rdcur_idx = i
-                        elif col == 'PCIe Rd (B)':
-                            pcie_rd_idx = i
-                        elif col == 'PCIe Wr (B)':
-                            pcie_wr_idx = i
-                    break
-
-            if rdcur_idx is None or pcie_rd_idx is None or pcie_wr_idx is None:
-                print(f"DEBUG PCM: Could not find required columns in header")
-            else:
-                # With -e option, output has (Total), (Miss), (Hit) rows
-                rdcur_total_values = []
-                rdcur_miss_values = []
-                rd_bytes_values = []
-                wr_bytes_values = []
-
-                for line in lines:
-                    # Skip header and separator lines
-                    if 'Skt' in line or '---' in line or not line.strip():
-                        continue
-
-                    # Check if this is a data line (starts with socket number or *)
-                    # Only use Socket 0 data (where NIC is connected)
-                    socket_match = re.match(r'^\s*(\d+)\s+', line)
-                    if socket_match:
-                        socket_num = int(socket_match.group(1))
-                        if socket_num != 0:
-                            continue  # Skip non-Socket 0 data
-
-                        # Determine row type: (Total), (Miss), (Hit), or Aggregate
-                        is_total = '(Total)' in line or '(Aggregate)' in line
-                        is_miss = '(Miss)' in line
-
-                        # Extract all "number + optional K/M/G" patterns
-                        value_pattern = r'(\d+(?:\.\d+)?)\s*([KMG]?)'
-                        matches = re.findall(value_pattern, line)
-
-                        # Combine number with unit
-                        values = []
-                        for num, unit in matches:
-                            values.append(num + unit if unit else num)
-
-                        if len(values) >= max(rdcur_idx, pcie_rd_idx, pcie_wr_idx) + 1:
-                            try:
-                                rdcur = parse_count(values[rdcur_idx])
-                                rd_bytes = parse_bytes(values[pcie_rd_idx])
-                                wr_bytes = parse_bytes(values[pcie_wr_idx])
-
-                                if is_total:
-                                    rdcur_total_values.append(rdcur)
-                                    rd_bytes_values.append(rd_bytes)
-                                    wr_bytes_values.append(wr_bytes)
-                                elif is_miss:
-                                    rdcur_miss_values.append(rdcur)
-                            except Exception as e:
-                                # Skip malformed lines
-                                pass
-
-                if rdcur_total_values:
-                    # Skip first 2 samples for warm-up
-                    total_filtered = rdcur_total_values[2:] if len(rdcur_total_values) > 2 else rdcur_total_values
-                    miss_filtered = rdcur_miss_values[2:] if len(rdcur_miss_values) > 2 else rdcur_miss_values
-                    rd_bytes_filtered = rd_bytes_values[2:] if len(rd_bytes_values) > 2 else rd_bytes_values
-                    wr_bytes_filtered = wr_bytes_values[2:] if len(wr_bytes_values) > 2 else wr_bytes_values
-
-                    # Calculate averages
-                    pcm_pcie_rdcur_total = round(sum(total_filtered) / len(total_filtered) / 1000000, 3) if total_filtered else 0
-                    pcm_pcie_rdcur_miss = round(sum(miss_filtered) / len(miss_filtered) / 1000000, 3) if miss_filtered else 0
-                    pcm_pcie_rd_mb = round(sum(rd_bytes_filtered) / len(rd_bytes_filtered) / (1024 * 1024), 3) if rd_bytes_filtered else 0
-                    pcm_pcie_wr_mb = round(sum(wr_bytes_filtered) / len(wr_bytes_filtered) / (1024 * 1024), 3) if wr_bytes_filtered else 0
-
-                    # Calculate DDIO miss rate
-                    if pcm_pcie_rdcur_total > 0:
-                        pcm_pcie_ddio_miss_rate = round((pcm_pcie_rdcur_miss / pcm_pcie_rdcur_total) * 100, 2)
-
-                    print(f"DEBUG PCM: Found {len(rdcur_total_values)} Socket 0 samples (using {len(total_filtered)} after skipping first 2)")
-                    print(f"DEBUG PCM: PCIRdCur Total: {pcm_pcie_rdcur_total}M, Miss: {pcm_pcie_rdcur_miss}M, DDIO Miss Rate: {pcm_pcie_ddio_miss_rate}%")
-                    print(f"DEBUG PCM: PCIe Rd: {pcm_pcie_rd_mb} MB, PCIe Wr: {pcm_pcie_wr_mb} MB")
-                else:
-                    print(f"DEBUG PCM: No data found")
+def host_state_of(node):
+    """collect_host_state() of node (None: this host), cached after the first successful read
 
-        except Exception as e:
-            print(f"ERROR parsing PCM file {pcm_file}: {e}")
+    Kernel, governors and hugepage setup do not change within a sweep, so
+    each experiment's manifest reuses them instead of an ssh round trip.
+    """
+    if 'error' in _host_states.get(node, {'error': None}):
+        _host_states[node] = collect_host_state(node)
+    return _host_states[node]
 
-    # Parse neohost results
-    neohost_file = f'{DATA_PATH}/{experiment_id}.neohost'
-    neohost_outbound_stalled_reads = 0
-    neohost_pcie_inbound_bw = 0
-    neohost_pcie_outbound_bw = 0
+def write_experiment_manifest(experiment_id, stage, point, testbed, pktgen_config, l3fwd_config, **fields):
+    """Write an experiment's manifest before launch: its provenance plus fields (see manifest.py)
 
-    if os.path.exists(neohost_file):
-        try:
-            with open(neohost_file, "r", encoding='utf-8', errors='ignore') as file:
-                neohost_text = file.read()
-
-            lines = neohost_text.strip().split('\n')
-            outbound_stalled_reads_values = []
-            pcie_inbound_bw_values = []
-            pcie_outbound_bw_values = []
-
-            for line in lines:
-                # Parse "Outbound Stalled Reads" from Counter section
-                # Format: || Outbound Stalled Reads                                    || 0               ||
-                if 'Outbound Stalled Reads' in line and '||' in line:
-                    match = re.search(r'\|\|\s*Outbound Stalled Reads\s*\|\|\s*([\d,]+)\s*\|\|', line)
-                    if match:
-                        value = int(match.group(1).replace(',', ''))
-                        outbound_stalled_reads_values.append(value)
-
-                # Parse "PCIe Inbound Used BW" from Performance Analysis section
-                # Format: ||| PCIe Inbound Used BW                || 8.8684        [Gb/s]             ||
-                if 'PCIe Inbound Used BW' in line and '|||' in line:
-                    match = re.search(r'\|\|\|\s*PCIe Inbound Used BW\s*\|\|\s*([\d,\.]+)\s*\[Gb/s\]', line)
-                    if match:
-                        value = float(match.group(1).replace(',', ''))
-                        pcie_inbound_bw_values.append(value)
-
-                # Parse "PCIe Outbound Used BW" from Performance Analysis section
-                # Format: ||| PCIe Outbound Used BW               || 0.6274        [Gb/s]             ||
-                if 'PCIe Outbound Used BW' in line and '|||' in line:
-                    match = re.search(r'\|\|\|\s*PCIe Outbound Used BW\s*\|\|\s*([\d,\.]+)\s*\[Gb/s\]', line)
-                    if match:
-                        value = float(match.group(1).replace(',', ''))
-                        pcie_outbound_bw_values.append(value)
-
-            # Skip first 2 samples for warm-up
-            if outbound_stalled_reads_values:
-                filtered = outbound_stalled_reads_values[2:] if len(outbound_stalled_reads_values) > 2 else outbound_stalled_reads_values
-                neohost_outbound_stalled_reads = round(sum(filtered) / len(filtered), 3) if filtered else 0
-            if pcie_inbound_bw_values:
-                filtered = pcie_inbound_bw_values[2:] if len(pcie_inbound_bw_values) > 2 else pcie_inbound_bw_values
-                neohost_pcie_inbound_bw = round(sum(filtered) / len(filtered), 3) if filtered else 0
-            if pcie_outbound_bw_values:
-                filtered = pcie_outbound_bw_values[2:] if len(pcie_outbound_bw_values) > 2 else pcie_outbound_bw_values
-                neohost_pcie_outbound_bw = round(sum(filtered) / len(filtered), 3) if filtered else 0
-
-            if outbound_stalled_reads_values or pcie_inbound_bw_values or pcie_outbound_bw_values:
-                total_samples = max(len(outbound_stalled_reads_values), len(pcie_inbound_bw_values), len(pcie_outbound_bw_values))
-                used_samples = max(len(outbound_stalled_reads_values[2:]) if len(outbound_stalled_reads_values) > 2 else len(outbound_stalled_reads_values),
-                                   len(pcie_inbound_bw_values[2:]) if len(pcie_inbound_bw_values) > 2 else len(pcie_inbound_bw_values),
-                                   len(pcie_outbound_bw_values[2:]) if len(pcie_outbound_bw_values) > 2 else len(pcie_outbound_bw_values))
-                print(f"DEBUG Neohost: Found {total_samples} samples (using {used_samples} after skipping first 2)")
-                print(f"DEBUG Neohost: Outbound Stalled Reads: {neohost_outbound_stalled_reads}, PCIe Inbound BW: {neohost_pcie_inbound_bw} Gb/s, PCIe Outbound BW: {neohost_pcie_outbound_bw} Gb/s")
+    Commands are added by run_dpdk_test(); callers finalize it after exit.
+    """
+    write_manifest(DATA_PATH, experiment_id, dict({
+        'experiment_id': experiment_id,
+        'stage': stage,
+        'status': 'running',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'point': point,
+        'testbed': testbed['name'],
+        'configs': {'pktgen': pktgen_config, 'l3fwd': l3fwd_config},
+        'sources': {name: source_version(path) for name, path in SOURCE_PATHS.items()},
+        'builds': {'pktgen': build_id(pktgen_config['binary_path']), 'l3fwd': build_id(l3fwd_config['binary_path'])},
+        'hosts': {role: host_state_of(None if testbed[f'{role}_node'] == PKTGEN_NODE else testbed[f'{role}_node'])
+                  for role in ('pktgen', 'l3fwd') if testbed[f'{role}_node']},
+        'parser_version': PARSER_VERSION,
+    }, **fields))
+
+def polling_cpus(config):
+    """Polling lcores of a get_l3fwd_config()/get_pktgen_config() config (workers; 1..N without placement)"""
+    if config['placement']:
+        return config['placement']['workers']
+    return parse_cpu_list(config['lcores'].split()[1])[1:]
+
+def noise_preflight(pktgen_config, l3fwd_config):
+    """noise_guard pre-flight state of both nodes' polling lcores: {'pktgen'|'l3fwd': state}"""
+    return {role: collect_preflight(polling_cpus(config), None if config['node'] == PKTGEN_NODE else config['node'])
+            for role, config in (('pktgen', pktgen_config), ('l3fwd', l3fwd_config)) if config['node']}
+
+def apply_noise_guard(res, experiment_id, states):
+    """Assess pre-flight states and the run's watch logs; adds noise_drift/noise_issues to the records
+
+    Misconfiguration and drift both mark a record noise_drift; res['noise_retry']
+    is set only for drift without misconfiguration, as a rerun cannot fix a
+    static setup (reported once per node and issue instead of every point).
+    """
+    misconfigured, drifted = False, False
+    for record in res['records']:
+        role = record['node'].lower()
+        if role not in states:
+            continue
+        samples = load_watch_samples(f'{DATA_PATH}/{experiment_id}.{role}-noise')
+        misconfig, drift, warnings = assess(states[role], samples, NOISE_LIMITS)
+        for issue in misconfig:
+            if (record['node'], issue) not in noise_misconfig_reported:
+                noise_misconfig_reported.add((record['node'], issue))
+                print(f"WARNING: {record['node']} misconfigured: {issue} (runs are marked noise_drift, not retried)")
+        for issue in drift:
+            print(f"WARNING: {record['node']} noise drift: {issue}")
+        misconfigured |= bool(misconfig)
+        drifted |= bool(drift)
+        record['noise_drift'] = int(bool(misconfig or drift))
+        record['noise_issues'] = '; '.join(misconfig + drift + warnings) or None
+    res['noise_retry'] = drifted and not misconfigured
+    return res
+
+async def wait_warmup(experiment_id, pktgen):
+    """Wait for steady state before profiling; False if pktgen exited meanwhile
+
+    Waits for <experiment_id>.steady (written by TelemetryCollector) for at most
+    WARMUP_MAX_DELAY, or WARMUP_DELAY when STEADY_STATE_DETECTION is off.
+    """
+    if STEADY_STATE_DETECTION:
+        waiter = asyncio.ensure_future(wait_for_file(f'{DATA_PATH}/{experiment_id}.steady', WARMUP_MAX_DELAY))
+    else:
+        waiter = asyncio.ensure_future(asyncio.sleep(WARMUP_DELAY))
+    exited = asyncio.ensure_future(pktgen.wait())
+    await asyncio.wait([waiter, exited], return_when=asyncio.FIRST_COMPLETED)
+    waiter.cancel()
+    exited.cancel()
+    return pktgen.running
+
+async def run_profiler_schedule(supervisor, profilers, windows_file):
+    """Run profilers phase by phase per PROFILER_SCHEDULE on both nodes
+
+    Profilers within a phase run concurrently and are joined before the next
+    phase. A phase's window starts once every tool has printed output
+    (profiler started, see PROFILER_START_TIMEOUT) and ends when the last one
+    exits; each phase's wall-clock start/end is appended to windows_file (see
+    telemetry.py). Phases with no enabled profiler just sleep their duration.
+    """
+    for phase in PROFILER_SCHEDULE:
+        if TOOL_INTERVAL:
+            await asyncio.sleep(TOOL_INTERVAL)
+        tasks = []
+        for tool in phase:
+            for name, node, cmd, output_file in profilers.get(tool, []):
+                tasks.append(await supervisor.spawn(name, cmd, node, log_file=output_file))
+        started = await asyncio.gather(*(task.wait_output(PROFILER_START_TIMEOUT) for task in tasks))
+        for task in itertools.compress(tasks, [not ok for ok in started]):
+            print(f'WARNING: {task.name} printed nothing within {PROFILER_START_TIMEOUT}s')
+
+        with open(windows_file, 'a') as file:
+            file.write(f'{"+".join(phase)} start {time.time():.6f}\n')
+        if tasks:
+            await asyncio.gather(*(task.wait() for task in tasks))
+        else:
+            await asyncio.sleep(get_phase_duration(phase))
+        with open(windows_file, 'a') as file:
+            file.write(f'{"+".join(phase)} end {time.time():.6f}\n')
+
+        for task in tasks:
+            if task.returncode not in (0, 124):  # 124: stopped by its `timeout`
+                print(f'WARNING: {task.name} exited with code {task.returncode}')
+
+async def run_dpdk_test(experiment_id, l3fwd_config, pktgen_config, l3fwd_tx_desc_value=None, l3fwd_rx_desc_value=None,
+                        pktgen_tx_desc_value=None, duration=None, rate=100, with_profilers=True, traffic=None,
+                        collector=None, latency=False):
+    """Run l3fwd, pktgen and (with_profilers) l3fwd telemetry and the profiler schedule as supervised tasks
+
+    traffic is the point's get_traffic_profile() (packet size/IMIX, flows).
+    duration/rate override PKTGEN_DURATION and the 100% TX rate (used by short
+    NDR search trials, which also run without profilers). With profilers,
+    duration is an upper bound: traffic stops (PKTGEN_STOP_FILE) once the
+    profiler schedule has finished. Every task still running at the end (or
+    on error/interrupt) is stopped. collector (TelemetryCollector) is told
+    when pktgen is launched; latency turns on pktgen's latency sampler.
+    Returns {task name: exit code}.
+    """
+    duration = duration or PKTGEN_DURATION
+    # L3FWD outlives pktgen by a 5 second buffer
+    l3fwd_duration = duration + 5
+
+    async with Supervisor(PKTGEN_NODE, PROCESS_STOP_GRACE) as supervisor:
+        l3fwd_cmd = l3fwd_command(l3fwd_config, l3fwd_tx_desc_value, l3fwd_rx_desc_value, l3fwd_duration)
+        print(f'L3FWD command (duration={l3fwd_duration}s): {l3fwd_cmd[:200]}...')
+        start = time.time()
+        l3fwd = await supervisor.spawn('l3fwd', l3fwd_cmd, l3fwd_config['node'],
+                                       log_file=f'{DATA_PATH}/{experiment_id}.l3fwd',
+                                       watch=L3FWD_READY_PATTERNS.items())
+        # Wait for l3fwd's readiness events instead of a fixed sleep
+        if await l3fwd.wait_ready(list(L3FWD_READY_PATTERNS), L3FWD_READY_TIMEOUT):
+            print(f'L3FWD ready ({", ".join(L3FWD_READY_PATTERNS)}) after {time.time() - start:.1f}s')
+        else:
+            print(f'WARNING: L3FWD not ready after {L3FWD_READY_TIMEOUT}s, last output:')
+            for line in list(l3fwd.lines)[-20:]:
+                print(f'  {line}')
+
+        # Poll l3fwd port counters for live telemetry
+        if with_profilers:
+            await supervisor.spawn('l3fwd-telemetry', l3fwd_telemetry_cmd(DPDK_PATH, l3fwd_duration),
+                                   l3fwd_config['node'], log_file=f'{DATA_PATH}/{experiment_id}.l3fwd-telemetry')
+        # Watch the polling lcores' frequency, governor and co-tenants (noise_guard.py)
+        if with_profilers and NOISE_GUARD:
+            for role, config in (('pktgen', pktgen_config), ('l3fwd', l3fwd_config)):
+                await supervisor.spawn(f'{role}-noise', watch_cmd(polling_cpus(config), duration, NOISE_WATCH_INTERVAL),
+                                       config['node'], log_file=f'{DATA_PATH}/{experiment_id}.{role}-noise')
+
+        profilers = profiler_commands(experiment_id, pktgen_config, l3fwd_config) if with_profilers else {}
+        print(f'Running pktgen with profilers: {"+".join(profilers) or "none"}')
+        pktgen_cmd = pktgen_command(experiment_id, pktgen_config, pktgen_tx_desc_value, duration, rate, with_profilers,
+                                    traffic, latency)
+        print(f'PKTGEN command (duration={duration}s, rate={rate}%): {pktgen_cmd}')
+        update_manifest(DATA_PATH, experiment_id, commands=dict(
+            {'l3fwd': l3fwd_cmd, 'pktgen': pktgen_cmd},
+            **{name: cmd for tasks in profilers.values() for name, _, cmd, _ in tasks}))
+        pktgen = await supervisor.spawn('pktgen', pktgen_cmd, pktgen_config['node'],
+                                        log_file=f'{DATA_PATH}/{experiment_id}.pktgen')
+        if collector:
+            collector.pktgen_started()
+
+        if with_profilers:
+            if await wait_warmup(experiment_id, pktgen):
+                await run_profiler_schedule(supervisor, profilers, f'{DATA_PATH}/{experiment_id}.windows')
             else:
-                print(f"DEBUG Neohost: No data found")
-
-        except Exception as e:
-            print(f"ERROR parsing Neohost file {neohost_file}: {e}")
-
-    print(f"Pktgen: TX={pktgen_tx_pkts:,} TX_rate={pktgen_tx_rate} Mpps ({pktgen_status})")
-
-    # Print perf results
-    if perf_results:
-        print("Perf results:")
-        for item, value in perf_results.items():
-            if value > 0:
-                print(f"  {item} = {value:,}")
-
-    print(f"PCM: PCIRdCur Total={pcm_pcie_rdcur_total}M, Miss={pcm_pcie_rdcur_miss}M, DDIO Miss Rate={pcm_pcie_ddio_miss_rate}%, PCIe Rd={pcm_pcie_rd_mb}MB, Wr={pcm_pcie_wr_mb}MB")
-    print(f"Neohost: Outbound Stalled Reads={neohost_outbound_stalled_reads}, PCIe Inbound BW={neohost_pcie_inbound_bw} Gb/s, PCIe Outbound BW={neohost_pcie_outbound_bw} Gb/s")
-
-    # Build CSV row dynamically with formatted values
-    tx_cores = pktgen_lcore_count
-    csv_values = [experiment_id, txqs_min_inline, tx_cores, pktgen_tx_desc_value, f"{pktgen_tx_rate}Mpps"]
-
-    # Add perf values in config order (formatted) - only if ENABLE_PERF is True
-    if ENABLE_PERF:
-        for item in PERF_EVENTS:
-            val = perf_results.get(item, 0)
-            csv_values.append(fmt_count(val))
-
-    # Add PCM values (formatted) - includes DDIO miss rate from pcm-pcie -e
-    csv_values.append(f"{pcm_pcie_rdcur_total:.1f}M")
-    csv_values.append(fmt_small_value(pcm_pcie_rdcur_miss, 'M'))
-    csv_values.append(f"{pcm_pcie_ddio_miss_rate:.2f}%")
-    csv_values.append(fmt_bw(pcm_pcie_rd_mb, 'MB/s'))
-    csv_values.append(fmt_bw(pcm_pcie_wr_mb, 'MB/s'))
-
-    # Add Neohost values (formatted)
-    csv_values.append(fmt_count(neohost_outbound_stalled_reads))
-    csv_values.append(fmt_bw(neohost_pcie_inbound_bw, 'Gb/s'))
-    csv_values.append(fmt_bw(neohost_pcie_outbound_bw, 'Gb/s'))
-
-    result_str += ', '.join(map(str, csv_values)) + '\n'
-
-    return result_str
-
-def parse_pcm_pcie_file(pcm_file):
+                print('ERROR pktgen exited during warm-up, skipping profilers')
+            # Stop traffic once the profilers on both nodes are done
+            with open(f'{DATA_PATH}/{experiment_id}.done', 'w') as file:
+                file.write('profilers done\n')
+
+        returncode = await pktgen.wait(duration + PKTGEN_START_TIMEOUT)
+        if returncode is None:
+            print(f'WARNING: pktgen still running after {duration + PKTGEN_START_TIMEOUT}s, stopping it')
+        elif returncode:
+            print(f'PKTGEN exited with code {returncode}')
+    return supervisor.exit_codes()
+
+def parse_pcm_pcie_file(pcm_file, target_socket=0):
     """Parse pcm-pcie output file (with -B -e options: includes Total/Miss/Hit rows)
     Returns dict with separate read/write metrics:
     - rd_total_bytes, rd_miss_bytes, rd_miss_rate (DDIO Rd Miss %)
     - wr_total_bytes, wr_miss_bytes, wr_miss_rate (DDIO Wr Miss %)
+    - series: per-sample SampleSeries for each of the above (if the file exists)
     """
+    from sample_stats import SampleSeries, ratio_series, warmup_samples
     result = {
         'rd_total_bytes': 0,
         'rd_miss_bytes': 0,
@@ -644,112 +554,36 @@ def parse_pcm_pcie_file(pcm_file):
         return result
 
     try:
-        with open(pcm_file, "r", encoding='utf-8', errors='ignore') as file:
-            pcm_text = file.read()
-
-        lines = pcm_text.strip().split('\n')
-
-        # Helper functions to parse values with K/M/G suffixes
-        def parse_count(s):
-            s = s.strip()
-            if 'K' in s:
-                return float(s.replace('K', '').strip()) * 1000
-            elif 'M' in s:
-                return float(s.replace('M', '').strip()) * 1000000
-            elif 'G' in s:
-                return float(s.replace('G', '').strip()) * 1000000000
-            else:
-                try:
-                    return float(s)
-                except:
-                    return 0
-
-        def parse_bytes(s):
-            s = s.strip()
-            if 'K' in s:
-                return float(s.replace('K', '').strip()) * 1024
-            elif 'M' in s:
-                return float(s.replace('M', '').strip()) * 1024 * 1024
-            elif 'G' in s:
-                return float(s.replace('G', '').strip()) * 1024 * 1024 * 1024
-            else:
-                try:
-                    return float(s)
-                except:
-                    return 0
-
-        # Find header line to determine column indices
-        header_cols = None
-        rdcur_idx = None
-        pcie_rd_idx = None
-        pcie_wr_idx = None
-
-        for line in lines:
-            if 'Skt' in line and 'PCIRdCur' in line and 'PCIe Rd (B)' in line:
-                header_cols = [col.strip() for col in line.split('|')]
-                for i, col in enumerate(header_cols):
-                    if col == 'PCIRdCur':
-                        rdcur_idx = i
-                    elif col == 'PCIe Rd (B)':
-                        pcie_rd_idx = i
-                    elif col == 'PCIe Wr (B)':
-                        pcie_wr_idx = i
-                break
-
-        if rdcur_idx is None or pcie_rd_idx is None or pcie_wr_idx is None:
-            return result
-
         # With -e option, output has (Total), (Miss), (Hit) rows
         rd_total_values = []
         rd_miss_values = []
         wr_total_values = []
         wr_miss_values = []
 
-        for line in lines:
-            if 'Skt' in line or '---' in line or not line.strip():
-                continue
-
-            socket_match = re.match(r'^\s*(\d+)\s+', line)
-            if socket_match:
-                socket_num = int(socket_match.group(1))
-                if socket_num != 0:
-                    continue  # Skip non-Socket 0 data
-
-                is_total = '(Total)' in line or '(Aggregate)' in line
-                is_miss = '(Miss)' in line
-
-                value_pattern = r'(\d+(?:\.\d+)?)\s*([KMG]?)'
-                matches = re.findall(value_pattern, line)
-
-                values = []
-                for num, unit in matches:
-                    values.append(num + unit if unit else num)
-
-                if len(values) >= max(rdcur_idx, pcie_rd_idx, pcie_wr_idx) + 1:
-                    try:
-                        rd_bytes = parse_bytes(values[pcie_rd_idx])
-                        wr_bytes = parse_bytes(values[pcie_wr_idx])
-
-                        if is_total:
-                            rd_total_values.append(rd_bytes)
-                            wr_total_values.append(wr_bytes)
-                        elif is_miss:
-                            rd_miss_values.append(rd_bytes)
-                            wr_miss_values.append(wr_bytes)
-                    except Exception:
-                        pass
+        for sample in iter_pcm_pcie_samples(pcm_file, target_socket):
+            if sample.kind == 'total':
+                rd_total_values.append(sample.rd_bytes)
+                wr_total_values.append(sample.wr_bytes)
+            elif sample.kind == 'miss':
+                rd_miss_values.append(sample.rd_bytes)
+                wr_miss_values.append(sample.wr_bytes)
+
+        # Warm-up trim detected on the total read series, applied to all four so they stay aligned
+        skip = warmup_samples(rd_total_values, STEADY_STATE_WINDOW, STEADY_STATE_MAX_CV)
+        series = {
+            'rd_total_bytes': SampleSeries(rd_total_values, skip),
+            'rd_miss_bytes': SampleSeries(rd_miss_values, skip),
+            'wr_total_bytes': SampleSeries(wr_total_values, skip),
+            'wr_miss_bytes': SampleSeries(wr_miss_values, skip),
+        }
+        # Per-sample DDIO miss % (distribution); the headline rate stays miss mean / total mean
+        series['rd_miss_rate'] = ratio_series(series['rd_miss_bytes'], series['rd_total_bytes'])
+        series['wr_miss_rate'] = ratio_series(series['wr_miss_bytes'], series['wr_total_bytes'])
+        result['series'] = series
 
         if rd_total_values:
-            # Skip first 2 samples for warm-up
-            rd_total_filtered = rd_total_values[2:] if len(rd_total_values) > 2 else rd_total_values
-            rd_miss_filtered = rd_miss_values[2:] if len(rd_miss_values) > 2 else rd_miss_values
-            wr_total_filtered = wr_total_values[2:] if len(wr_total_values) > 2 else wr_total_values
-            wr_miss_filtered = wr_miss_values[2:] if len(wr_miss_values) > 2 else wr_miss_values
-
-            result['rd_total_bytes'] = round(sum(rd_total_filtered) / len(rd_total_filtered), 0) if rd_total_filtered else 0
-            result['rd_miss_bytes'] = round(sum(rd_miss_filtered) / len(rd_miss_filtered), 0) if rd_miss_filtered else 0
-            result['wr_total_bytes'] = round(sum(wr_total_filtered) / len(wr_total_filtered), 0) if wr_total_filtered else 0
-            result['wr_miss_bytes'] = round(sum(wr_miss_filtered) / len(wr_miss_filtered), 0) if wr_miss_filtered else 0
+            for key in ('rd_total_bytes', 'rd_miss_bytes', 'wr_total_bytes', 'wr_miss_bytes'):
+                result[key] = round(series[key].mean, 0)
 
             if result['rd_total_bytes'] > 0:
                 result['rd_miss_rate'] = round((result['rd_miss_bytes'] / result['rd_total_bytes']) * 100, 2)
@@ -767,11 +601,13 @@ def parse_pcm_memory_file(pcm_memory_file, target_socket=0):
     Returns dict with:
     - dram_read_bw: DRAM Read bandwidth (MB/s)
     - dram_write_bw: DRAM Write bandwidth (MB/s)
+    - series: per-sample SampleSeries for both (if the file exists)
 
     Args:
         pcm_memory_file: Path to pcm-memory output file
         target_socket: Socket number to extract data from (default: 0)
     """
+    from sample_stats import SampleSeries, warmup_samples
     result = {
         'dram_read_bw': 0,
         'dram_write_bw': 0,
@@ -781,11 +617,6 @@ def parse_pcm_memory_file(pcm_memory_file, target_socket=0):
         return result
 
     try:
-        with open(pcm_memory_file, "r", encoding='utf-8', errors='ignore') as file:
-            pcm_text = file.read()
-
-        lines = pcm_text.strip().split('\n')
-
         # pcm-memory output format (per-socket, repeated every second):
         # |---------------------------------------||---------------------------------------|
         # |--             Socket  0             --||--             Socket  1             --|
@@ -808,45 +639,21 @@ def parse_pcm_memory_file(pcm_memory_file, target_socket=0):
         read_bw_values = []
         write_bw_values = []
 
-        for line in lines:
-            # Try newer tabular format first: "0 | 12345 | 12345 | 123.4 | 123.4 | ..."
-            socket_match = re.match(rf'^\s*{target_socket}\s*\|\s*\d+\s*\|\s*\d+\s*\|\s*([\d\.]+)\s*\|\s*([\d\.]+)', line)
-            if socket_match:
-                read_bw = float(socket_match.group(1))
-                write_bw = float(socket_match.group(2))
-                read_bw_values.append(read_bw)
-                write_bw_values.append(write_bw)
-                continue
-
-            # Try SKT format: "|-- SKT  0 Mem Read (MB/s) :  1197.75 --|"
-            read_match = re.search(rf'SKT\s*{target_socket}\s*Mem Read \(MB/s\)\s*:\s*([\d\.]+)', line)
-            if read_match:
-                read_bw_values.append(float(read_match.group(1)))
-                continue
-
-            write_match = re.search(rf'SKT\s*{target_socket}\s*Mem Write\(MB/s\)\s*:\s*([\d\.]+)', line)
-            if write_match:
-                write_bw_values.append(float(write_match.group(1)))
-                continue
-
-            # Try older NODE format: "NODE 0 Mem Read (MB/s):   1234.5"
-            read_match = re.search(rf'NODE\s*{target_socket}\s*Mem Read \(MB/s\):\s*([\d\.]+)', line)
-            if read_match:
-                read_bw_values.append(float(read_match.group(1)))
-                continue
+        for sample in iter_pcm_memory_samples(pcm_memory_file, target_socket):
+            if sample.metric == 'read':
+                read_bw_values.append(sample.value)
+            else:
+                write_bw_values.append(sample.value)
 
-            write_match = re.search(rf'NODE\s*{target_socket}\s*Mem Write \(MB/s\):\s*([\d\.]+)', line)
-            if write_match:
-                write_bw_values.append(float(write_match.group(1)))
-                continue
+        series = {
+            metric: SampleSeries(values, warmup_samples(values, STEADY_STATE_WINDOW, STEADY_STATE_MAX_CV))
+            for metric, values in (('dram_read_bw', read_bw_values), ('dram_write_bw', write_bw_values))
+        }
+        result['series'] = series
 
         if read_bw_values or write_bw_values:
-            # Skip first 2 samples for warm-up
-            read_filtered = read_bw_values[2:] if len(read_bw_values) > 2 else read_bw_values
-            write_filtered = write_bw_values[2:] if len(write_bw_values) > 2 else write_bw_values
-
-            result['dram_read_bw'] = round(sum(read_filtered) / len(read_filtered), 1) if read_filtered else 0
-            result['dram_write_bw'] = round(sum(write_filtered) / len(write_filtered), 1) if write_filtered else 0
+            result['dram_read_bw'] = round(series['dram_read_bw'].mean, 1)
+            result['dram_write_bw'] = round(series['dram_write_bw'].mean, 1)
 
             print(f"DEBUG PCM-Memory: Found {len(read_bw_values)} samples, Socket {target_socket} DRAM Read: {result['dram_read_bw']} MB/s, Write: {result['dram_write_bw']} MB/s")
         else:
@@ -858,11 +665,87 @@ def parse_pcm_memory_file(pcm_memory_file, target_socket=0):
     return result
 
 
-def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_value=None, pktgen_tx_desc_value=None, l3fwd_lcore_count=None, pktgen_lcore_count=None):
+def parse_packet_stats(log_file, summary_name):
+    """Parse Total RX/TX packets and Hardware RX Missed from a PKTGEN or L3FWD log
+
+    summary_name: 'PKTGEN' or 'L3FWD' (prefix of the "Packet Statistics Summary" block)
+    """
+    stats = {'rx_pkts': 0, 'tx_pkts': 0, 'hw_rx_missed': 0, 'status': 'unknown'}
+    if not os.path.exists(log_file):
+        return stats
+
+    try:
+        with open(log_file, "r", encoding='utf-8', errors='ignore') as file:
+            text = file.read()
+
+        packet_stats_match = re.search(rf'{summary_name} Packet Statistics Summary.*?Total\s+(\d+)\s+(\d+).*?=====', text, re.DOTALL)
+        if packet_stats_match:
+            stats['rx_pkts'] = int(packet_stats_match.group(1))
+            stats['tx_pkts'] = int(packet_stats_match.group(2))
+            stats['status'] = 'success'
+        else:
+            stats['status'] = 'error'
+
+        hw_rx_missed_match = re.search(r'Hardware RX Missed:\s+(\d+)', text)
+        if hw_rx_missed_match:
+            stats['hw_rx_missed'] = int(hw_rx_missed_match.group(1))
+    except Exception as e:
+        print(f"ERROR parsing {summary_name} file {log_file}: {e}")
+        stats['status'] = 'error'
+
+    return stats
+
+def efficiency_row(columns):
+    """Table cells for efficiency_columns(): L1 Gbps, % of line rate, PCIe Rd/Wr and DRAM Rd/Wr B/pkt"""
+    return ['-' if columns[key] is None else f'{columns[key]}'
+            for key in ('l1_gbps', 'line_rate_pct', 'pcie_rd_bpp', 'pcie_wr_bpp', 'dram_rd_bpp', 'dram_wr_bpp')]
+
+def traffic_columns(traffic):
+    """Record columns of a get_traffic_profile() traffic: packet_size is the mean frame size, imix the IMIX profile name or None"""
+    return {
+        'packet_size': traffic['mean_frame_size'],
+        'imix': traffic['packet_size'] if isinstance(traffic['packet_size'], str) else None,
+        'flows': traffic['flows'],
+        'src_ip': traffic['src_ip'],
+        'dst_ip': traffic['dst_ip'],
+        'src_ports': traffic['src_ports'],
+        'dst_port': traffic['dst_port'],
+    }
+
+def pcm_core_means(pcm_data, cores):
+    """Mean (L3 misses, L2 hit %, L3 hit %) of cores over PCM's per-core statistics rows (0s if none reported)"""
+    stats = [(int(l3_misses), float(l2_hit), float(l3_hit)) for core_id, l3_misses, l2_hit, l3_hit in
+             re.findall(r'(\d+)\s+\d+\s+\d+\s+[\d\.]+\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', pcm_data)
+             if int(core_id) in cores]
+    if not stats:
+        return 0, 0, 0
+    return tuple(round(sum(values) / len(stats), 1) for values in zip(*stats))
+
+def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_value=None, pktgen_tx_desc_value=None, l3fwd_lcore_count=None, pktgen_lcore_count=None, testbed_name='-', telemetry_series=None, pktgen_socket=0, l3fwd_socket=0, traffic=None, ddio_states=None, devargs=None, workers=None, latency=False):
     """Parse DPDK test results from l3fwd and pktgen
     Returns dict with header, pktgen_row, l3fwd_row for structured output
+
+    Rates come from the telemetry series over the profiler measurement window
+    when available (live TelemetryCollector.series, else saved telemetry files),
+    falling back to total packets / the seconds pktgen sent traffic (its last
+    TELEMETRY line, else PKTGEN_DURATION). PCM statistics are read
+    for each node's NIC socket (pktgen_socket/l3fwd_socket, see topology.py).
+    traffic (get_traffic_profile()) labels the rows and records with the
+    point's packet size/IMIX profile and flow count; ddio_states (apply_ddio())
+    their DDIO state, cross-checked against the DRAM write bytes per packet;
+    devargs ({'pktgen'|'l3fwd': devargs string}) the NIC devargs each node ran with;
+    workers ({'pktgen'|'l3fwd': polling_cpus()}) the lcores PCM core statistics are
+    averaged over (default: lcores 1..N, the placement without topology information);
+    latency adds the latency sampler's percentiles (the run had it on).
     """
+    from latency import LatencyHistogram, load_latency_samples
+    from sample_stats import SampleSeries, save_samples, summary_columns
+    devargs = devargs or {}
+    workers = dict({'l3fwd': list(range(1, (l3fwd_lcore_count or 0) + 1)),
+                    'pktgen': list(range(1, (pktgen_lcore_count or 0) + 2))}, **(workers or {}))
+    traffic = traffic or get_traffic_profile(PACKET_SIZE_VALUES[0], FLOW_COUNT_VALUES[0])
     result = {
+        'experiment_id': experiment_id,
         'header': [],
         'pktgen_row': [],
         'l3fwd_row': [],
@@ -935,25 +818,10 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
             l3fwd_l3_hit = 0
             
             if pcm_match:
-                pcm_data = pcm_match.group(1)
-                # Extract individual core stats (exclude core 0)
-                core_lines = re.findall(r'(\d+)\s+\d+\s+\d+\s+[\d\.]+\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', pcm_data)
+                l3fwd_l3_misses, l3fwd_l2_hit, l3fwd_l3_hit = pcm_core_means(pcm_match.group(1), workers['l3fwd'])
+                print(f"DEBUG L3FWD: Worker cores ({format_cpu_list(workers['l3fwd'])}) - L3 Misses: {l3fwd_l3_misses}, L2 Hit%: {l3fwd_l2_hit}, L3 Hit%: {l3fwd_l3_hit}")
                 
-                l3fwd_cores = []  # cores excluding 0
-                
-                for core_id, l3_misses, l2_hit, l3_hit in core_lines:
-                    core_num = int(core_id)
-                    if core_num != 0:  # exclude core 0
-                        l3fwd_cores.append((int(l3_misses), float(l2_hit), float(l3_hit)))
-                
-                if l3fwd_cores:
-                    l3fwd_l3_misses = round(sum(x[0] for x in l3fwd_cores) / len(l3fwd_cores), 1)
-                    l3fwd_l2_hit = round(sum(x[1] for x in l3fwd_cores) / len(l3fwd_cores), 1)
-                    l3fwd_l3_hit = round(sum(x[2] for x in l3fwd_cores) / len(l3fwd_cores), 1)
-                    
-                print(f"DEBUG L3FWD: Active cores (excluding 0) - L3 Misses: {l3fwd_l3_misses}, L2 Hit%: {l3fwd_l2_hit}, L3 Hit%: {l3fwd_l3_hit}")
-                
-            # Extract Intel PCM Memory Performance Statistics - Socket 1 only  
+            # Extract Intel PCM Memory Performance Statistics - NIC socket only  
             memory_start = l3fwd_text.find('Intel PCM Memory Performance Statistics')
             l3fwd_dram_read = 0
             l3fwd_dram_write = 0
@@ -967,20 +835,20 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
                     memory_end = memory_start + 1000  # fallback
                 
                 memory_section = l3fwd_text[memory_start:memory_end]
-                # Look for Socket 1 line: "1      849920       1364032      81.1       130.1      0.2      0        80.0"
-                socket1_match = re.search(r'^1\s+(\d+)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', memory_section, re.MULTILINE)
+                # Look for the NIC socket line, e.g. Socket 1: "1      849920       1364032      81.1       130.1      0.2      0        80.0"
+                socket1_match = re.search(rf'^{l3fwd_socket}\s+(\d+)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', memory_section, re.MULTILINE)
                 if socket1_match:
                     l3fwd_dram_read = int(socket1_match.group(1))
                     l3fwd_dram_write = int(socket1_match.group(2))
                     l3fwd_dram_read_bw = float(socket1_match.group(3))
                     l3fwd_dram_write_bw = float(socket1_match.group(4))
-                    print(f"DEBUG L3FWD: Socket 1 - DRAM Read: {l3fwd_dram_read}, DRAM Write: {l3fwd_dram_write}, Read BW: {l3fwd_dram_read_bw}, Write BW: {l3fwd_dram_write_bw}")
+                    print(f"DEBUG L3FWD: Socket {l3fwd_socket} - DRAM Read: {l3fwd_dram_read}, DRAM Write: {l3fwd_dram_write}, Read BW: {l3fwd_dram_read_bw}, Write BW: {l3fwd_dram_write_bw}")
                 else:
-                    print(f"DEBUG L3FWD: Socket 1 memory data not found in section")
+                    print(f"DEBUG L3FWD: Socket {l3fwd_socket} memory data not found in section")
             else:
                 print(f"DEBUG L3FWD: Intel PCM Memory Performance Statistics section not found")
                 
-            # Extract Intel PCM I/O Performance Statistics - Socket 1 only
+            # Extract Intel PCM I/O Performance Statistics - NIC socket only
             io_start = l3fwd_text.find('Intel PCM I/O Performance Statistics')
             l3fwd_pcie_read = 0
             l3fwd_pcie_write = 0
@@ -994,16 +862,16 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
                     io_end = io_start + 1000  # fallback
                 
                 io_section = l3fwd_text[io_start:io_end]
-                # Look for Socket 1 line: "1      288364       398784       27.5       38.0       0.0       0.09     0.12"
-                socket1_io_match = re.search(r'^1\s+(\d+)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', io_section, re.MULTILINE)
+                # Look for the NIC socket line, e.g. Socket 1: "1      288364       398784       27.5       38.0       0.0       0.09     0.12"
+                socket1_io_match = re.search(rf'^{l3fwd_socket}\s+(\d+)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', io_section, re.MULTILINE)
                 if socket1_io_match:
                     l3fwd_pcie_read = int(socket1_io_match.group(1))
                     l3fwd_pcie_write = int(socket1_io_match.group(2))
                     l3fwd_pcie_read_bw = float(socket1_io_match.group(3))
                     l3fwd_pcie_write_bw = float(socket1_io_match.group(4))
-                    print(f"DEBUG L3FWD: Socket 1 - PCIe Read: {l3fwd_pcie_read}, PCIe Write: {l3fwd_pcie_write}, PCIe R BW: {l3fwd_pcie_read_bw}, PCIe W BW: {l3fwd_pcie_write_bw}")
+                    print(f"DEBUG L3FWD: Socket {l3fwd_socket} - PCIe Read: {l3fwd_pcie_read}, PCIe Write: {l3fwd_pcie_write}, PCIe R BW: {l3fwd_pcie_read_bw}, PCIe W BW: {l3fwd_pcie_write_bw}")
                 else:
-                    print(f"DEBUG L3FWD: Socket 1 I/O data not found in section")
+                    print(f"DEBUG L3FWD: Socket {l3fwd_socket} I/O data not found in section")
             else:
                 print(f"DEBUG L3FWD: Intel PCM I/O Performance Statistics section not found")
         except Exception as e:
@@ -1083,35 +951,14 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
             pktgen_tx_l3_hit = 0
             
             if pcm_match:
-                pcm_data = pcm_match.group(1)
-                # Extract individual core stats
-                core_lines = re.findall(r'(\d+)\s+\d+\s+\d+\s+[\d\.]+\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', pcm_data)
+                # Pktgen's first worker lcore receives, the others transmit (get_pktgen_config() port map)
+                rx_cores, tx_cores = workers['pktgen'][:1], workers['pktgen'][1:]
+                pktgen_rx_l3_misses, pktgen_rx_l2_hit, pktgen_rx_l3_hit = pcm_core_means(pcm_match.group(1), rx_cores)
+                pktgen_tx_l3_misses, pktgen_tx_l2_hit, pktgen_tx_l3_hit = pcm_core_means(pcm_match.group(1), tx_cores)
+                print(f"DEBUG Pktgen: RX cores ({format_cpu_list(rx_cores)}) - L3 Misses: {pktgen_rx_l3_misses}, L2 Hit%: {pktgen_rx_l2_hit}, L3 Hit%: {pktgen_rx_l3_hit}")
+                print(f"DEBUG Pktgen: TX cores ({format_cpu_list(tx_cores)}) - L3 Misses: {pktgen_tx_l3_misses}, L2 Hit%: {pktgen_tx_l2_hit}, L3 Hit%: {pktgen_tx_l3_hit}")
                 
-                rx_cores = []  # cores 1-8 for RX
-                tx_cores = []  # cores 9-15 for TX
-                
-                for core_id, l3_misses, l2_hit, l3_hit in core_lines:
-                    core_num = int(core_id)
-                    if 1 <= core_num <= 8:
-                        rx_cores.append((int(l3_misses), float(l2_hit), float(l3_hit)))
-                    elif 9 <= core_num <= 15:
-                        tx_cores.append((int(l3_misses), float(l2_hit), float(l3_hit)))
-                
-                if rx_cores:
-                    pktgen_rx_l3_misses = round(sum(x[0] for x in rx_cores) / len(rx_cores), 1)
-                    pktgen_rx_l2_hit = round(sum(x[1] for x in rx_cores) / len(rx_cores), 1)
-                    pktgen_rx_l3_hit = round(sum(x[2] for x in rx_cores) / len(rx_cores), 1)
-                    
-                if tx_cores:
-                    pktgen_tx_l3_misses = round(sum(x[0] for x in tx_cores) / len(tx_cores), 1)
-                    pktgen_tx_l2_hit = round(sum(x[1] for x in tx_cores) / len(tx_cores), 1)
-                    pktgen_tx_l3_hit = round(sum(x[2] for x in tx_cores) / len(tx_cores), 1)
-                    
-                print(f"DEBUG Pktgen: RX cores (1-8) - L3 Misses: {pktgen_rx_l3_misses}, L2 Hit%: {pktgen_rx_l2_hit}, L3 Hit%: {pktgen_rx_l3_hit}")
-                print(f"DEBUG Pktgen: TX cores (9-15) - L3 Misses: {pktgen_tx_l3_misses}, L2 Hit%: {pktgen_tx_l2_hit}, L3 Hit%: {pktgen_tx_l3_hit}")
-                
-            # Extract Intel PCM Memory Performance Statistics from Pktgen (Socket 1)
-            # Extract Intel PCM Memory Performance Statistics - Socket 1 only
+            # Extract Intel PCM Memory Performance Statistics - NIC socket only
             memory_start = pktgen_text.find('Intel PCM Memory Performance Statistics')
             pktgen_dram_read = 0
             pktgen_dram_write = 0
@@ -1125,20 +972,20 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
                     memory_end = memory_start + 1000  # fallback
                 
                 memory_section = pktgen_text[memory_start:memory_end]
-                # Look for Socket 1 line: "1      849920       1364032      81.1       130.1      0.2      0        80.0"
-                socket1_match = re.search(r'^1\s+(\d+)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', memory_section, re.MULTILINE)
+                # Look for the NIC socket line, e.g. Socket 1: "1      849920       1364032      81.1       130.1      0.2      0        80.0"
+                socket1_match = re.search(rf'^{pktgen_socket}\s+(\d+)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', memory_section, re.MULTILINE)
                 if socket1_match:
                     pktgen_dram_read = int(socket1_match.group(1))
                     pktgen_dram_write = int(socket1_match.group(2))
                     pktgen_dram_read_bw = float(socket1_match.group(3))
                     pktgen_dram_write_bw = float(socket1_match.group(4))
-                    print(f"DEBUG Pktgen: Socket 1 - DRAM Read: {pktgen_dram_read}, DRAM Write: {pktgen_dram_write}, Read BW: {pktgen_dram_read_bw}, Write BW: {pktgen_dram_write_bw}")
+                    print(f"DEBUG Pktgen: Socket {pktgen_socket} - DRAM Read: {pktgen_dram_read}, DRAM Write: {pktgen_dram_write}, Read BW: {pktgen_dram_read_bw}, Write BW: {pktgen_dram_write_bw}")
                 else:
-                    print(f"DEBUG Pktgen: Socket 1 memory data not found in section")
+                    print(f"DEBUG Pktgen: Socket {pktgen_socket} memory data not found in section")
             else:
                 print(f"DEBUG Pktgen: Intel PCM Memory Performance Statistics section not found")
                 
-            # Extract Intel PCM I/O Performance Statistics - Socket 1 only
+            # Extract Intel PCM I/O Performance Statistics - NIC socket only
             io_start = pktgen_text.find('Intel PCM I/O Performance Statistics')
             pktgen_pcie_read = 0
             pktgen_pcie_write = 0
@@ -1152,16 +999,16 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
                     io_end = io_start + 1000  # fallback
                 
                 io_section = pktgen_text[io_start:io_end]
-                # Look for Socket 1 line: "1      245856       392083       23.4       37.4       0.0       0.08     0.12"
-                socket1_io_match = re.search(r'^1\s+(\d+)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', io_section, re.MULTILINE)
+                # Look for the NIC socket line, e.g. Socket 1: "1      245856       392083       23.4       37.4       0.0       0.08     0.12"
+                socket1_io_match = re.search(rf'^{pktgen_socket}\s+(\d+)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)', io_section, re.MULTILINE)
                 if socket1_io_match:
                     pktgen_pcie_read = int(socket1_io_match.group(1))
                     pktgen_pcie_write = int(socket1_io_match.group(2))
                     pktgen_pcie_read_bw = float(socket1_io_match.group(3))
                     pktgen_pcie_write_bw = float(socket1_io_match.group(4))
-                    print(f"DEBUG Pktgen: Socket 1 - PCIe Read: {pktgen_pcie_read}, PCIe Write: {pktgen_pcie_write}, PCIe R BW: {pktgen_pcie_read_bw}, PCIe W BW: {pktgen_pcie_write_bw}")
+                    print(f"DEBUG Pktgen: Socket {pktgen_socket} - PCIe Read: {pktgen_pcie_read}, PCIe Write: {pktgen_pcie_write}, PCIe R BW: {pktgen_pcie_read_bw}, PCIe W BW: {pktgen_pcie_write_bw}")
                 else:
-                    print(f"DEBUG Pktgen: Socket 1 I/O data not found in section")
+                    print(f"DEBUG Pktgen: Socket {pktgen_socket} I/O data not found in section")
             else:
                 print(f"DEBUG Pktgen: Intel PCM I/O Performance Statistics section not found")
         except Exception as e:
@@ -1170,31 +1017,102 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
     
     print(f"L3FWD: RX={l3fwd_rx_pkts:,} TX={l3fwd_tx_pkts:,} ({l3fwd_status})")
     print(f"Pktgen: RX={pktgen_rx_pkts:,} TX={pktgen_tx_pkts:,} ({pktgen_status})")
+    # Valid results are not re-run on resume (see run_ledgered_sweep); zero traffic is never valid
+    result['valid'] = pktgen_status == 'success' and l3fwd_status != 'error' and pktgen_tx_pkts > 0
 
-    # Convert packet counts to Mpps (Million packets per second)
-    duration_sec = PKTGEN_DURATION
+    # Convert packet counts to Mpps (Million packets per second) over the measured traffic time
+    duration_sec = pktgen_traffic_seconds(pktgen_file) or PKTGEN_DURATION
     pktgen_rx_rate = round(pktgen_rx_pkts / (duration_sec * 1_000_000), 3)
     pktgen_tx_rate = round(pktgen_tx_pkts / (duration_sec * 1_000_000), 3)
     l3fwd_rx_rate = round(l3fwd_rx_pkts / (duration_sec * 1_000_000), 3)
     l3fwd_tx_rate = round(l3fwd_tx_pkts / (duration_sec * 1_000_000), 3)
 
+    # Prefer steady-state rates over the window the PCM tools sampled
+    steady = steady_state_rates(experiment_id, DATA_PATH, telemetry_series)
+    if steady['pktgen']:
+        pktgen_tx_rate = steady['pktgen']['tx_rate']
+        pktgen_rx_rate = steady['pktgen']['rx_rate']
+        print(f"DEBUG Telemetry: PKTGEN steady-state TX={pktgen_tx_rate} RX={pktgen_rx_rate} Mpps ({steady['pktgen']['samples']} samples)")
+    if steady['l3fwd']:
+        l3fwd_tx_rate = steady['l3fwd']['tx_rate']
+        l3fwd_rx_rate = steady['l3fwd']['rx_rate']
+        print(f"DEBUG Telemetry: L3FWD steady-state TX={l3fwd_tx_rate} RX={l3fwd_rx_rate} Mpps ({steady['l3fwd']['samples']} samples)")
+    if not steady['pktgen'] and not steady['l3fwd']:
+        print(f"DEBUG Telemetry: No samples in measurement window, using whole-run averages")
+
     # Parse pcm-pcie results for PKTGEN and L3FWD
-    pktgen_pcm = parse_pcm_pcie_file(f'{DATA_PATH}/{experiment_id}.pcm-pcie')
-    l3fwd_pcm = parse_pcm_pcie_file(f'{DATA_PATH}/{experiment_id}.l3fwd-pcm-pcie')
+    pktgen_pcm = parse_pcm_pcie_file(f'{DATA_PATH}/{experiment_id}.pcm-pcie', target_socket=pktgen_socket)
+    l3fwd_pcm = parse_pcm_pcie_file(f'{DATA_PATH}/{experiment_id}.l3fwd-pcm-pcie', target_socket=l3fwd_socket)
 
     # Parse pcm-memory results for DDIO verification (DRAM bandwidth)
-    pktgen_mem = parse_pcm_memory_file(f'{DATA_PATH}/{experiment_id}.pcm-memory', target_socket=0)
-    l3fwd_mem = parse_pcm_memory_file(f'{DATA_PATH}/{experiment_id}.l3fwd-pcm-memory', target_socket=0)
+    pktgen_mem = parse_pcm_memory_file(f'{DATA_PATH}/{experiment_id}.pcm-memory', target_socket=pktgen_socket)
+    l3fwd_mem = parse_pcm_memory_file(f'{DATA_PATH}/{experiment_id}.l3fwd-pcm-memory', target_socket=l3fwd_socket)
 
     print(f"PKTGEN PCM: Rd Total={pktgen_pcm['rd_total_bytes']/1e6:.1f}MB, Rd Miss={pktgen_pcm['rd_miss_bytes']/1e6:.1f}MB ({pktgen_pcm['rd_miss_rate']}%), Wr Total={pktgen_pcm['wr_total_bytes']/1e6:.1f}MB, Wr Miss={pktgen_pcm['wr_miss_bytes']/1e6:.1f}MB ({pktgen_pcm['wr_miss_rate']}%)")
     print(f"PKTGEN DRAM: Read={pktgen_mem['dram_read_bw']} MB/s, Write={pktgen_mem['dram_write_bw']} MB/s")
     print(f"L3FWD PCM: Rd Total={l3fwd_pcm['rd_total_bytes']/1e6:.1f}MB, Rd Miss={l3fwd_pcm['rd_miss_bytes']/1e6:.1f}MB ({l3fwd_pcm['rd_miss_rate']}%), Wr Total={l3fwd_pcm['wr_total_bytes']/1e6:.1f}MB, Wr Miss={l3fwd_pcm['wr_miss_bytes']/1e6:.1f}MB ({l3fwd_pcm['wr_miss_rate']}%)")
     print(f"L3FWD DRAM: Read={l3fwd_mem['dram_read_bw']} MB/s, Write={l3fwd_mem['dram_write_bw']} MB/s (DDIO verification: high Write = DDIO OFF)")
 
+    # Per-sample series per node (window telemetry rates + profiler samples), saved for offline analysis
+    node_series = {}
+    for node, rates, pcm, mem in (('pktgen', steady['pktgen'], pktgen_pcm, pktgen_mem),
+                                  ('l3fwd', steady['l3fwd'], l3fwd_pcm, l3fwd_mem)):
+        series = dict(pcm.get('series', {}), **mem.get('series', {}))
+        if rates:
+            # Already restricted to the measurement window: no warm-up samples to skip
+            series['tx_rate'] = SampleSeries(rates['tx_series'], skip=0)
+            series['rx_rate'] = SampleSeries(rates['rx_series'], skip=0)
+        node_series[node] = series
+    save_samples(f'{DATA_PATH}/{experiment_id}.samples.npz',
+                 {f'{node}.{name}': values for node, series in node_series.items() for name, values in series.items()})
+
+    # High variation in throughput-tracking series = never reached steady state
+    max_cv = {}
+    for node, series in node_series.items():
+        max_cv[node] = max((series[name].cv for name in STEADY_STATE_CV_METRICS if name in series), default=0.0)
+        if max_cv[node] > STEADY_STATE_MAX_CV:
+            print(f"WARNING: {node.upper()} not in steady state (max CV {max_cv[node]*100:.1f}% > {STEADY_STATE_MAX_CV*100:.1f}%)")
+
+    # Latency mode: bucket sampled round-trip latencies into an HDR-style histogram (saved for merging)
+    latency_summary = None
+    if latency:
+        histogram = LatencyHistogram().record(load_latency_samples(f'{DATA_PATH}/{experiment_id}.latency'))
+        histogram.save(f'{DATA_PATH}/{experiment_id}.latency-hist.npz')
+        latency_summary = histogram.summary()
+        print(f"DEBUG Latency: {latency_summary['samples']} samples, p50={latency_summary['p50']} "
+              f"p99={latency_summary['p99']} p99.9={latency_summary['p99.9']} max={latency_summary['max']} us")
+
     # Build structured result with pktgen row and l3fwd row
     # Each row contains: Expt ID, Node, TX_DESC, RX_DESC, #Cores, TX Rate, RX Rate,
     #                    DDIO Rd Miss%, PCIe Rd Total, PCIe Rd Miss, DDIO Wr Miss%, PCIe Wr Total, PCIe Wr Miss,
-    #                    DRAM Rd BW (MB/s), DRAM Wr BW (MB/s)
+    #                    DRAM Rd BW (MB/s), DRAM Wr BW (MB/s), Testbed, Max CV (%), Steady
+
+    # Gbps, % of line rate and per-packet PCIe/DRAM bytes (line_rate.py)
+    efficiency = {
+        node: efficiency_columns({'tx_rate': tx_rate, 'packet_size': traffic['mean_frame_size'],
+                                  'pcie_rd_total': pcm['rd_total_bytes'], 'pcie_wr_total': pcm['wr_total_bytes'],
+                                  'dram_rd_bw': mem['dram_read_bw'], 'dram_wr_bw': mem['dram_write_bw']},
+                                 LINK_SPEED_GBPS, WIRE_OVERHEAD_BYTES)
+        for node, tx_rate, pcm, mem in (('pktgen', pktgen_tx_rate, pktgen_pcm, pktgen_mem),
+                                        ('l3fwd', l3fwd_tx_rate, l3fwd_pcm, l3fwd_mem))
+    }
+
+    # DDIO state and whether DRAM writes per packet agree with it ("high Write = DDIO OFF")
+    ddio = {}
+    for node in ('pktgen', 'l3fwd'):
+        state = (ddio_states or {}).get(node)
+        enabled = state['enabled'] if state else None
+        ddio[node] = {
+            'ddio_enabled': None if enabled is None else int(enabled),
+            'ddio_way_mask': state['way_mask'] if state else None,
+            'ddio_dram_check': check_dram_writes(enabled, efficiency[node]['dram_wr_bpp'],
+                                                 traffic['mean_frame_size']),
+        }
+        if ddio[node]['ddio_dram_check'] is False:
+            print(f'WARNING: {node.upper()} DRAM writes ({efficiency[node]["dram_wr_bpp"]} B/pkt) '
+                  f'do not match DDIO {ddio_label(enabled)}')
+        if ddio[node]['ddio_dram_check'] is not None:
+            ddio[node]['ddio_dram_check'] = int(ddio[node]['ddio_dram_check'])
 
     # PKTGEN row
     result['pktgen_row'] = [
@@ -1203,6 +1121,8 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
         str(pktgen_tx_desc_value),
         '-',  # PKTGEN doesn't have separate RX desc
         str(pktgen_lcore_count),
+        str(traffic['packet_size']),
+        str(traffic['flows']),
         f'{pktgen_tx_rate}',
         f'{pktgen_rx_rate}',
         f'{pktgen_pcm["rd_miss_rate"]}',
@@ -1213,6 +1133,13 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
         fmt_bytes(pktgen_pcm["wr_miss_bytes"]),
         f'{pktgen_mem["dram_read_bw"]}',
         f'{pktgen_mem["dram_write_bw"]}',
+        *efficiency_row(efficiency['pktgen']),
+        ddio_label(ddio['pktgen']['ddio_enabled'], ddio['pktgen']['ddio_way_mask']),
+        {None: '-', 1: 'ok', 0: 'MISMATCH'}[ddio['pktgen']['ddio_dram_check']],
+        devargs.get('pktgen', '').replace(',', ';') or '-',  # ';': rows are comma-separated
+        testbed_name,
+        f'{round(max_cv["pktgen"] * 100, 1)}',
+        'Y' if max_cv['pktgen'] <= STEADY_STATE_MAX_CV else 'N',
     ]
 
     # L3FWD row
@@ -1222,6 +1149,8 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
         str(l3fwd_tx_desc_value),
         str(l3fwd_rx_desc_value),
         str(l3fwd_lcore_count),
+        str(traffic['packet_size']),
+        str(traffic['flows']),
         f'{l3fwd_tx_rate}',
         f'{l3fwd_rx_rate}',
         f'{l3fwd_pcm["rd_miss_rate"]}',
@@ -1232,15 +1161,606 @@ def parse_dpdk_results(experiment_id, l3fwd_tx_desc_value=None, l3fwd_rx_desc_va
         fmt_bytes(l3fwd_pcm["wr_miss_bytes"]),
         f'{l3fwd_mem["dram_read_bw"]}',
         f'{l3fwd_mem["dram_write_bw"]}',
+        *efficiency_row(efficiency['l3fwd']),
+        ddio_label(ddio['l3fwd']['ddio_enabled'], ddio['l3fwd']['ddio_way_mask']),
+        {None: '-', 1: 'ok', 0: 'MISMATCH'}[ddio['l3fwd']['ddio_dram_check']],
+        devargs.get('l3fwd', '').replace(',', ';') or '-',  # ';': rows are comma-separated
+        testbed_name,
+        f'{round(max_cv["l3fwd"] * 100, 1)}',
+        'Y' if max_cv['l3fwd'] <= STEADY_STATE_MAX_CV else 'N',
+    ]
+
+    # Latency is measured at PKTGEN (round trip through L3FWD)
+    if latency_summary is not None:
+        result['pktgen_row'] += ['-' if latency_summary[key] is None else f'{latency_summary[key]}'
+                                 for key in LATENCY_PERCENTILES]
+        result['l3fwd_row'] += ['-'] * len(LATENCY_PERCENTILES)
+
+    # Raw (unformatted) values for the columnar result store, keyed by experiment_id + sweep parameters
+    # (l3_hit: mean PCM core L3 hit % of L3FWD's / pktgen's TX lcores, None if not reported)
+    sweep_params = {
+        'stage': 'eval',
+        'experiment_id': experiment_id,
+        'testbed': testbed_name,
+        'l3fwd_lcore_count': l3fwd_lcore_count,
+        'l3fwd_tx_desc': l3fwd_tx_desc_value,
+        'l3fwd_rx_desc': l3fwd_rx_desc_value,
+        'pktgen_lcore_count': pktgen_lcore_count,
+        'pktgen_tx_desc': pktgen_tx_desc_value,
+        **traffic_columns(traffic),
+    }
+    result['records'] = [
+        dict(sweep_params, node='PKTGEN', tx_rate=pktgen_tx_rate, rx_rate=pktgen_rx_rate,
+             ddio_rd_miss=pktgen_pcm['rd_miss_rate'], pcie_rd_total=pktgen_pcm['rd_total_bytes'],
+             pcie_rd_miss=pktgen_pcm['rd_miss_bytes'], ddio_wr_miss=pktgen_pcm['wr_miss_rate'],
+             pcie_wr_total=pktgen_pcm['wr_total_bytes'], pcie_wr_miss=pktgen_pcm['wr_miss_bytes'],
+             dram_rd_bw=pktgen_mem['dram_read_bw'], dram_wr_bw=pktgen_mem['dram_write_bw'],
+             l3_hit=pktgen_tx_l3_hit or None, devargs=devargs.get('pktgen'), **efficiency['pktgen'], **ddio['pktgen']),
+        dict(sweep_params, node='L3FWD', tx_rate=l3fwd_tx_rate, rx_rate=l3fwd_rx_rate,
+             ddio_rd_miss=l3fwd_pcm['rd_miss_rate'], pcie_rd_total=l3fwd_pcm['rd_total_bytes'],
+             pcie_rd_miss=l3fwd_pcm['rd_miss_bytes'], ddio_wr_miss=l3fwd_pcm['wr_miss_rate'],
+             pcie_wr_total=l3fwd_pcm['wr_total_bytes'], pcie_wr_miss=l3fwd_pcm['wr_miss_bytes'],
+             dram_rd_bw=l3fwd_mem['dram_read_bw'], dram_wr_bw=l3fwd_mem['dram_write_bw'],
+             l3_hit=l3fwd_l3_hit or None, devargs=devargs.get('l3fwd'), **efficiency['l3fwd'], **ddio['l3fwd']),
     ]
+    # Join with the run's provenance (code and machine state hashes, manifest.py)
+    provenance = provenance_keys(read_manifest(DATA_PATH, experiment_id))
+    for record in result['records']:
+        record.update(provenance)
+    # Per-sample distributions (p50/p99/min/max/std/cv) and the steady-state flag
+    for record, node in zip(result['records'], ('pktgen', 'l3fwd')):
+        series = node_series[node]
+        for column, name in (('rx_rate', 'rx_rate'), ('ddio_rd_miss', 'rd_miss_rate'), ('ddio_wr_miss', 'wr_miss_rate'),
+                             ('dram_rd_bw', 'dram_read_bw'), ('dram_wr_bw', 'dram_write_bw')):
+            record.update(summary_columns(column, series.get(name)))
+        record['max_cv'] = max_cv[node]
+        record['steady_state'] = int(max_cv[node] <= STEADY_STATE_MAX_CV)
+    if latency_summary is not None:
+        result['records'][0]['latency_samples'] = latency_summary['samples']
+        for key in ('min',) + LATENCY_PERCENTILES:
+            result['records'][0][f'latency_{key.replace(".", "")}_us'] = latency_summary[key]
 
     return result
 
-def run_eval():
-    """Main DPDK evaluation function - L3FWD + Pktgen with profiling"""
-    global experiment_id
-    global final_result
+def run_sweep(points, run_point_fn, results=None):
+    """Work-queue scheduler: hand sweep points out to idle testbed pairs
+
+    One worker thread per testbed in TESTBEDS pulls the next point and calls
+    run_point_fn(point, testbed); the returned result dict is tagged with the
+    testbed name and its point and appended to results (default: final_result). A failed
+    point is reported and skipped so the other pairs keep going.
+    """
+    if results is None:
+        results = final_result
+    work = queue.Queue()
+    for point in points:
+        work.put(point)
+
+    def worker(testbed):
+        while True:
+            try:
+                point = work.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                res = run_point_fn(point, testbed)
+            except Exception as e:
+                print(f'ERROR [{testbed["name"]}] point {point} failed: {e}')
+                continue
+            res['testbed'] = testbed['name']
+            res.setdefault('point', point)
+            with final_result_lock:
+                results.append(res)
+
+    threads = [threading.Thread(target=worker, args=(testbed,), name=testbed['name'], daemon=True)
+               for testbed in TESTBEDS]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def point_config(point, stage):
+    """Full configuration of a sweep point: its ledger key covers everything that affects the result"""
+    config = {
+        'stage': stage,
+        'point': point,
+        'imix_frames': IMIX_PROFILES.get(point['packet_size']),
+        'ddio_nodes': DDIO_NODES if point.get('ddio') is not None else None,
+        'pktgen_nic_devargs': PKTGEN_NIC_DEVARGS,
+        'l3fwd_nic_devargs': L3FWD_NIC_DEVARGS,
+        'l3fwd_build_id': build_id(get_l3fwd_config(1)['binary_path']),
+        'pktgen_build_id': build_id(get_pktgen_config(1)['binary_path']),
+    }
+    if stage == 'ndr':
+        config['ndr'] = [NDR_TRIAL_DURATION, NDR_RATE_RESOLUTION, NDR_LOSS_TOLERANCE, NDR_MAX_TRIALS]
+    else:
+        if stage == 'scaling':
+            config['scaling'] = [SCALING_PKTGEN_TX_CORE_VALUES, SCALING_TX_MARGIN, SCALING_MIN_TX_GAIN]
+        config['profilers'] = PROFILER_DURATIONS
+        config['profiler_schedule'] = PROFILER_SCHEDULE
+        config['perf_events'] = PERF_EVENTS
+        config['latency'] = [LATENCY_SAMPLE_RATE, LATENCY_MAX_SAMPLES] if point.get('latency') else None
+    return config
+
+def run_ledgered_sweep(points, run_point_fn, stage, results, reparse_fn=None):
+    """run_sweep() with resume: skip/re-parse points already in the ledger
+
+    Points recorded as done are reused (re-parsed with reparse_fn(entry) from
+    their cached raw logs if PARSER_VERSION changed); new and failed points
+    are run and every outcome is appended to LEDGER_PATH as it finishes.
+    """
+    if not RESUME_SWEEPS:
+        run_sweep(points, run_point_fn, results)
+        return
+
+    ledger = RunLedger(LEDGER_PATH)
+    pending = []
+    for point in points:
+        key = config_key(point_config(point, stage))
+        entry = ledger.get(key)
+        if not entry or entry['status'] != STATUS_DONE:
+            if entry:
+                print(f'Retrying failed point {point} (last: {entry.get("experiment_id")})')
+            pending.append(point)
+            continue
+        res = entry['result']
+        if reparse_fn and entry['parser_version'] != PARSER_VERSION:
+            res = reparse_fn(entry)
+            if res is None:
+                pending.append(point)
+                continue
+            res['testbed'] = entry['testbed']
+            ledger.record(key, STATUS_DONE if res.get('valid', True) else STATUS_FAILED, PARSER_VERSION, res,
+                          experiment_id=entry['experiment_id'], point=point, testbed=entry['testbed'])
+            print(f'Re-parsed cached point {point} ({entry["experiment_id"]})')
+        else:
+            res['cached'] = True  # Already in the result store from its own campaign
+            print(f'Skipping completed point {point} ({entry["experiment_id"]})')
+        res.setdefault('point', point)  # Tagged like run_sweep()'s results; older ledger entries lack it
+        with final_result_lock:
+            results.append(res)
+
+    print(f'Ledger {LEDGER_PATH}: {len(points) - len(pending)} of {len(points)} points cached, {len(pending)} to run')
+
+    def run_and_record(point, testbed):
+        key = config_key(point_config(point, stage))
+        try:
+            res = run_point_fn(point, testbed)
+        except Exception:
+            ledger.record(key, STATUS_FAILED, PARSER_VERSION, point=point, testbed=testbed['name'])
+            raise
+        status = STATUS_DONE if res.get('valid', True) else STATUS_FAILED
+        ledger.record(key, status, PARSER_VERSION, dict(res, testbed=testbed['name']),
+                      experiment_id=res.get('experiment_id'), point=point, testbed=testbed['name'])
+        return res
+
+    run_sweep(pending, run_and_record, results)
+
+def ledger_manifest(entry):
+    """Manifest (see manifest.py) of a ledgered eval point recorded before manifests were written"""
+    old_records = entry['result'].get('records', [])
+    return {
+        'experiment_id': entry['experiment_id'],
+        'point': entry['point'],
+        'testbed': entry['testbed'],
+        'sockets': {record['node'].lower(): record.get('socket', 0) for record in old_records},
+        'ddio_states': {record['node'].lower(): {'enabled': bool(record['ddio_enabled']),
+                                                 'way_mask': record.get('ddio_way_mask')}
+                        for record in old_records if record.get('ddio_enabled') is not None},
+        'devargs': {record['node'].lower(): record.get('devargs') for record in old_records},
+        'latency': any('latency_samples' in record for record in old_records),
+        'record_fields': {record['node'].lower(): {key: record[key] for key in LIVE_RECORD_FIELDS if key in record}
+                          for record in old_records},
+    }
+
+def parse_manifest(manifest):
+    """Parse an experiment from its raw logs and manifest (None if its pktgen log is gone)"""
+    experiment_id = manifest['experiment_id']
+    if not experiment_id or not os.path.exists(f'{DATA_PATH}/{experiment_id}.pktgen'):
+        return None
+    point = manifest['point']
+    sockets = manifest.get('sockets') or {}
+    res = parse_dpdk_results(experiment_id, point['l3fwd_tx_desc_value'], point['l3fwd_rx_desc_value'],
+                             point['pktgen_tx_desc_value'], point['l3fwd_lcore_count'],
+                             point['pktgen_lcore_count'], manifest['testbed'],
+                             pktgen_socket=sockets.get('pktgen', 0), l3fwd_socket=sockets.get('l3fwd', 0),
+                             traffic=manifest.get('traffic') or get_traffic_profile(point['packet_size'],
+                                                                                    point['flow_count']),
+                             ddio_states=manifest.get('ddio_states') or {}, devargs=manifest.get('devargs') or {},
+                             workers={role: polling_cpus(config) for role, config in manifest.get('configs', {}).items()},
+                             latency=bool(manifest.get('latency')))
+    # Live-only measurements and the run's placement are not in the logs: carry them over
+    record_fields = manifest.get('record_fields') or {}
+    for record in res['records']:
+        record.update(record_fields.get(record['node'].lower(), {}))
+    if any(record.get('no_traffic') for record in res['records']):
+        res['valid'] = False
+    if manifest.get('noise'):
+        apply_noise_guard(res, experiment_id, manifest['noise'])
+    return res
+
+def reparse_eval_point(entry):
+    """Re-parse a ledgered eval point from its raw logs (None if the logs are gone)"""
+    return parse_manifest(read_manifest(DATA_PATH, entry['experiment_id']) or ledger_manifest(entry))
+
+def run_eval_point(point, testbed):
+    """Run one L3FWD + Pktgen sweep point on a testbed pair and return its parsed result
+
+    With NOISE_GUARD and NOISE_ACTION 'retry', a run whose host environment
+    drifted is repeated up to NOISE_MAX_RETRIES times (the last run is kept,
+    with noise_retries in its records); misconfigured hosts are not retried
+    (see apply_noise_guard).
+    """
+    retries = NOISE_MAX_RETRIES if NOISE_GUARD and NOISE_ACTION == 'retry' else 0
+    for attempt in range(retries + 1):
+        res = run_eval_point_once(point, testbed)
+        for record in res['records']:
+            record['noise_retries'] = attempt
+        if not res.get('noise_retry'):
+            break
+        if attempt < retries:
+            print(f'WARNING: host noise drift in {res["experiment_id"]}, retrying point ({attempt + 1}/{retries})')
+    return res
+
+def run_eval_point_once(point, testbed):
+    """Run one L3FWD + Pktgen sweep point on a testbed pair once and return its parsed result"""
+    l3fwd_lcore_count = point['l3fwd_lcore_count']
+    l3fwd_tx_desc_value = point['l3fwd_tx_desc_value']
+    l3fwd_rx_desc_value = point['l3fwd_rx_desc_value']
+    pktgen_lcore_count = point['pktgen_lcore_count']
+    pktgen_tx_desc_value = point['pktgen_tx_desc_value']
+    traffic = get_traffic_profile(point['packet_size'], point['flow_count'])
+    latency = point.get('latency', False)
+    print(f'\n================ [{testbed["name"]}] TESTING L3FWD_LCORE={l3fwd_lcore_count}, L3FWD_TX_DESC={l3fwd_tx_desc_value}, L3FWD_RX_DESC={l3fwd_rx_desc_value}, PKTGEN_LCORE={pktgen_lcore_count}, PKTGEN_TX_DESC={pktgen_tx_desc_value}, PACKET_SIZE={traffic["packet_size"]}, FLOWS={traffic["flows"]} =================')
+
+    kill_procs(testbed)
+    ddio_states = apply_ddio(point.get('ddio'), testbed)
+    experiment_id = new_experiment_id()
+    print(f'EXPTID: {experiment_id}')
+
+    setup_arp_tables(testbed)
+
+    # Generate L3FWD configuration
+    l3fwd_config = get_l3fwd_config(l3fwd_lcore_count, testbed, point.get('l3fwd_devargs'))
+    print(f'L3FWD Config: node={l3fwd_config["node"]}, lcores={l3fwd_config["lcores"]}, config="{l3fwd_config["config"]}"')
+    print(f'L3FWD TX_DESC={l3fwd_tx_desc_value}, RX_DESC={l3fwd_rx_desc_value}, devargs={l3fwd_config["devargs"] or "-"}')
+
+    # Tail pktgen/l3fwd telemetry for the whole run
+    collector = TelemetryCollector(experiment_id, DATA_PATH, detect_steady_state=STEADY_STATE_DETECTION,
+                                   window=STEADY_STATE_WINDOW, max_cv=STEADY_STATE_MAX_CV,
+                                   start_timeout=PKTGEN_START_TIMEOUT).start()
+
+    # Generate pktgen configuration
+    pktgen_config = get_pktgen_config(pktgen_lcore_count, testbed, point.get('pktgen_devargs'))
+    print(f'PKTGEN Config: node={pktgen_config["node"]}, lcores={pktgen_config["lcores"]}, port_map="{pktgen_config["port_map"]}"')
+    print(f'PKTGEN TX_DESC={pktgen_tx_desc_value}, devargs={pktgen_config["devargs"] or "-"}')
+
+    # Lcore placement quality (None: no topology information, lcores 0..N) and repeat index
+    record_fields = {role: {'repeat': point.get('repeat', 0),
+                            'socket': config['target_socket'],
+                            'numa_local': int(config['placement']['numa_local']) if config['placement'] else None,
+                            'smt_shared': int(config['placement']['smt_shared']) if config['placement'] else None}
+                     for role, config in (('pktgen', pktgen_config), ('l3fwd', l3fwd_config))}
+    noise = noise_preflight(pktgen_config, l3fwd_config) if NOISE_GUARD else None
+
+    # Provenance and everything parse_manifest() needs besides the logs, for offline re-analysis
+    write_experiment_manifest(
+        experiment_id, 'eval', point, testbed, pktgen_config, l3fwd_config,
+        sockets={'pktgen': pktgen_config['target_socket'], 'l3fwd': l3fwd_config['target_socket']},
+        ddio_states=ddio_states,
+        devargs={'pktgen': pktgen_config['devargs'], 'l3fwd': l3fwd_config['devargs']},
+        traffic=traffic,
+        latency=latency,
+        noise=noise,
+        profilers=PROFILER_SCHEDULE,
+        durations={'pktgen': PKTGEN_DURATION, 'warmup': WARMUP_DELAY, 'warmup_max': WARMUP_MAX_DELAY,
+                   **PROFILER_DURATIONS},
+        record_fields=record_fields)
+
+    # Run L3FWD on the remote node and Pktgen with profiling; all tasks are stopped when it returns.
+    # The manifest is finalized 'failed' if the run or its parsing raises
+    try:
+        try:
+            exit_codes = asyncio.run(run_dpdk_test(experiment_id, l3fwd_config, pktgen_config, l3fwd_tx_desc_value,
+                                                   l3fwd_rx_desc_value, pktgen_tx_desc_value, traffic=traffic,
+                                                   collector=collector, latency=latency))
+        finally:
+            collector.stop()
+
+        # Parse results from both L3FWD and Pktgen
+        print(f'================ {experiment_id} TEST COMPLETE =================')
+        res = parse_dpdk_results(experiment_id, l3fwd_tx_desc_value, l3fwd_rx_desc_value, pktgen_tx_desc_value, l3fwd_lcore_count, pktgen_lcore_count, testbed['name'], collector.series,
+                                 pktgen_config['target_socket'], l3fwd_config['target_socket'], traffic, ddio_states,
+                                 {'pktgen': pktgen_config['devargs'], 'l3fwd': l3fwd_config['devargs']},
+                                 {'pktgen': polling_cpus(pktgen_config), 'l3fwd': polling_cpus(l3fwd_config)}, latency)
+        for record in res['records']:
+            record.update(record_fields[record['node'].lower()])
+        if noise is not None:
+            apply_noise_guard(res, experiment_id, noise)
+        # Detected warm-up (None: steady state never detected, profilers started at WARMUP_MAX_DELAY)
+        warmup_sec = round(collector.steady_at - collector.started_at, 1) if collector.steady_at else None
+        print(f'Warm-up: {f"{warmup_sec}s" if warmup_sec is not None else "steady state not detected"}')
+        # Aborted for sending nothing within PKTGEN_START_TIMEOUT (TelemetryCollector): a failed run
+        live_fields = {'warmup_sec': warmup_sec, 'no_traffic': int(collector.no_traffic)}
+        for record in res['records']:
+            record.update(live_fields)
+        if collector.no_traffic:
+            res['valid'] = False
+    except BaseException:
+        finalize_manifest(DATA_PATH, experiment_id, 'failed')
+        raise
+    finalize_manifest(DATA_PATH, experiment_id, 'done' if res.get('valid', True) else 'failed', exit_codes=exit_codes,
+                      record_fields={'pktgen': live_fields, 'l3fwd': live_fields})
+
+    return res
+
+def run_ndr_trial(point, testbed, rate):
+    """Run one short fixed-rate trial (no profilers) and measure packet loss
+
+    Loss: pktgen TX packets that did not come back (TX-vs-RX delta). L3FWD's
+    Hardware RX Missed is one cause of those and already counted in the
+    delta; it is kept (hw_rx_missed) to tell NIC RX drops from other losses.
+    """
+    kill_procs(testbed)
+    experiment_id = new_experiment_id()
+    print(f'EXPTID: {experiment_id} (NDR trial @ {rate}%)')
+    setup_arp_tables(testbed)
+
+    l3fwd_config = get_l3fwd_config(point['l3fwd_lcore_count'], testbed, point.get('l3fwd_devargs'))
+    pktgen_config = get_pktgen_config(point['pktgen_lcore_count'], testbed, point.get('pktgen_devargs'))
+    traffic = get_traffic_profile(point['packet_size'], point['flow_count'])
+    write_experiment_manifest(experiment_id, 'ndr-trial', point, testbed, pktgen_config, l3fwd_config, rate=rate,
+                              traffic=traffic, profilers=[], durations={'pktgen': NDR_TRIAL_DURATION})
+    try:
+        exit_codes = asyncio.run(run_dpdk_test(experiment_id, l3fwd_config, pktgen_config,
+                                               point['l3fwd_tx_desc_value'], point['l3fwd_rx_desc_value'],
+                                               point['pktgen_tx_desc_value'], duration=NDR_TRIAL_DURATION, rate=rate,
+                                               with_profilers=False, traffic=traffic))
+
+        pktgen_stats = parse_packet_stats(f'{DATA_PATH}/{experiment_id}.pktgen', 'PKTGEN')
+        l3fwd_stats = parse_packet_stats(f'{DATA_PATH}/{experiment_id}.l3fwd', 'L3FWD')
+
+        tx_pkts = pktgen_stats['tx_pkts']
+        lost_pkts = max(tx_pkts - pktgen_stats['rx_pkts'], 0)
+        loss_ratio = lost_pkts / tx_pkts if tx_pkts > 0 else 1.0
+        # A trial without statistics counts as a failure so the search never overshoots
+        no_drop = (pktgen_stats['status'] == 'success' and l3fwd_stats['status'] == 'success'
+                   and loss_ratio <= NDR_LOSS_TOLERANCE)
+
+        print(f'NDR trial {experiment_id}: rate={rate}% TX={tx_pkts:,} RX={pktgen_stats["rx_pkts"]:,} '
+              f'L3FWD HW RX Missed={l3fwd_stats["hw_rx_missed"]:,} loss={loss_ratio:.6f} -> {"PASS" if no_drop else "FAIL"}')
+    except BaseException:
+        finalize_manifest(DATA_PATH, experiment_id, 'failed')
+        raise
+    finalize_manifest(DATA_PATH, experiment_id, 'done', exit_codes=exit_codes, loss_ratio=loss_ratio, no_drop=no_drop,
+                      hw_rx_missed=l3fwd_stats['hw_rx_missed'])
+    return {
+        'experiment_id': experiment_id,
+        'rate': rate,
+        'no_drop': no_drop,
+        'loss_ratio': loss_ratio,
+        'hw_rx_missed': l3fwd_stats['hw_rx_missed'],
+        'tx_rate': round(tx_pkts / (NDR_TRIAL_DURATION * 1_000_000), 3),
+        'rx_rate': round(pktgen_stats['rx_pkts'] / (NDR_TRIAL_DURATION * 1_000_000), 3),
+    }
+
+def run_ndr_point(point, testbed):
+    """Binary-search the max no-drop TX rate (% of line rate) for one sweep point"""
+    print(f'\n================ [{testbed["name"]}] NDR SEARCH L3FWD_LCORE={point["l3fwd_lcore_count"]}, L3FWD_TX_DESC={point["l3fwd_tx_desc_value"]}, L3FWD_RX_DESC={point["l3fwd_rx_desc_value"]}, PKTGEN_LCORE={point["pktgen_lcore_count"]}, PKTGEN_TX_DESC={point["pktgen_tx_desc_value"]}, PACKET_SIZE={point["packet_size"]}, FLOWS={point["flow_count"]} =================')
+    traffic = get_traffic_profile(point['packet_size'], point['flow_count'])
+    ddio_state = apply_ddio(point.get('ddio'), testbed).get('l3fwd')
+
+    lo, hi = 0.0, 100.0  # highest passing rate, lowest failing rate
+    best = None
+    rate = 100.0
+    trials = 0
+    while trials < NDR_MAX_TRIALS:
+        trial = run_ndr_trial(point, testbed, rate)
+        trials += 1
+        if trial['no_drop']:
+            lo = rate
+            best = trial
+        else:
+            hi = rate
+        if lo >= 100.0 or hi - lo <= NDR_RATE_RESOLUTION:
+            break
+        rate = round((lo + hi) / 2, 3)
+
+    print(f'NDR result: {lo}% of line rate after {trials} trials '
+          f'({best["rx_rate"] if best else 0} Mpps)')
+    efficiency = efficiency_columns({'tx_rate': best['tx_rate'] if best else 0.0,
+                                     'packet_size': traffic['mean_frame_size']},
+                                    LINK_SPEED_GBPS, WIRE_OVERHEAD_BYTES)
+    return {
+        'experiment_id': best['experiment_id'] if best else '',
+        'ndr_row': [
+            best['experiment_id'] if best else '-',
+            str(point['l3fwd_lcore_count']),
+            str(point['l3fwd_tx_desc_value']),
+            str(point['l3fwd_rx_desc_value']),
+            str(point['pktgen_lcore_count']),
+            str(point['pktgen_tx_desc_value']),
+            str(traffic['packet_size']),
+            str(traffic['flows']),
+            f'{lo}',
+            f'{best["tx_rate"] if best else 0}',
+            f'{best["rx_rate"] if best else 0}',
+            f'{efficiency["l1_gbps"]}',
+            str(trials),
+            testbed['name'],
+        ],
+        'records': [{
+            'stage': 'ndr',
+            'experiment_id': best['experiment_id'] if best else '',
+            'testbed': testbed['name'],
+            'l3fwd_lcore_count': point['l3fwd_lcore_count'],
+            'l3fwd_tx_desc': point['l3fwd_tx_desc_value'],
+            'l3fwd_rx_desc': point['l3fwd_rx_desc_value'],
+            'pktgen_lcore_count': point['pktgen_lcore_count'],
+            'pktgen_tx_desc': point['pktgen_tx_desc_value'],
+            **traffic_columns(traffic),
+            'node': 'PKTGEN',
+            'ndr_rate_pct': lo,
+            'tx_rate': best['tx_rate'] if best else 0.0,
+            'rx_rate': best['rx_rate'] if best else 0.0,
+            'ndr_trials': trials,
+            'l2_gbps': efficiency['l2_gbps'],
+            'l1_gbps': efficiency['l1_gbps'],
+            'line_rate_pct': efficiency['line_rate_pct'],
+            'ddio_enabled': int(ddio_state['enabled']) if ddio_state else None,
+            'ddio_way_mask': ddio_state['way_mask'] if ddio_state else None,
+            **provenance_keys(read_manifest(DATA_PATH, best['experiment_id']) if best else None),
+        }],
+    }
+
+def build_sweep_points(l3fwd_lcore_values=None, pktgen_tx_core_values=None):
+    """Build the list of sweep points (cartesian product of the *_VALUES lists; core lists overridable)"""
+    return [
+        {
+            'l3fwd_lcore_count': l3fwd_lcore_count,
+            'l3fwd_tx_desc_value': l3fwd_tx_desc_value,
+            'l3fwd_rx_desc_value': l3fwd_rx_desc_value,
+            'pktgen_lcore_count': pktgen_lcore_count,
+            'pktgen_tx_desc_value': pktgen_tx_desc_value,
+            'packet_size': packet_size,
+            'flow_count': flow_count,
+            'ddio': ddio,
+        }
+        for (l3fwd_lcore_count, l3fwd_tx_desc_value, l3fwd_rx_desc_value, pktgen_lcore_count, pktgen_tx_desc_value,
+             packet_size, flow_count, ddio)
+        in itertools.product(l3fwd_lcore_values or L3FWD_LCORE_VALUES, L3FWD_TX_DESC_VALUES, L3FWD_RX_DESC_VALUES,
+                             pktgen_tx_core_values or PKTGEN_TX_CORE_VALUES, PKTGEN_TX_DESC_VALUES,
+                             PACKET_SIZE_VALUES, FLOW_COUNT_VALUES, DDIO_VALUES)
+    ]
+
+def run_ndr():
+    """NDR stage - max no-drop rate per sweep point (runs alongside run_eval)"""
+    print("Starting DPDK L3FWD + Pktgen zero-loss (NDR) search")
+    print(f"Testbed pairs: {', '.join(testbed['name'] for testbed in TESTBEDS)}")
+    print(f"Trial duration: {NDR_TRIAL_DURATION}s, resolution: {NDR_RATE_RESOLUTION}%, "
+          f"loss tolerance: {NDR_LOSS_TOLERANCE}, max trials: {NDR_MAX_TRIALS}")
+    run_ledgered_sweep(build_sweep_points(), run_ndr_point, 'ndr', ndr_result)
+
+def run_scaling_point(point, testbed):
+    """Run one L3FWD lcore count of the scaling study, adding PKTGEN TX cores until pktgen is not the bottleneck
+
+    Tries SCALING_PKTGEN_TX_CORE_VALUES in order. L3FWD is the bottleneck once
+    pktgen's TX rate exceeds L3FWD's RX rate by SCALING_TX_MARGIN; if another
+    TX core raises pktgen's TX rate by less than SCALING_MIN_TX_GAIN the
+    generator side (NIC/wire) is saturated and L3FWD keeps up with it. Returns
+    the last run's result with its bottleneck ('l3fwd', 'generator' or 'pktgen'
+    when TX cores ran out).
+    """
+    res = None
+    previous_tx_rate = None
+    bottleneck = 'pktgen'
+    for tx_cores in SCALING_PKTGEN_TX_CORE_VALUES:
+        res = run_eval_point(dict(point, pktgen_lcore_count=tx_cores), testbed)
+        pktgen_record, l3fwd_record = res['records']
+        tx_rate, l3fwd_rx_rate = pktgen_record['tx_rate'], l3fwd_record['rx_rate']
+        if tx_rate > l3fwd_rx_rate * (1 + SCALING_TX_MARGIN):
+            bottleneck = 'l3fwd'
+            break
+        if previous_tx_rate is not None and tx_rate < previous_tx_rate * (1 + SCALING_MIN_TX_GAIN):
+            bottleneck = 'generator'
+            break
+        print(f'PKTGEN TX {tx_rate} Mpps does not exceed L3FWD RX {l3fwd_rx_rate} Mpps with {tx_cores} TX cores')
+        previous_tx_rate = tx_rate
+    else:
+        print(f'WARNING: pktgen still the bottleneck with {SCALING_PKTGEN_TX_CORE_VALUES[-1]} TX cores')
+
+    print(f'Scaling point L3FWD_LCORE={point["l3fwd_lcore_count"]}: bottleneck={bottleneck}')
+    res['bottleneck'] = bottleneck
+    for record in res['records']:
+        record['stage'] = 'scaling'
+        record['bottleneck'] = bottleneck
+    scaling_fields = {'stage': 'scaling', 'bottleneck': bottleneck}
+    update_manifest(DATA_PATH, res['experiment_id'], record_fields={'pktgen': scaling_fields, 'l3fwd': scaling_fields})
+    return res
+
+def analyze_scaling(results):
+    """Efficiency curves, knee and cache-metric correlation per descriptor/traffic/DDIO setting of a scaling study
+
+    Throughput is L3FWD's forwarded (TX) Mpps. Testbeds are assumed identical:
+    run one study per NIC generation. Adds mpps_per_core, parallel_efficiency,
+    marginal_efficiency and scaling_knee to the L3FWD records and writes
+    dpdk_scaling_results.txt.
+    """
+    from scaling import correlate, find_knee, scaling_curve
+    groups = {}
+    for res in results:
+        if isinstance(res, dict) and res.get('bottleneck'):
+            record = res['records'][1]
+            size = record['imix'] or f"{round(record['packet_size'])}B"
+            traffic = f"{size}/{record['flows']} flows"
+            setting = (record['l3fwd_tx_desc'], record['l3fwd_rx_desc'], record['pktgen_tx_desc'], traffic,
+                       ddio_label(record.get('ddio_enabled'), record.get('ddio_way_mask')))
+            groups.setdefault(setting, []).append(res)
+
+    def mean_metric(runs, name):
+        values = [l3fwd[name] for _, l3fwd in runs if l3fwd.get(name) is not None]
+        return round(sum(values) / len(values), 2) if values else None
+
+    header = ['L3FWD Cores', 'TX/RX Desc', 'PKTGEN TX Desc', 'Traffic', 'DDIO', 'Runs', 'Mpps', 'Mpps/Core',
+              'Efficiency (%)', 'Marginal (%)', 'L3 Hit (%)', 'DDIO Rd Miss (%)', 'DDIO Wr Miss (%)',
+              'PKTGEN TX Cores', 'Bottleneck']
+    output_lines = [', '.join(header)]
+    summary_lines = []
+    for (tx_desc, rx_desc, pktgen_tx_desc, traffic, ddio), group in sorted(groups.items()):
+        # Runs of the same core count (resumed or repeated points) are averaged, none dropped
+        by_cores = {}
+        for res in group:
+            by_cores.setdefault(res['records'][1]['l3fwd_lcore_count'], []).append(res['records'])
+        curve = scaling_curve([(cores, l3fwd['tx_rate']) for cores, runs in by_cores.items() for _, l3fwd in runs])
+        knee = find_knee(curve, SCALING_KNEE_MIN_MARGINAL)
+        metrics = {name: {cores: mean_metric(runs, name) for cores, runs in by_cores.items()}
+                   for name in ('l3_hit', 'ddio_rd_miss', 'ddio_wr_miss')}
+        correlation = correlate(curve, metrics, knee)
+
+        for row in curve:
+            runs = by_cores[row['cores']]
+            for _, record in runs:
+                record.update(mpps_per_core=row['mpps_per_core'], parallel_efficiency=row['efficiency'],
+                              marginal_efficiency=row['marginal'], scaling_knee=int(row['cores'] == knee))
+            output_lines.append(', '.join([
+                str(row['cores']),
+                f'{tx_desc}/{rx_desc}',
+                str(pktgen_tx_desc),
+                traffic,
+                ddio,
+                str(len(runs)),
+                f'{row["mpps"]}',
+                f'{row["mpps_per_core"]}',
+                '-' if row['efficiency'] is None else f'{round(row["efficiency"] * 100, 1)}',
+                '-' if row['marginal'] is None else f'{round(row["marginal"] * 100, 1)}',
+                *('-' if metrics[name][row['cores']] is None else f'{metrics[name][row["cores"]]}'
+                  for name in ('l3_hit', 'ddio_rd_miss', 'ddio_wr_miss')),
+                '/'.join(sorted({str(pktgen['pktgen_lcore_count']) for pktgen, _ in runs})),
+                '/'.join(sorted({record['bottleneck'] for _, record in runs})),
+            ]))
+
+        summary_lines.append(f'TX/RX Desc {tx_desc}/{rx_desc}, PKTGEN TX Desc {pktgen_tx_desc}, {traffic}, '
+                             f'DDIO {ddio}: knee at {knee} L3FWD cores '
+                             f"(next core adds < {SCALING_KNEE_MIN_MARGINAL * 100:.0f}% of the first core's rate)")
+        for name, stats in correlation.items():
+            summary_lines.append(f'  {name}: r(efficiency)={"-" if stats["r"] is None else stats["r"]}, '
+                                 f'at knee={stats["at_knee"]}, after knee={stats["after_knee"]}')
+
+    output_text = '\n'.join(output_lines + [''] + summary_lines)
+    print(f'\n\n{"="*80}')
+    print("DPDK CORE SCALING RESULTS")
+    print("="*80)
+    print(output_text)
+
+    with open(f'{DATA_PATH}/dpdk_scaling_results.txt', "w") as file:
+        file.write(output_text)
+
+def run_eval(latency=ENABLE_LATENCY):
+    """Main DPDK evaluation function - L3FWD + Pktgen with profiling
 
+    latency: sample round-trip latencies in every point (latency mode); it is
+    part of the points, so their ledger keys and manifests record it.
+    """
     # Build profiler list
     enabled_profilers = []
     if ENABLE_PERF:
@@ -1253,70 +1773,484 @@ def run_eval():
 
     print("Starting DPDK L3FWD + Pktgen Tests with Profiling")
     print(f"Cluster: PKTGEN={PKTGEN_NODE} (local), L3FWD={L3FWD_NODE} (remote)")
+    print(f"Testbed pairs: {', '.join(testbed['name'] for testbed in TESTBEDS)}")
     print(f"Enabled profilers: {profilers_str}")
+    if latency:
+        print(f"Latency mode: sampling {LATENCY_SAMPLE_RATE} pkts/s (max {LATENCY_MAX_SAMPLES}) once steady")
     print(f"Testing L3FWD TX descriptor values: {L3FWD_TX_DESC_VALUES}")
     print(f"Testing L3FWD RX descriptor values: {L3FWD_RX_DESC_VALUES}")
     print(f"Testing L3FWD LCORE counts: {L3FWD_LCORE_VALUES}")
     print(f"Testing PKTGEN TX descriptor values: {PKTGEN_TX_DESC_VALUES}")
     print(f"Testing PKTGEN TX core counts: {PKTGEN_TX_CORE_VALUES}")
-    print(f"Total duration: {PKTGEN_DURATION} seconds (warmup: {WARMUP_DELAY}s, interval: {TOOL_INTERVAL}s)")
+    print(f"Testing packet sizes: {PACKET_SIZE_VALUES}, flow counts: {FLOW_COUNT_VALUES}")
+    print(f"Testing DDIO settings on {'+'.join(DDIO_NODES)}: "
+          f"{[setting if setting in (None, 'off') else hex(setting) for setting in DDIO_VALUES]}")
+    print(f"Profiler schedule: {' -> '.join('+'.join(phase) for phase in PROFILER_SCHEDULE) or 'none'}")
+    if STEADY_STATE_DETECTION:
+        print(f"Max duration: {PKTGEN_DURATION} seconds (warmup: until steady, CV <= {STEADY_STATE_MAX_CV} over "
+              f"{STEADY_STATE_WINDOW} samples, max {WARMUP_MAX_DELAY}s, interval: {TOOL_INTERVAL}s)")
+    else:
+        print(f"Total duration: {PKTGEN_DURATION} seconds (warmup: {WARMUP_DELAY}s, interval: {TOOL_INTERVAL}s)")
 
-    # Extract txqs_min_inline from pktgen config
-    pktgen_config_default = get_pktgen_config(2)
-    pci_match = re.search(r'txqs_min_inline=(\d+)', pktgen_config_default["pci_address"])
-    txqs_min_inline = int(pci_match.group(1)) if pci_match else 8
+    if REPEAT_MAX > 1:
+        print(f"Repeats: {REPEAT_MIN}-{REPEAT_MAX} per point ({REPEAT_ORDER} order) until the "
+              f"{REPEAT_CI_NODE} {REPEAT_CI_METRIC} CI is within {REPEAT_CI_TARGET * 100:g}%")
 
-    for l3fwd_lcore_count in L3FWD_LCORE_VALUES:
-        for l3fwd_tx_desc_value in L3FWD_TX_DESC_VALUES:
-            for l3fwd_rx_desc_value in L3FWD_RX_DESC_VALUES:
-                for pktgen_lcore_count in PKTGEN_TX_CORE_VALUES:
-                    for pktgen_tx_desc_value in PKTGEN_TX_DESC_VALUES:
-                        print(f'\n================ TESTING L3FWD_LCORE={l3fwd_lcore_count}, L3FWD_TX_DESC={l3fwd_tx_desc_value}, L3FWD_RX_DESC={l3fwd_rx_desc_value}, PKTGEN_LCORE={pktgen_lcore_count}, PKTGEN_TX_DESC={pktgen_tx_desc_value} =================')
+    points = build_sweep_points()
+    if latency:
+        points = [dict(point, latency=True) for point in points]
+    if REPEAT_MAX > 1:
+        run_repeated_eval(points)
+    else:
+        run_ledgered_sweep(points, run_eval_point, 'eval', final_result, reparse_eval_point)
+
+def repeat_stats(points, results):
+    """Per sweep point: {'runs', 'width' (relative CI width of the CI metric), 'metrics' {(node, metric): (mean, ci)}}"""
+    from repeats import base_point, mean_ci, relative_ci_width
+    stats = []
+    for point in points:
+        runs = [res for res in results if res.get('valid', True) and base_point(res.get('point', {})) == point]
+        metrics = {}
+        for node in ('PKTGEN', 'L3FWD'):
+            records = [record for res in runs for record in res['records'] if record['node'] == node]
+            for metric in REPEAT_METRICS:
+                metrics[(node, metric)] = mean_ci([record.get(metric) for record in records], REPEAT_CONFIDENCE)
+        ci_values = [record.get(REPEAT_CI_METRIC) for res in runs for record in res['records']
+                     if record['node'] == REPEAT_CI_NODE]
+        stats.append({'runs': len(runs), 'width': relative_ci_width(ci_values, REPEAT_CONFIDENCE),
+                      'metrics': metrics})
+    return stats
+
+def run_repeated_eval(points):
+    """Repeat mode: REPEAT_MIN runs per sweep point, then more until the CI is narrow enough (see REPEATS config)
+
+    Repeats are ledgered like any point (their index is part of the point),
+    so an interrupted campaign resumes and a single-shot result of a point
+    counts as its first repeat.
+    """
+    from repeats import order_runs
+    rng = random.Random(REPEAT_SEED)
+    results = []
+
+    done = [0] * len(points)
+    wanted = [REPEAT_MIN] * len(points)
+    while True:
+        pending = [(point, list(range(done[index], wanted[index]))) for index, point in enumerate(points)
+                   if wanted[index] > done[index]]
+        if not pending:
+            break
+        runs = order_runs(pending, REPEAT_ORDER, rng)
+        print(f'\nRepeat round: {len(runs)} runs of {len(pending)} points ({REPEAT_ORDER} order)')
+        run_ledgered_sweep(runs, run_eval_point, 'eval', results, reparse_eval_point)
+        done = list(wanted)
+        for index, row in enumerate(repeat_stats(points, results)):
+            if wanted[index] < REPEAT_MAX and (row['width'] is None or row['width'] > REPEAT_CI_TARGET):
+                wanted[index] += 1
+
+    with final_result_lock:
+        final_result.extend(results)
+    write_repeat_results(points, repeat_stats(points, results))
+
+def write_repeat_results(points, stats):
+    """Print and save mean and CI per sweep point, node and REPEAT_METRICS"""
+    confidence = f'{REPEAT_CONFIDENCE * 100:g}%'
+    header = ['Point', 'Node', 'Runs', *[f'{metric} {label}' for metric in REPEAT_METRICS
+                                         for label in ('mean', f'+/- {confidence} CI')],
+              f'{REPEAT_CI_NODE} {REPEAT_CI_METRIC} CI width (%)', 'Converged']
+    output_lines = [', '.join(header)]
+    for point, row in zip(points, stats):
+        label = (f'L3FWD {point["l3fwd_lcore_count"]}c {point["l3fwd_tx_desc_value"]}/{point["l3fwd_rx_desc_value"]}'
+                 f' PKTGEN {point["pktgen_lcore_count"]}c {point["packet_size"]} {point["flow_count"]} flows'
+                 f' DDIO {point["ddio"] or "-" if point["ddio"] in (None, "off") else hex(point["ddio"])}')
+        converged = row['width'] is not None and row['width'] <= REPEAT_CI_TARGET
+        for node in ('PKTGEN', 'L3FWD'):
+            values = []
+            for metric in REPEAT_METRICS:
+                mean, ci = row['metrics'][(node, metric)]
+                values += ['-' if mean is None else f'{mean:.3f}', '-' if ci is None else f'{ci:.3f}']
+            output_lines.append(', '.join([
+                label,
+                node,
+                str(row['runs']),
+                *values,
+                '-' if row['width'] is None else f'{row["width"] * 100:.2f}',
+                'yes' if converged else 'no',
+            ]))
+    output_text = '\n'.join(output_lines)
 
-                        kill_procs()
-                        experiment_id = datetime.datetime.now().strftime('%Y%m%d-%H%M%S.%f')
-                        print(f'EXPTID: {experiment_id}')
+    print(f'\n\n{"="*80}')
+    print(f"DPDK REPEAT RESULTS (target CI width {REPEAT_CI_TARGET * 100:g}%, {REPEAT_MIN}-{REPEAT_MAX} runs)")
+    print("="*80)
+    print(output_text)
 
-                        setup_arp_tables()
+    with open(f'{DATA_PATH}/dpdk_repeat_results.txt', "w") as file:
+        file.write(output_text)
 
-                        # Generate L3FWD configuration
-                        l3fwd_config = get_l3fwd_config(l3fwd_lcore_count)
-                        print(f'L3FWD Config: node={l3fwd_config["node"]}, lcores={l3fwd_config["lcores"]}, config="{l3fwd_config["config"]}"')
-                        print(f'L3FWD TX_DESC={l3fwd_tx_desc_value}, RX_DESC={l3fwd_rx_desc_value}')
+def run_scaling():
+    """Scaling study - sweep L3FWD lcore counts with pktgen kept out of the bottleneck, then efficiency curves"""
+    print("Starting DPDK L3FWD core scaling study")
+    print(f"Testbed pairs: {', '.join(testbed['name'] for testbed in TESTBEDS)}")
+    print(f"L3FWD LCORE counts: {SCALING_L3FWD_LCORE_VALUES}, PKTGEN TX core candidates: {SCALING_PKTGEN_TX_CORE_VALUES}")
+    points = build_sweep_points(SCALING_L3FWD_LCORE_VALUES, SCALING_PKTGEN_TX_CORE_VALUES[:1])
+    run_ledgered_sweep(points, run_scaling_point, 'scaling', final_result)
+    analyze_scaling(final_result)
+
+def run_devargs_search():
+    """Devargs tuning mode - successive halving over DEVARGS_SEARCH_SPACE for every sweep point
+
+    Each rung runs the surviving candidates (devargs of the
+    DEVARGS_SEARCH_TARGET NIC) until they have `runs` runs each, ranks them
+    per sweep point (rank_candidates: Mpps, then PCIe bytes per packet) and
+    keeps the best 1/DEVARGS_SEARCH_ETA with DEVARGS_SEARCH_ETA times the runs.
+    Runs are ledgered, so an interrupted search resumes where it stopped.
+    """
+    from devargs_search import format_devargs, rank_candidates, sample_candidates, survivors
+    devargs_key = f'{DEVARGS_SEARCH_TARGET}_devargs'
+    base_devargs = L3FWD_NIC_DEVARGS if DEVARGS_SEARCH_TARGET == 'l3fwd' else PKTGEN_NIC_DEVARGS
+    target_node = DEVARGS_SEARCH_TARGET.upper()
+    candidates = [format_devargs(base_devargs, knobs) for knobs in
+                  sample_candidates(DEVARGS_SEARCH_SPACE, DEVARGS_SEARCH_CANDIDATES, DEVARGS_SEARCH_SEED)]
+    print("Starting DPDK devargs search (successive halving)")
+    print(f"Testbed pairs: {', '.join(testbed['name'] for testbed in TESTBEDS)}")
+    print(f"Target: {target_node} NIC, {len(candidates)} candidates from {DEVARGS_SEARCH_SPACE}, "
+          f"eta={DEVARGS_SEARCH_ETA}, max runs={DEVARGS_MAX_RUNS}")
+
+    base_points = build_sweep_points()
+    alive = {index: list(candidates) for index in range(len(base_points))}
+    results = []
+
+    done_runs, runs = 0, 1
+    while True:
+        points = [dict(base_points[index], **{devargs_key: devargs}, repeat=repeat)
+                  for index, group in alive.items() for devargs in group for repeat in range(done_runs, runs)]
+        print(f'\nDevargs search rung: {sum(map(len, alive.values()))} candidates x {runs} runs')
+        run_ledgered_sweep(points, run_eval_point, 'devargs', results, reparse_eval_point)
+        done_runs = runs
+
+        ranking = {}
+        for index, group in alive.items():
+            stats = {devargs: [] for devargs in group}
+            for res in results:
+                point = res.get('point', {})
+                if not res.get('valid', True) or point.get(devargs_key) not in stats:
+                    continue
+                base = {key: value for key, value in point.items() if key not in (devargs_key, 'repeat')}
+                if base != base_points[index]:
+                    continue
+                record = next(record for record in res['records'] if record['node'] == target_node)
+                pcie = [record.get('pcie_rd_bpp'), record.get('pcie_wr_bpp')]
+                stats[point[devargs_key]].append((record['tx_rate'], None if None in pcie else sum(pcie)))
+            ranking[index] = rank_candidates({devargs: samples for devargs, samples in stats.items() if samples},
+                                             DEVARGS_MPPS_TOLERANCE)
+        if runs >= DEVARGS_MAX_RUNS or all(len(group) <= 1 for group in alive.values()):
+            break
+        alive = {index: survivors(ranked, DEVARGS_SEARCH_ETA) for index, ranked in ranking.items() if ranked}
+        runs = min(runs * DEVARGS_SEARCH_ETA, DEVARGS_MAX_RUNS)
+
+    with final_result_lock:
+        final_result.extend(results)
+    write_devargs_results(base_points, ranking)
+
+def write_devargs_results(base_points, ranking):
+    """Print and save the final devargs ranking of every sweep point"""
+    header = ['Point', 'Rank', 'Devargs', 'Mpps', 'PCIe (B/pkt)', 'Runs']
+    output_lines = [', '.join(header)]
+    for index, ranked in sorted(ranking.items()):
+        point = base_points[index]
+        label = (f'L3FWD {point["l3fwd_lcore_count"]}c/PKTGEN {point["pktgen_lcore_count"]}c/'
+                 f'{point["packet_size"]}/{point["flow_count"]} flows')
+        for rank, row in enumerate(ranked, 1):
+            output_lines.append(', '.join([
+                label,
+                str(rank),
+                row['devargs'].replace(',', ';') or '-',
+                f'{row["mpps"]}',
+                '-' if row['pcie_bpp'] is None else f'{row["pcie_bpp"]}',
+                str(row['runs']),
+            ]))
+    output_text = '\n'.join(output_lines)
+
+    print(f'\n\n{"="*80}')
+    print(f"DPDK DEVARGS SEARCH RESULTS ({DEVARGS_SEARCH_TARGET.upper()} NIC)")
+    print("="*80)
+    print(output_text)
+
+    with open(f'{DATA_PATH}/dpdk_devargs_results.txt', "w") as file:
+        file.write(output_text)
+
+def run_compare(candidate=None, baselines=None):
+    """Compare a candidate campaign against baseline campaigns of the result store
+
+    Records are matched by regression.point_key(); COMPARE_METRICS of every
+    point present on both sides are tested on their per-run values (see
+    compare_metric; 'untested' below COMPARE_MIN_REPEATS runs a side), leaving
+    out runs the noise guard marked as drifted; the Drift
+    column flags points whose code or host provenance keys differ between
+    the sides. Writes dpdk_compare_results.txt; returns 1 if any metric
+    regressed, 2 if no metric could be tested (INCONCLUSIVE, e.g. single-shot
+    campaigns), else 0.
+    """
+    from result_store import list_campaigns, load_records
+    from regression import COMPARE_METRICS, compare_metric, point_key
+    campaigns = list_campaigns(RESULT_STORE_PATH)
+    ids = [campaign for campaign, _ in campaigns]
+    if not campaigns:
+        print(f"No campaigns in {RESULT_STORE_PATH}")
+        return 1
+    candidate = candidate or ids[-1]
+    if candidate not in ids:
+        print(f"ERROR: campaign {candidate} not in {RESULT_STORE_PATH}")
+        return 1
+    if not baselines:
+        previous = ids[:ids.index(candidate)]
+        baselines = previous[-COMPARE_BASELINE_RUNS:]
+    if not baselines:
+        print(f"ERROR: no baseline campaign before {candidate}")
+        return 1
+
+    def runs_by_point(campaign_ids):
+        points = {}
+        for campaign, path in campaigns:
+            if campaign not in campaign_ids:
+                continue
+            for record in load_records(path):
+                if record.get('stage') == 'ndr' or not record.get('experiment_id'):
+                    continue
+                if record.get('noise_drift'):
+                    noisy[0] += 1
+                    continue
+                points.setdefault(point_key(record), []).append(record)
+        return points
+
+    noisy = [0]  # Records left out for host noise drift (noise_guard.py)
+    baseline_points = runs_by_point(set(baselines))
+    candidate_points = runs_by_point({candidate})
+    print(f"Comparing {candidate} against {', '.join(baselines)}: "
+          f"{len(set(baseline_points) & set(candidate_points))} common points, {noisy[0]} drifted records left out")
+
+    header = ['Point', 'Node', 'Metric', 'Baseline', 'Candidate', 'Change (%)', 'Hedges g', 'p', 'n (base/cand)',
+              'Verdict', 'Drift']
+    output_lines = [', '.join(header)]
+    regressions, tested = 0, 0
+    for key in sorted(set(baseline_points) & set(candidate_points)):
+        record = candidate_points[key][0]
+        label = (f'L3FWD {record.get("l3fwd_lcore_count")}c {record.get("l3fwd_tx_desc")}/{record.get("l3fwd_rx_desc")}'
+                 f' PKTGEN {record.get("pktgen_lcore_count")}c {record.get("imix") or record.get("packet_size") or 64}'
+                 f' {record.get("flows") or "-"} flows')
+        # What changed between the sides besides the config (manifest provenance): code, machine or unknown
+        drift = []
+        for column, name in (('code_key', 'code'), ('host_key', 'host')):
+            keys = [{run.get(column) for run in points[key]} for points in (baseline_points, candidate_points)]
+            if None in keys[0] | keys[1]:
+                drift.append(f'{name}?')
+            elif keys[0] != keys[1]:
+                drift.append(name)
+        for metric, higher_is_better in COMPARE_METRICS.items():
+            sides = [[run[metric] for run in points[key] if run.get(metric) is not None]
+                     for points in (baseline_points, candidate_points)]
+            result = compare_metric(*sides, higher_is_better, COMPARE_ALPHA, COMPARE_MIN_CHANGE, COMPARE_MIN_REPEATS)
+            regressions += result['verdict'] == 'regression'
+            tested += result['verdict'] != 'untested'
+            output_lines.append(', '.join([
+                label,
+                record['node'],
+                metric,
+                *['-' if result[name] is None else f'{result[name]}'
+                  for name in ('baseline', 'candidate', 'change_pct', 'g', 'p')],
+                '/'.join(map(str, result['n'])),
+                result['verdict'].upper() if result['verdict'] == 'regression' else result['verdict'],
+                '+'.join(drift) or '-',
+            ]))
+    if tested:
+        output_lines += ['', f'{"FAIL" if regressions else "PASS"}: {regressions} regressed of {tested} tested '
+                             f'metrics (p < {COMPARE_ALPHA}, change > {COMPARE_MIN_CHANGE * 100:g}%)']
+    else:
+        output_lines += ['', f'INCONCLUSIVE: no metric has {COMPARE_MIN_REPEATS}+ runs of a common point on both '
+                             f'sides (run the campaigns with REPEAT_MAX > 1)']
+    output_text = '\n'.join(output_lines)
+
+    print(f'\n\n{"="*80}')
+    print(f"DPDK REGRESSION COMPARE ({candidate} vs {', '.join(baselines)})")
+    print("="*80)
+    print(output_text)
 
-                        # Start L3FWD on remote node
-                        run_l3fwd(l3fwd_tx_desc_value, l3fwd_rx_desc_value, l3fwd_config)
+    with open(f'{DATA_PATH}/dpdk_compare_results.txt', "w") as file:
+        file.write(output_text)
+    if not tested:
+        return 2
+    return 1 if regressions else 0
+
+def analyze_experiment(data_path, manifest):
+    """Process pool worker: parse_manifest() in data_path -> (experiment_id, result or None, parser output or error)"""
+    global DATA_PATH
+    DATA_PATH = data_path
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            res = parse_manifest(manifest)
+    except Exception as e:
+        return manifest['experiment_id'], None, f'{type(e).__name__}: {e}\n{output.getvalue()[-2000:]}'
+    if res is not None:
+        res['testbed'] = manifest['testbed']
+    return manifest['experiment_id'], res, output.getvalue()
+
+def run_analyze(data_path=None):
+    """Offline re-analysis: re-parse every experiment of a results directory in a process pool
+
+    Experiments are discovered by their raw log files (manifest.py); each is
+    parsed from its manifest, or from its ledger entry if it predates
+    manifests. Results replace final_result, so exiting() writes their
+    results table like a live sweep's; they are not appended to the result
+    store, which already holds the original campaign (compare would count
+    the same experiments twice).
+    """
+    global DATA_PATH
+    DATA_PATH = data_path or DATA_PATH
+    experiment_ids = discover_experiments(DATA_PATH)
+    ledger = RunLedger(LEDGER_PATH) if os.path.exists(LEDGER_PATH) else None
+    ledger_entries = {entry['experiment_id']: entry for entry in (ledger.entries.values() if ledger else [])
+                      if entry.get('experiment_id') and entry.get('point') and entry.get('result')}
+    manifests, skipped = [], []
+    for experiment_id in experiment_ids:
+        manifest = read_manifest(DATA_PATH, experiment_id)
+        if manifest is None and experiment_id in ledger_entries:
+            manifest = ledger_manifest(ledger_entries[experiment_id])
+        if manifest is None or manifest.get('stage', 'eval') != 'eval':
+            skipped.append(experiment_id)
+        else:
+            manifests.append(manifest)
+    print(f"Analyzing {len(manifests)} of {len(experiment_ids)} experiments in {DATA_PATH} "
+          f"({len(skipped)} NDR trials or without manifest/ledger entry)")
+
+    results = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=ANALYZE_WORKERS) as pool:
+        futures = {pool.submit(analyze_experiment, DATA_PATH, manifest): manifest['experiment_id']
+                   for manifest in manifests}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                experiment_id, res, output = future.result()
+            except Exception as e:  # e.g. a worker process died
+                experiment_id, res, output = futures[future], None, f'{type(e).__name__}: {e}'
+            if res is None:
+                print(f"ERROR {experiment_id}: {output.strip() or 'raw logs missing'}")
+                continue
+            results[experiment_id] = res
+            print(f"Parsed {experiment_id} ({res['testbed']})")
+    final_result.extend(results[experiment_id] for experiment_id in sorted(results))
+    print(f"Re-parsed {len(results)} experiments ({len(manifests) - len(results)} failed)")
+
+def save_to_result_store():
+    """Append this campaign's raw result records to the columnar result store"""
+    from result_store import append_records
+    records = [record for res in final_result + ndr_result if isinstance(res, dict) and not res.get('cached')
+               for record in res.get('records', [])]
+    if not records:
+        return
+    metadata = {
+        'profiler_schedule': PROFILER_SCHEDULE,
+        'pktgen_duration': PKTGEN_DURATION,
+        'imix_profiles': IMIX_PROFILES,
+        'pktgen_nic_devargs': PKTGEN_NIC_DEVARGS,
+        'l3fwd_nic_devargs': L3FWD_NIC_DEVARGS,
+        'steady_state_detection': STEADY_STATE_DETECTION,
+        'steady_state_window': STEADY_STATE_WINDOW,
+        'steady_state_max_cv': STEADY_STATE_MAX_CV,
+    }
+    path = append_records(RESULT_STORE_PATH, campaign_id, records, metadata)
+    print(f"Appended {len(records)} records to result store: {path}")
 
-                        # Generate pktgen configuration
-                        pktgen_config = get_pktgen_config(pktgen_lcore_count)
-                        print(f'PKTGEN Config: lcores={pktgen_config["lcores"]}, port_map="{pktgen_config["port_map"]}"')
-                        print(f'txqs_min_inline={txqs_min_inline}, TX_DESC={pktgen_tx_desc_value}')
+def write_ndr_results():
+    """Print and save NDR search results"""
+    header = [
+        'Expt ID',
+        'L3FWD # Cores',
+        'L3FWD TX_DESC',
+        'L3FWD RX_DESC',
+        'PKTGEN # Cores',
+        'PKTGEN TX_DESC',
+        'Packet Size',
+        'Flows',
+        'NDR Rate (%)',
+        'NDR TX Rate (Mpps)',
+        'NDR RX Rate (Mpps)',
+        'NDR TX Gbps (L1)',
+        'Trials',
+        'Testbed',
+    ]
+    output_lines = [', '.join(header)]
+    for res in ndr_result:
+        output_lines.append(', '.join(res.get('ndr_row', [])))
+    output_text = '\n'.join(output_lines)
 
-                        # Run Pktgen with profiling
-                        run_pktgen(pktgen_tx_desc_value, pktgen_config)
+    print(f'\n\n{"="*80}')
+    print("DPDK NDR (ZERO-LOSS) RESULTS")
+    print("="*80)
+    print(output_text)
 
-                        # Stop processes
-                        kill_procs()
-                        time.sleep(3)
+    with open(f'{DATA_PATH}/dpdk_ndr_results.txt', "w") as file:
+        file.write(output_text)
 
-                        # Parse results from both L3FWD and Pktgen
-                        print(f'================ {experiment_id} TEST COMPLETE =================')
-                        res = parse_dpdk_results(experiment_id, l3fwd_tx_desc_value, l3fwd_rx_desc_value, pktgen_tx_desc_value, l3fwd_lcore_count, pktgen_lcore_count)
+def run_report():
+    """Line-rate report of every stored eval/scaling record, re-derived with the current link settings
 
-                        # Append structured result to final_result list
-                        final_result.append(res)
+    Gbps, % of line rate and per-packet PCIe/DRAM bytes are recomputed from
+    the stored rates and bandwidths with LINK_SPEED_GBPS/WIRE_OVERHEAD_BYTES,
+    so campaigns from other link speeds or from before these columns existed
+    are comparable (records without packet_size were 64B frames). Writes
+    dpdk_line_rate_report.txt.
+    """
+    from result_store import query
+    columns = query(RESULT_STORE_PATH, where=[('stage', '!=', 'ndr')])
+    if not columns:
+        print(f"No eval records in {RESULT_STORE_PATH}")
+        return
 
-                        # Wait between tests
-                        time.sleep(5)
-    
-        
+    def value(name, row, default=None):
+        if name not in columns:
+            return default
+        item = columns[name][row].item()
+        return default if item == '' or (isinstance(item, float) and math.isnan(item)) else item
+
+    header = ['Expt ID', 'Node', 'Testbed', 'Packet Size', 'Flows', 'TX Rate (Mpps)', 'TX Gbps (L2)',
+              'TX Gbps (L1)', 'Line Rate (%)', 'PCIe Rd (B/pkt)', 'PCIe Wr (B/pkt)', 'DRAM Rd (B/pkt)',
+              'DRAM Wr (B/pkt)']
+    output_lines = [', '.join(header)]
+    for row in range(len(columns['experiment_id'])):
+        record = {name: value(name, row) for name in ('tx_rate', 'pcie_rd_total', 'pcie_wr_total',
+                                                      'dram_rd_bw', 'dram_wr_bw')}
+        record['packet_size'] = value('packet_size', row, 64)
+        efficiency = efficiency_columns(record, LINK_SPEED_GBPS, WIRE_OVERHEAD_BYTES)
+        output_lines.append(', '.join([
+            value('experiment_id', row, '-'),
+            value('node', row, '-'),
+            value('testbed', row, '-'),
+            value('imix', row) or f'{record["packet_size"]:g}',
+            '-' if value('flows', row) is None else f'{value("flows", row):g}',
+            f'{record["tx_rate"]}',
+            '-' if efficiency['l2_gbps'] is None else f'{efficiency["l2_gbps"]}',
+        ] + efficiency_row(efficiency)))
+    output_text = '\n'.join(output_lines)
 
+    print(f'\n\n{"="*80}')
+    print(f"DPDK LINE RATE REPORT ({LINK_SPEED_GBPS:g} Gbps link, {WIRE_OVERHEAD_BYTES} B wire overhead per frame)")
+    print("="*80)
+    print(output_text)
 
+    with open(f'{DATA_PATH}/dpdk_line_rate_report.txt', "w") as file:
+        file.write(output_text)
 
-def exiting():
-    """Exit handler for cleanup"""
+def exiting(store=True):
+    """Exit handler for cleanup; store: append the results to the result store (not for re-analysis)"""
     global final_result
     print('EXITING')
+    close_agents()
+    restore_ddio()
+
+    if store:
+        save_to_result_store()
+
+    if ndr_result:
+        write_ndr_results()
 
     if not final_result:
         print("No results to display")
@@ -1329,6 +2263,8 @@ def exiting():
         'TX_DESC',
         'RX_DESC',
         '# Cores',
+        'Packet Size',
+        'Flows',
         'TX Rate (Mpps)',
         'RX Rate (Mpps)',
         'DDIO Rd Miss (%)',
@@ -1339,7 +2275,22 @@ def exiting():
         'PCIe Wr (B) Miss',
         'DRAM Rd (MB/s)',
         'DRAM Wr (MB/s)',
+        'TX Gbps (L1)',
+        'Line Rate (%)',
+        'PCIe Rd (B/pkt)',
+        'PCIe Wr (B/pkt)',
+        'DRAM Rd (B/pkt)',
+        'DRAM Wr (B/pkt)',
+        'DDIO',
+        'DDIO vs DRAM Wr',
+        'Devargs',
+        'Testbed',
+        'Max CV (%)',
+        'Steady',
     ]
+    if any('latency_samples' in res['records'][0] for res in final_result
+           if isinstance(res, dict) and res.get('records')):
+        header += [f'Latency {key} (us)' for key in LATENCY_PERCENTILES]
 
     output_lines = []
     output_lines.append(', '.join(header))
@@ -1395,6 +2346,15 @@ if __name__ == '__main__':
 
     if len(sys.argv) > 1 and sys.argv[1] == 'build':
         exit(run_compile())
+    if len(sys.argv) > 1 and sys.argv[1] == 'report':
+        run_report()
+        exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == 'compare':
+        exit(run_compare(*sys.argv[2:3], sys.argv[3:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'analyze':
+        run_analyze(*sys.argv[2:3])
+        exiting(store=False)
+        exit(0)
 
     atexit.register(exiting)
 
@@ -1404,4 +2364,13 @@ if __name__ == '__main__':
         print(f"L3FWD Node: disabled")
     print(f"Pktgen Node: {PKTGEN_NODE} (local)")
     print(f"Data Path: {DATA_PATH}")
-    run_eval()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == 'ndr':
+        run_ndr()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'scaling':
+        run_scaling()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'devargs':
+        run_devargs_search()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'latency':
+        run_eval(latency=True)
+    else:
+        run_eval()
\ No newline at end of file
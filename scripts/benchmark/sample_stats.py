@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Per-sample time series with cached summary statistics
+Parsers keep every per-interval sample as a NumPy array (SampleSeries) instead
+of reducing to a mean; summaries (mean/p50/p99/min/max/stddev/CV) are computed
+once, vectorized, and cached. Raw series are saved per experiment to
+<experiment_id>.samples.npz
+
+Warm-up trimming uses the same rolling-CV steady-state criterion as the live
+detector in telemetry.py (steady_state_start), with the window and CV limit
+passed in (test_config.STEADY_STATE_WINDOW/STEADY_STATE_MAX_CV)
+"""
+
+import functools
+
+import numpy as np
+
+WARMUP_SAMPLES = 2  # Fallback warm-up trim when a series never meets the steady-state criterion
+
+SUMMARY_KEYS = ('n', 'mean', 'p50', 'p99', 'min', 'max', 'std', 'cv')
+
+
+def steady_state_start(values, window, max_cv):
+    """Index where the series becomes steady, or None if it never does
+
+    Steady = the first rolling window of `window` samples whose coefficient of
+    variation is <= max_cv. Windows with a zero mean (e.g. traffic not started
+    yet) never count as steady.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if window < 2 or len(values) < window:
+        return None
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    mean = np.abs(windows.mean(axis=1))
+    std = windows.std(axis=1, ddof=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cv = np.where(mean > 0, std / mean, np.inf)
+    steady = np.flatnonzero(cv <= max_cv)
+    return int(steady[0]) if len(steady) else None
+
+
+def warmup_samples(values, window, max_cv):
+    """Leading samples to trim: up to the steady-state start, else WARMUP_SAMPLES (if more exist)"""
+    start = steady_state_start(values, window, max_cv)
+    if start is not None:
+        return start
+    return WARMUP_SAMPLES if len(values) > WARMUP_SAMPLES else 0
+
+
+class SampleSeries:
+    """Per-interval samples of one metric
+
+    raw holds every sample; values excludes the first `skip` warm-up samples
+    (see warmup_samples()).
+    """
+
+    def __init__(self, values, skip=0):
+        self.raw = np.asarray(values, dtype=np.float64)
+        self.skip = skip if len(self.raw) > skip else 0
+
+    def __len__(self):
+        return len(self.raw)
+
+    @property
+    def values(self):
+        return self.raw[self.skip:]
+
+    @functools.cached_property
+    def summary(self):
+        """Dict of SUMMARY_KEYS over values (zeros when empty); cv = std / mean"""
+        values = self.values
+        if not len(values):
+            return dict.fromkeys(SUMMARY_KEYS, 0.0) | {'n': 0}
+        mean = values.mean()
+        std = values.std(ddof=1) if len(values) > 1 else 0.0
+        p50, p99 = np.percentile(values, [50, 99])
+        return {
+            'n': len(values),
+            'mean': float(mean),
+            'p50': float(p50),
+            'p99': float(p99),
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'std': float(std),
+            'cv': float(std / mean) if mean else 0.0,
+        }
+
+    @property
+    def mean(self):
+        return self.summary['mean']
+
+    @property
+    def cv(self):
+        return self.summary['cv']
+
+
+def ratio_series(numerator, denominator, scale=100.0):
+    """Per-sample ratio (e.g. DDIO miss %) of two aligned series; empty if misaligned
+
+    The ratio keeps the denominator's warm-up trim.
+    """
+    num, den = numerator.raw, denominator.raw
+    skip = denominator.skip
+    if len(num) != len(den):
+        return SampleSeries([], 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(den > 0, num / den * scale, 0.0)
+    return SampleSeries(ratio, skip)
+
+
+def summary_columns(prefix, series):
+    """Flatten a series summary into result-store columns: <prefix>_p50, <prefix>_p99, ...
+
+    A missing or empty series gives None columns (NaN in the store).
+    """
+    keys = ('p50', 'p99', 'min', 'max', 'std', 'cv')
+    if series is None or not len(series.values):
+        return {f'{prefix}_{key}': None for key in keys}
+    summary = series.summary
+    return {f'{prefix}_{key}': summary[key] for key in keys}
+
+
+def save_samples(path, series_by_name):
+    """Save raw per-sample arrays ({'pktgen.dram_rd_bw': SampleSeries, ...}) to an .npz file"""
+    arrays = {name: series.raw for name, series in series_by_name.items() if len(series)}
+    if arrays:
+        np.savez(path, **arrays)
+
+
+def load_samples(path, skip=0):
+    """Load a samples .npz file back into SampleSeries"""
+    with np.load(path) as data:
+        return {name: SampleSeries(data[name], skip) for name in data.files}
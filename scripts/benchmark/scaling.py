@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Core-count scaling analysis for the scaling study (run_test.py scaling)
+From the forwarded Mpps at each L3FWD lcore count, computes Mpps per core,
+parallel efficiency (vs. the smallest core count) and marginal efficiency per
+added core, finds the knee where adding cores stops helping, and correlates
+efficiency with per-point cache metrics (L3 hit %, DDIO miss %)
+"""
+
+import numpy as np
+
+
+def scaling_curve(points):
+    """Efficiency curve from [(cores, mpps)] (sorted by cores; duplicate core counts averaged)
+
+    Returns [{'cores', 'mpps', 'mpps_per_core', 'efficiency', 'marginal'}]:
+    efficiency = mpps / (cores * baseline per-core rate); marginal = Mpps gained
+    per added core since the previous count, relative to the baseline per-core
+    rate (None for the first count).
+    """
+    by_cores = {}
+    for cores, mpps in points:
+        by_cores.setdefault(cores, []).append(mpps)
+    curve = []
+    for cores in sorted(by_cores):
+        mpps = float(np.mean(by_cores[cores]))
+        curve.append({'cores': cores, 'mpps': round(mpps, 3), 'mpps_per_core': round(mpps / cores, 3)})
+    if not curve or curve[0]['mpps_per_core'] <= 0:
+        for row in curve:
+            row['efficiency'] = row['marginal'] = None
+        return curve
+
+    baseline = curve[0]['mpps'] / curve[0]['cores']
+    previous = None
+    for row in curve:
+        row['efficiency'] = round(row['mpps'] / (row['cores'] * baseline), 3)
+        row['marginal'] = None
+        if previous:
+            row['marginal'] = round((row['mpps'] - previous['mpps']) / (row['cores'] - previous['cores']) / baseline, 3)
+        previous = row
+    return curve
+
+
+def find_knee(curve, min_marginal):
+    """Core count after which adding cores stops helping (None if the curve is empty)
+
+    The knee is the last count before the first step whose marginal efficiency
+    drops below min_marginal (SCALING_KNEE_MIN_MARGINAL); if every step clears
+    it, the largest count tested.
+    """
+    if not curve:
+        return None
+    for previous, row in zip(curve, curve[1:]):
+        if row['marginal'] is not None and row['marginal'] < min_marginal:
+            return previous['cores']
+    return curve[-1]['cores']
+
+
+def correlate(curve, metrics, knee=None):
+    """Relate cache metrics to scaling: {metric: {'r', 'at_knee', 'after_knee'}}
+
+    metrics: {name: {cores: value}}. r is the Pearson correlation of the metric
+    with parallel efficiency across core counts (None with < 3 points or no
+    variation); at_knee/after_knee are its values at the knee and the next
+    count tested, showing what changes where scaling breaks down.
+    """
+    cores = [row['cores'] for row in curve]
+    efficiency = {row['cores']: row['efficiency'] for row in curve}
+    after = cores[cores.index(knee) + 1] if knee in cores and cores.index(knee) + 1 < len(cores) else None
+    result = {}
+    for name, values in metrics.items():
+        common = [c for c in cores if values.get(c) is not None and efficiency[c] is not None]
+        r = None
+        if len(common) >= 3:
+            x = np.array([values[c] for c in common], dtype=np.float64)
+            y = np.array([efficiency[c] for c in common], dtype=np.float64)
+            if x.std() > 0 and y.std() > 0:
+                r = round(float(np.corrcoef(x, y)[0, 1]), 3)
+        result[name] = {'r': r, 'at_knee': values.get(knee), 'after_knee': values.get(after)}
+    return result
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Live rate telemetry for PKTGEN/L3FWD runs
+Tails the pktgen log (TELEMETRY lines from simple-test.lua) and the l3fwd
+telemetry log (DPDK telemetry socket polled on the L3FWD node) while a test
+runs, and builds per-second rate time series for steady-state Mpps. The
+collector also detects steady state live and writes <experiment_id>.steady,
+which run_test.py waits for before starting the profiler schedule's phases
+(and pktgen's latency sampler before sampling)
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+# simple-test.lua: "TELEMETRY <sec> <tx_pkts> <rx_pkts>" (may share a line with -T screen output)
+PKTGEN_TELEMETRY_RE = re.compile(r'TELEMETRY\s+(\d+)\s+(\d+)\s+(\d+)')
+# L3FWD node poller: "<epoch> {"/ethdev/stats": {"ipackets": ..., "opackets": ...}}"
+L3FWD_TELEMETRY_RE = re.compile(r'^([\d\.]+)\s+(\{.*\})\s*$')
+
+
+def l3fwd_telemetry_cmd(dpdk_path, duration, port=0):
+    """Shell pipeline polling l3fwd's DPDK telemetry socket once per second (replies on stdout)
+
+    Each reply line is prefixed with the L3FWD node's wall-clock time.
+    """
+    return (f'while sleep 1; do echo "/ethdev/stats,{port}"; done | '
+            f'sudo timeout {duration} python3 -u {dpdk_path}/usertools/dpdk-telemetry.py 2>/dev/null | '
+            f'while read -r line; do echo "$(date +%s.%N) $line"; done')
+
+
+def parse_pktgen_telemetry_line(line):
+    """Return (sec, tx_pkts, rx_pkts): pktgen's seconds since traffic start and cumulative counters, or None"""
+    match = PKTGEN_TELEMETRY_RE.search(line)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def pktgen_traffic_seconds(log_file):
+    """Seconds pktgen sent traffic: sec of the log's last TELEMETRY line (None without one)
+
+    Runs with profilers stop early (PKTGEN_STOP_FILE), so this is usually
+    shorter than PKTGEN_DURATION.
+    """
+    seconds = None
+    try:
+        with open(log_file, 'r', encoding='utf-8', errors='ignore') as file:
+            for line in file:
+                sample = parse_pktgen_telemetry_line(line)
+                if sample:
+                    seconds = sample[0]
+    except OSError:
+        pass
+    return seconds
+
+
+def parse_l3fwd_telemetry_line(line):
+    """Return (epoch, tx_pkts, rx_pkts) cumulative counters or None"""
+    match = L3FWD_TELEMETRY_RE.match(line)
+    if not match:
+        return None
+    try:
+        stats = json.loads(match.group(2)).get('/ethdev/stats')
+    except ValueError:
+        return None
+    if not stats:
+        return None
+    return float(match.group(1)), int(stats.get('opackets', 0)), int(stats.get('ipackets', 0))
+
+
+def load_series(series_file):
+    """Load a saved series file ("<epoch> <tx_pkts> <rx_pkts>" per line)"""
+    series = []
+    if not os.path.exists(series_file):
+        return series
+    with open(series_file, 'r') as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3:
+                series.append((float(parts[0]), int(parts[1]), int(parts[2])))
+    return series
+
+
+def rate_series(series):
+    """Per-interval rates [(epoch, tx_mpps, rx_mpps)] from cumulative counters"""
+    rates = []
+    for (t0, tx0, rx0), (t1, tx1, rx1) in zip(series, series[1:]):
+        dt = t1 - t0
+        if dt <= 0:
+            continue
+        rates.append((t1, (tx1 - tx0) / dt / 1e6, (rx1 - rx0) / dt / 1e6))
+    return rates
+
+
+def window_rate(series, window):
+    """Average TX/RX Mpps between the first and last samples inside window (start, end)
+
+    Returns dict with tx_rate, rx_rate, samples and the per-interval tx_series /
+    rx_series (Mpps), or None if <2 samples fall in the window.
+    """
+    start, end = window
+    inside = [sample for sample in series if start <= sample[0] <= end]
+    if len(inside) < 2:
+        return None
+    (t0, tx0, rx0), (t1, tx1, rx1) = inside[0], inside[-1]
+    rates = rate_series(inside)
+    return {
+        'tx_rate': round((tx1 - tx0) / (t1 - t0) / 1e6, 3),
+        'rx_rate': round((rx1 - rx0) / (t1 - t0) / 1e6, 3),
+        'samples': len(inside),
+        'tx_series': [tx for _, tx, _ in rates],
+        'rx_series': [rx for _, _, rx in rates],
+    }
+
+
+def load_profiler_windows(windows_file):
+    """Load profiler phase windows logged by run_test.py's run_profiler_schedule()
+
+    Returns dict tool -> (start_epoch, end_epoch); tools in one phase share a window.
+    """
+    marks = {}
+    if not os.path.exists(windows_file):
+        return {}
+    with open(windows_file, 'r') as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[1] in ('start', 'end'):
+                marks.setdefault(parts[0], {})[parts[1]] = float(parts[2])
+
+    windows = {}
+    for phase, mark in marks.items():
+        if 'start' in mark and 'end' in mark:
+            for tool in phase.split('+'):
+                windows[tool] = (mark['start'], mark['end'])
+    return windows
+
+
+def measurement_window(windows):
+    """Pick the window rates should describe: pcm-pcie's (DDIO miss rate), else all profilers"""
+    if 'pcm-pcie' in windows:
+        return windows['pcm-pcie']
+    if windows:
+        return min(w[0] for w in windows.values()), max(w[1] for w in windows.values())
+    return None
+
+
+class TelemetryCollector:
+    """Tail pktgen/l3fwd telemetry while a test runs
+
+    series['pktgen'] / series['l3fwd'] hold (epoch, tx_pkts, rx_pkts) cumulative
+    samples. Pktgen lines carry pktgen's own second count (sec) rather than a
+    wall-clock time, so they are placed at anchor + sec, the anchor being the
+    earliest arrival time minus sec seen so far (the least delayed line); the
+    log tail's polling and buffering delays do not reach the rates. The pktgen
+    series is saved to <experiment_id>.pktgen-telemetry on stop().
+
+    With detect_steady_state, the first time every RX rate series with data
+    (pktgen's is required) meets steady_state_start(window, max_cv) (required
+    then), steady_at is set and steady_file (<experiment_id>.steady) is written.
+
+    With start_timeout, a run whose pktgen has counted no TX packets that long
+    after pktgen_started() is aborted: no_traffic is set and
+    <experiment_id>.done (PKTGEN_STOP_FILE) written.
+    """
+
+    def __init__(self, experiment_id, data_path, poll_interval=0.2, detect_steady_state=False,
+                 window=None, max_cv=None, start_timeout=None):
+        self.experiment_id = experiment_id
+        self.data_path = data_path
+        self.poll_interval = poll_interval
+        self.series = {'pktgen': [], 'l3fwd': []}
+        self._pktgen_samples = []  # (sec, tx_pkts, rx_pkts) as read
+        self._pktgen_anchor = None  # Epoch of pktgen's sec 0
+        self.detect_steady_state = detect_steady_state
+        self.window = window
+        self.max_cv = max_cv
+        self.steady_file = f'{data_path}/{experiment_id}.steady'
+        self.start_timeout = start_timeout
+        self.no_traffic = False
+        self.started_at = None
+        self.steady_at = None
+        self._steady_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """Start tailing threads"""
+        self.started_at = time.time()
+        sources = [
+            ('pktgen', f'{self.data_path}/{self.experiment_id}.pktgen', self._on_pktgen_line),
+            ('l3fwd', f'{self.data_path}/{self.experiment_id}.l3fwd-telemetry', self._on_l3fwd_line),
+        ]
+        for name, path, on_line in sources:
+            thread = threading.Thread(target=self._tail, args=(path, on_line),
+                                      name=f'telemetry-{name}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def pktgen_started(self):
+        """Start the start_timeout clock (pktgen was just launched)"""
+        if self.start_timeout:
+            threading.Thread(target=self._watch_start, name='telemetry-start', daemon=True).start()
+
+    def stop(self):
+        """Stop tailing (after draining what is already written) and save the pktgen series"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        with open(f'{self.data_path}/{self.experiment_id}.pktgen-telemetry', 'w') as file:
+            for epoch, tx_pkts, rx_pkts in self.series['pktgen']:
+                file.write(f'{epoch:.3f} {tx_pkts} {rx_pkts}\n')
+
+    def _on_pktgen_line(self, line):
+        sample = parse_pktgen_telemetry_line(line)
+        if not sample or (self._pktgen_samples and sample[0] <= self._pktgen_samples[-1][0]):
+            return
+        self._pktgen_samples.append(sample)
+        anchor = time.time() - sample[0]
+        if self._pktgen_anchor is None or anchor < self._pktgen_anchor:
+            self._pktgen_anchor = anchor
+        self.series['pktgen'] = [(self._pktgen_anchor + sec, tx_pkts, rx_pkts)
+                                 for sec, tx_pkts, rx_pkts in self._pktgen_samples]
+        self._check_steady_state()
+
+    def _on_l3fwd_line(self, line):
+        sample = parse_l3fwd_telemetry_line(line)
+        if sample:
+            self.series['l3fwd'].append(sample)
+            self._check_steady_state()
+
+    def _watch_start(self):
+        """Stop pktgen early if it has not started sending within start_timeout"""
+        if self._stop.wait(self.start_timeout):
+            return
+        if not any(tx_pkts > 0 for _, tx_pkts, _ in self.series['pktgen']):
+            self.no_traffic = True
+            print(f'ERROR: no pktgen TX packets after {self.start_timeout}s, aborting {self.experiment_id}')
+            with open(f'{self.data_path}/{self.experiment_id}.done', 'w') as file:
+                file.write('no traffic\n')
+
+    def _check_steady_state(self):
+        """Write steady_file once all RX rate series are steady"""
+        if not self.detect_steady_state or self.steady_at:
+            return
+        from sample_stats import steady_state_start  # numpy: only runs with steady-state detection
+        with self._steady_lock:
+            if self.steady_at:
+                return
+            for name, series in self.series.items():
+                if not series and name != 'pktgen':
+                    continue
+                rx_rates = [rx for _, _, rx in rate_series(series)]
+                if steady_state_start(rx_rates, self.window, self.max_cv) is None:
+                    return
+            self.steady_at = time.time()
+            with open(self.steady_file, 'w') as file:
+                file.write(f'{self.steady_at:.3f}\n')
+            print(f'DEBUG Telemetry: steady state reached, starting profilers ({self.steady_file})')
+
+    def _tail(self, path, on_line):
+        """Follow path (waiting for it to appear), calling on_line per complete line"""
+        while not os.path.exists(path):
+            if self._stop.wait(self.poll_interval):
+                return
+        with open(path, 'r', encoding='utf-8', errors='ignore') as file:
+            pending = ''
+            while True:
+                chunk = file.read()
+                if chunk:
+                    pending += chunk
+                    *lines, pending = re.split(r'[\r\n]', pending)
+                    for line in lines:
+                        on_line(line)
+                elif self._stop.is_set():
+                    return
+                else:
+                    time.sleep(self.poll_interval)
+
+
+def steady_state_rates(experiment_id, data_path, series=None):
+    """Steady-state TX/RX Mpps of pktgen and l3fwd over the profiler measurement window
+
+    series: live TelemetryCollector.series; saved telemetry files are used if omitted.
+    Returns dict {'pktgen': {...} or None, 'l3fwd': {...} or None, 'window': (start, end) or None}.
+    """
+    if series is None:
+        series = {
+            'pktgen': load_series(f'{data_path}/{experiment_id}.pktgen-telemetry'),
+            'l3fwd': [],
+        }
+        l3fwd_file = f'{data_path}/{experiment_id}.l3fwd-telemetry'
+        if os.path.exists(l3fwd_file):
+            with open(l3fwd_file, 'r', encoding='utf-8', errors='ignore') as file:
+                series['l3fwd'] = [s for s in map(parse_l3fwd_telemetry_line, file) if s]
+
+    window = measurement_window(load_profiler_windows(f'{data_path}/{experiment_id}.windows'))
+    result = {'pktgen': None, 'l3fwd': None, 'window': window}
+    if window:
+        result['pktgen'] = window_rate(series['pktgen'], window)
+        result['l3fwd'] = window_rate(series['l3fwd'], window)
+    return result
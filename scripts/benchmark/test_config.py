@@ -1,6 +1,11 @@
+import functools
+import json
 import os
+import re
 import subprocess
 
+from topology import format_cpu_list, load_topology, place_lcores
+
 ################## HELPER FUNCTIONS #####################
 
 def _load_bash_config(config_file):
@@ -18,8 +23,24 @@ def _load_bash_config(config_file):
                 config[key.strip()] = value.strip()
     return config
 
-def _detect_perf_events():
-    """Auto-detect available I/O LLC hit/miss perf events from system"""
+def _detect_perf_events(cache_file=None):
+    """Auto-detect available I/O LLC hit/miss perf events from system
+
+    `sudo perf list` is slow, so results are cached in cache_file per host
+    and kernel release (the event list only changes with either).
+    """
+    uname = os.uname()
+    host_key = f'{uname.nodename} {uname.release}'
+    cache = {}
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if host_key in cache:
+            return cache[host_key]
+
     try:
         result = subprocess.run(['sudo', 'perf', 'list'], capture_output=True, text=True, timeout=10)
         available = result.stdout + result.stderr
@@ -31,73 +52,230 @@ def _detect_perf_events():
         'unc_i_coherent_ops.pcirdcur',       # Total PCIe RdCur requests (NIC TX)
         'unc_cha_tor_inserts.io_miss_rdcur', # RdCur LLC misses
     ]
-    return [e for e in io_event_candidates if e in available]
+    events = [e for e in io_event_candidates if e in available]
+    if cache_file and result.returncode == 0:
+        cache[host_key] = events
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump(cache, f, indent=1)
+        except OSError:
+            pass
+    return events
+
+def _neohost_available():
+    """Check whether the NeoHost SDK and its python2.7 env are installed"""
+    neohost_python = f'{DPDK_BENCH_HOME}/neohost/miniconda3/envs/py27/bin/python'
+    neohost_sdk = f'{DPDK_BENCH_HOME}/neohost/sdk/opt/neohost/sdk/get_device_performance_counters.py'
+    return os.path.exists(neohost_python) and os.path.exists(neohost_sdk)
+
+def _perf_pmus(events):
+    """Map perf events to the uncore PMUs they program (unc_cha_* -> cha, unc_i_* -> i (IRP), ...)"""
+    pmus = set()
+    for event in events:
+        match = re.match(r'unc_([a-z0-9]+)_', event)
+        pmus.add(match.group(1) if match else 'core')
+    return pmus
+
+def _build_profiler_schedule(durations, pmus):
+    """Pack profilers into phases that share one steady-state window
 
-def _calculate_profiling_time(warmup, perf_dur, pcm_dur, neohost_dur, interval, enable_perf, enable_pcm, enable_neohost):
-    """Calculate total time needed for enabled profilers"""
+    Profilers are placed greedily (in the given order) into the first phase
+    whose members use none of the same PMUs, so non-conflicting collectors
+    run concurrently, e.g. [['pcm-pcie', 'neohost'], ['pcm-memory', 'perf']].
+    Returns list of phases, each a list of profiler names.
+    """
+    phases = []
+    for tool in durations:
+        for phase in phases:
+            if not any(pmus[tool] & pmus[other] for other in phase):
+                phase.append(tool)
+                break
+        else:
+            phases.append([tool])
+    return phases
+
+def get_phase_duration(phase):
+    """Duration of a profiler schedule phase (longest profiler in it)"""
+    return max(PROFILER_DURATIONS[tool] for tool in phase)
+
+def _calculate_profiling_time(warmup, interval, schedule):
+    """Calculate total time needed to run the profiler schedule"""
     total = warmup
-    if enable_perf:
-        total += perf_dur
-    if enable_pcm:
-        total += interval + pcm_dur  # pcm-pcie
-        total += interval + pcm_dur  # pcm-memory (for DDIO verification)
-    if enable_neohost:
-        neohost_python = f'{DPDK_BENCH_HOME}/neohost/miniconda3/envs/py27/bin/python'
-        neohost_sdk = f'{DPDK_BENCH_HOME}/neohost/sdk/opt/neohost/sdk/get_device_performance_counters.py'
-        if os.path.exists(neohost_python) and os.path.exists(neohost_sdk):
-            total += interval + neohost_dur
+    for phase in schedule:
+        total += interval + get_phase_duration(phase)
     return total + interval
 
-def get_l3fwd_config(lcore_count):
-    """Generate L3FWD configuration for given lcore count"""
-    lcores = f"-l 0-{lcore_count}"
-    config_parts = [f"(0,{i-1},{i})" for i in range(1, lcore_count + 1)]
+def _load_testbeds(cluster_config):
+    """Build testbed pair pool from TESTBED_PAIRS in cluster.config
+
+    Format: TESTBED_PAIRS=node5:node6,node7:node8 (PKTGEN:L3FWD).
+    Falls back to the single PKTGEN_NODE/L3FWD_NODE pair. NIC settings come
+    from config/system.<PKTGEN>-<L3FWD>.config if present, else system.config.
+    """
+    pairs_str = cluster_config.get('TESTBED_PAIRS', '')
+    pairs = [pair.strip().split(':') for pair in pairs_str.split(',') if pair.strip()]
+    if not pairs:
+        pairs = [(PKTGEN_NODE, L3FWD_NODE)]
+
+    testbeds = []
+    for pktgen_node, l3fwd_node in pairs:
+        name = f'{pktgen_node}-{l3fwd_node}'
+        system_config = dict(SYSTEM_CONFIG)
+        system_config.update(_load_bash_config(f'{DPDK_BENCH_HOME}/config/system.{name}.config'))
+        testbeds.append({
+            "name": name,
+            "pktgen_node": pktgen_node,
+            "l3fwd_node": l3fwd_node,
+            "pktgen_mac": system_config.get('PKTGEN_NIC_MAC', ''),
+            "pktgen_pci": system_config.get('PKTGEN_NIC_PCI', ''),
+            "l3fwd_mac": system_config.get('L3FWD_NIC_MAC', ''),
+            "l3fwd_pci": system_config.get('L3FWD_NIC_PCI', ''),
+        })
+    return testbeds
+
+@functools.lru_cache(maxsize=None)
+def _lcore_placement(node, pci_address, worker_count):
+    """NIC-local main + worker lcores from the node's /sys topology (None: fall back to lcores 0..N)"""
+    if not TOPOLOGY_AWARE_PLACEMENT or not pci_address:
+        return None
+    topology = load_topology(pci_address, None if node == PKTGEN_NODE else node)
+    if not topology:
+        print(f"WARNING: no CPU topology for {pci_address} on {node}, using lcores 0-{worker_count}")
+        return None
+    try:
+        placement = place_lcores(topology, worker_count)
+    except ValueError as e:
+        print(f"WARNING: {node}: {e}, using lcores 0-{worker_count}")
+        return None
+    for warning in placement['warnings']:
+        print(f"WARNING: {node}: {warning}")
+    return placement
+
+def _lcore_args(placement):
+    """EAL lcore arguments for a placement (main lcore named explicitly, it need not be the lowest)"""
+    return f"-l {format_cpu_list([placement['main']] + placement['workers'])} --main-lcore {placement['main']}"
+
+def _file_prefix(app, testbed):
+    """EAL --file-prefix of app on testbed: pairs sharing a host keep separate hugepage files and runtime dirs"""
+    return f"{app}-" + re.sub(r"[^\w.-]", "_", testbed["name"])
+
+def get_l3fwd_config(lcore_count, testbed=None, devargs=None):
+    """Generate L3FWD configuration for given lcore count (on testbed, default: first pair)
+
+    devargs overrides L3FWD_NIC_DEVARGS (devargs search).
+
+    Queue i is polled by the i-th NIC-local worker lcore (see topology.py);
+    without topology information lcore 0 is main and queue i-1 runs on lcore i.
+    """
+    testbed = testbed or TESTBEDS[0]
+    placement = _lcore_placement(testbed["l3fwd_node"], testbed["l3fwd_pci"], lcore_count)
+    if placement:
+        lcores = _lcore_args(placement)
+        config_parts = [f"(0,{queue},{lcore})" for queue, lcore in enumerate(placement["workers"])]
+    else:
+        lcores = f"-l 0-{lcore_count}"
+        config_parts = [f"(0,{i-1},{i})" for i in range(1, lcore_count + 1)]
     # Build PCI address with optional devargs
-    pci_addr = L3FWD_PCI_ADDRESS
-    if L3FWD_NIC_DEVARGS:
-        pci_addr = f"{L3FWD_PCI_ADDRESS},{L3FWD_NIC_DEVARGS}"
+    devargs = L3FWD_NIC_DEVARGS if devargs is None else devargs
+    pci_addr = testbed["l3fwd_pci"]
+    if devargs:
+        pci_addr = f"{testbed['l3fwd_pci']},{devargs}"
     return {
         "binary_path": f"{DPDK_PATH}/build/examples/dpdk-l3fwd",
-        "node": L3FWD_NODE,
+        "node": testbed["l3fwd_node"],
         "lcores": lcores,
         "memory_channels": "-n 4",
         "pci_address": pci_addr,
         "port_mask": "-p 0x1",
         "config": ",".join(config_parts),
-        "eth_dest": L3FWD_ETH_DEST
+        "eth_dest": testbed["pktgen_mac"],
+        "file_prefix": _file_prefix("l3fwd", testbed),
+        "devargs": devargs,
+        "target_socket": placement["socket"] if placement else 0,  # Socket the PCM parsers read
+        "placement": placement,
     }
 
-def get_pktgen_config(tx_core_count):
-    """Generate PKTGEN configuration for given TX core count
+def get_pktgen_config(tx_core_count, testbed=None, devargs=None):
+    """Generate PKTGEN configuration for given TX core count (on testbed, default: first pair)
 
-    tx_core_count=2 → cores: 0(main), 1(RX), 2-3(TX)
+    devargs overrides PKTGEN_NIC_DEVARGS (devargs search).
+
+    tx_core_count=2 → cores: 0(main), 1(RX), 2-3(TX), or the NIC-local equivalents (see topology.py)
     """
+    testbed = testbed or TESTBEDS[0]
     total_lcore = 1 + tx_core_count
-    port_map = f"[1:{2}].0" if tx_core_count == 1 else f"[1:2-{total_lcore}].0"
+    placement = _lcore_placement(testbed["pktgen_node"], testbed["pktgen_pci"], total_lcore)
+    if placement:
+        lcores = _lcore_args(placement)
+        rx_lcore, tx_lcores = placement["workers"][0], placement["workers"][1:]
+        port_map = f"[{rx_lcore}:{format_cpu_list(tx_lcores)}].0"
+    else:
+        lcores = f"-l 0-{total_lcore}"
+        port_map = f"[1:{2}].0" if tx_core_count == 1 else f"[1:2-{total_lcore}].0"
     # Build PCI address with optional devargs
-    pci_addr = PKTGEN_PCI_ADDRESS
-    if PKTGEN_NIC_DEVARGS:
-        pci_addr = f"{PKTGEN_PCI_ADDRESS},{PKTGEN_NIC_DEVARGS}"
+    devargs = PKTGEN_NIC_DEVARGS if devargs is None else devargs
+    pci_addr = testbed["pktgen_pci"]
+    if devargs:
+        pci_addr = f"{testbed['pktgen_pci']},{devargs}"
     return {
         "binary_path": f"{PKTGEN_PATH}/build/app/pktgen",
         "working_dir": PKTGEN_PATH,
-        "node": PKTGEN_NODE,
-        "lcores": f"-l 0-{total_lcore}",
+        "node": testbed["pktgen_node"],
+        "lcores": lcores,
         "memory_channels": "-n 4",
         "pci_address": pci_addr,
         "proc_type": "--proc-type auto",
-        "file_prefix": "pktgen1",
+        "file_prefix": _file_prefix("pktgen", testbed),
         "port_map": port_map,
         "app_args": "-P -T",
-        "script_file": f"{DPDK_BENCH_HOME}/config/simple-test/simple-test.lua"
+        "script_file": f"{DPDK_BENCH_HOME}/config/simple-test/simple-test.lua",
+        "src_mac": testbed["pktgen_mac"],
+        "dst_mac": testbed["l3fwd_mac"],
+        "devargs": devargs,
+        "target_socket": placement["socket"] if placement else 0,  # Socket the PCM parsers read
+        "placement": placement,
+    }
+
+def get_traffic_profile(packet_size, flow_count):
+    """Traffic of one sweep point: packet_size is a frame size (bytes) or an IMIX_PROFILES name
+
+    Returns {'packet_size', 'frames': [(size, weight)], 'mean_frame_size', 'flows',
+    'src_ip', 'dst_ip', 'src_ports', 'dst_port'}; flows is what simple-test.lua can
+    generate (IMIX: one flow per sequence packet), src_ports their "first-last" range.
+    """
+    frames = IMIX_PROFILES[packet_size] if isinstance(packet_size, str) else [(packet_size, 1)]
+    total_weight = sum(weight for _, weight in frames)
+    flows = min(flow_count, MAX_FLOWS)
+    if len(frames) > 1:
+        if total_weight > PKTGEN_MAX_SEQ_PACKETS:
+            raise ValueError(f"IMIX profile '{packet_size}' weights sum to {total_weight}, "
+                             f"pktgen has {PKTGEN_MAX_SEQ_PACKETS} sequence packets")
+        flows = min(flows, total_weight)
+    if flows < flow_count:
+        print(f"WARNING: {packet_size} traffic supports {flows} flows, not {flow_count}")
+    return {
+        "packet_size": packet_size,
+        "frames": frames,
+        "mean_frame_size": round(sum(size * weight for size, weight in frames) / total_weight, 1),
+        "flows": flows,
+        "src_ip": PKTGEN_SRC_IP,
+        "dst_ip": PKTGEN_DST_IP,
+        "src_ports": f"{PKTGEN_SRC_PORT}-{PKTGEN_SRC_PORT + flows - 1}",
+        "dst_port": PKTGEN_DST_PORT,
     }
 
 ################## PATHS #####################
 DPDK_BENCH_HOME = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DPDK_PATH = f'{DPDK_BENCH_HOME}/dpdk'
 PKTGEN_PATH = f'{DPDK_BENCH_HOME}/Pktgen-DPDK'
+PCM_PATH = f'{DPDK_BENCH_HOME}/pcm'
+SOURCE_PATHS = {'dpdk-bench': DPDK_BENCH_HOME, 'dpdk': DPDK_PATH, 'pktgen': PKTGEN_PATH, 'pcm': PCM_PATH}  # Git commits in manifests
 RESULTS_PATH = f'{DPDK_BENCH_HOME}/results'
 DATA_PATH = RESULTS_PATH
+RESULT_STORE_PATH = f'{RESULTS_PATH}/store'  # Append-only columnar results (result_store.py)
+LEDGER_PATH = f'{RESULTS_PATH}/ledger.jsonl'  # Resumable sweep ledger (ledger.py)
+PERF_EVENTS_CACHE = f'{RESULTS_PATH}/perf_events.json'  # Detected perf events per host and kernel
 ENV = f'LD_LIBRARY_PATH={DPDK_PATH}/build/lib:{DPDK_PATH}/build/lib/x86_64-linux-gnu'
 
 ################## LOAD CONFIG FILES #####################
@@ -116,6 +294,14 @@ L3FWD_MAC = SYSTEM_CONFIG.get('L3FWD_NIC_MAC', '')
 L3FWD_PCI_ADDRESS = SYSTEM_CONFIG.get('L3FWD_NIC_PCI', '')
 L3FWD_ETH_DEST = PKTGEN_MAC
 
+# Link speed for Gbps / % of line rate reporting (line_rate.py); per-frame wire
+# overhead = preamble + SFD + inter-frame gap
+LINK_SPEED_GBPS = float(SYSTEM_CONFIG.get('NIC_LINK_SPEED_GBPS', 100))
+WIRE_OVERHEAD_BYTES = 20  # Preamble + SFD (8) and inter-frame gap (12) per frame on the wire
+
+# Pool of PKTGEN/L3FWD pairs; sweep points are spread across idle pairs
+TESTBEDS = _load_testbeds(CLUSTER_CONFIG)
+
 def validate_config():
     """Validate required configuration before running tests"""
     errors = []
@@ -127,6 +313,11 @@ def validate_config():
         errors.append("L3FWD_NIC_MAC not set in config/system.config")
     if not L3FWD_PCI_ADDRESS:
         errors.append("L3FWD_NIC_PCI not set in config/system.config")
+    for testbed in (TESTBEDS if len(TESTBEDS) > 1 else []):
+        for key in ('pktgen_mac', 'pktgen_pci', 'l3fwd_mac', 'l3fwd_pci'):
+            if not testbed[key]:
+                errors.append(f"{key.upper()} not set for testbed {testbed['name']} "
+                              f"(config/system.{testbed['name']}.config)")
 
     if errors:
         print("ERROR: Missing required configuration:")
@@ -141,25 +332,87 @@ ENABLE_PERF = False  # Disabled: using pcm-pcie -e for DDIO miss rate instead
 ENABLE_PCM = True
 ENABLE_NEOHOST = True
 
+# Profilers start once live telemetry rates are steady (see STEADY_STATE_*),
+# waiting at most WARMUP_MAX_DELAY; without detection they start after WARMUP_DELAY
+STEADY_STATE_DETECTION = True
 WARMUP_DELAY = 10
-TOOL_INTERVAL = 5
+WARMUP_MAX_DELAY = 30
+TOOL_INTERVAL = 0  # Extra gap before each profiler phase (phases already wait for the previous tools to exit)
 PERF_DURATION = 15
 PCM_DURATION = 15
 NEOHOST_DURATION = 20
 
-PERF_EVENTS = _detect_perf_events()
+# Detected only when perf is enabled: importing the config must stay free of sudo/subprocess calls
+PERF_EVENTS = _detect_perf_events(PERF_EVENTS_CACHE) if ENABLE_PERF else []
 PERF_UNITS = {
     'unc_i_coherent_ops.pcirdcur': 'count',       # Total PCIe RdCur requests
     'unc_cha_tor_inserts.io_miss_rdcur': 'count', # RdCur LLC misses
 }
 
-PKTGEN_DURATION = _calculate_profiling_time(
-    WARMUP_DELAY, PERF_DURATION, PCM_DURATION, NEOHOST_DURATION,
-    TOOL_INTERVAL, ENABLE_PERF, ENABLE_PCM, ENABLE_NEOHOST
-)
+# Uncore/device PMUs each profiler programs. Profilers sharing a PMU cannot
+# sample concurrently; pcm-* tools also share PCM's single-instance lock.
+PROFILER_PMUS = {
+    'pcm-pcie': {'pcm', 'cha', 'iio'},
+    'pcm-memory': {'pcm', 'imc'},
+    'neohost': {'nic'},
+    'perf': _perf_pmus(PERF_EVENTS),
+}
+
+# Enabled profilers in scheduling priority order -> sampling duration
+PROFILER_DURATIONS = {}
+if ENABLE_PCM:
+    PROFILER_DURATIONS['pcm-pcie'] = PCM_DURATION
+    PROFILER_DURATIONS['pcm-memory'] = PCM_DURATION  # DDIO verification
+if ENABLE_NEOHOST and _neohost_available():
+    PROFILER_DURATIONS['neohost'] = NEOHOST_DURATION
+if ENABLE_PERF:
+    PROFILER_DURATIONS['perf'] = PERF_DURATION
+
+PROFILER_SCHEDULE = _build_profiler_schedule(PROFILER_DURATIONS, PROFILER_PMUS)
+
+################## READINESS TIMEOUTS #####################
+# Orchestration waits on concrete signals; these bound each wait
+PROCESS_RELEASE_TIMEOUT = 15  # kill_procs: DPDK processes gone and free hugepages settled
+PROFILER_START_TIMEOUT = 5    # A profiler phase starts its window once every tool has written output
+PKTGEN_START_TIMEOUT = 20     # Abort a point whose pktgen has counted no TX packets by then
+PROCESS_STOP_GRACE = 5        # Seconds between SIGTERM and SIGKILL when a test's tasks are stopped
+
+# Upper bound (pktgen stops as soon as the profilers finish): max warm-up plus
+# each phase's duration, gap and profiler startup allowance
+PKTGEN_DURATION = _calculate_profiling_time(WARMUP_MAX_DELAY if STEADY_STATE_DETECTION else WARMUP_DELAY,
+                                            TOOL_INTERVAL + PROFILER_START_TIMEOUT, PROFILER_SCHEDULE)
+
+# Steady state = a rolling window of STEADY_STATE_WINDOW samples whose coefficient
+# of variation (stddev / mean) is <= STEADY_STATE_MAX_CV. Used live on RX rates to
+# start profilers, and in parsing to trim warm-up samples from profiler series.
+# A run is flagged if any STEADY_STATE_CV_METRICS series exceeds it overall.
+STEADY_STATE_WINDOW = 3
+STEADY_STATE_MAX_CV = 0.05
+STEADY_STATE_CV_METRICS = ['rx_rate', 'rd_total_bytes']
 
 ################## TEST PARAMETERS #####################
-PKTGEN_PACKET_SIZE = 64
+# Traffic sweep dimensions (configured by simple-test.lua):
+# PACKET_SIZE_VALUES: frame sizes in bytes (incl. CRC) or IMIX_PROFILES names.
+# FLOW_COUNT_VALUES: distinct 5-tuples, one TCP source port (PKTGEN_SRC_PORT,
+# PKTGEN_SRC_PORT + 1, ...) per flow, so RSS spreads them over L3FWD's RX queues.
+# 50000 ~ the former fixed 10000-60000 range.
+PACKET_SIZE_VALUES = [64]
+FLOW_COUNT_VALUES = [50000]
+
+# IMIX profile name -> [(frame size, weight)]; sent as pktgen sequence packets,
+# so weights must sum to <= PKTGEN_MAX_SEQ_PACKETS (and flows are capped at that sum)
+IMIX_PROFILES = {
+    'imix': [(64, 7), (594, 4), (1518, 1)],  # Simple IMIX 7:4:1
+}
+PKTGEN_MAX_SEQ_PACKETS = 16
+
+# Packet headers (recorded with every result); PKTGEN_DST_IP must stay in
+# L3FWD's 198.18.0.0/24 LPM route
+PKTGEN_SRC_IP = '192.168.0.1'
+PKTGEN_DST_IP = '198.18.0.1'
+PKTGEN_SRC_PORT = 10000  # First TCP source port, one per flow
+PKTGEN_DST_PORT = 20000
+MAX_FLOWS = 65536 - PKTGEN_SRC_PORT  # Source ports PKTGEN_SRC_PORT-65535
 
 L3FWD_TX_DESC_VALUES = [1024]
 L3FWD_RX_DESC_VALUES = [1024]
@@ -172,3 +425,141 @@ PKTGEN_TX_CORE_VALUES = [1]
 # Example: 'txqs_min_inline=0,txq_mpw_en=1,txq_inline_mpw=256'
 PKTGEN_NIC_DEVARGS = ''
 L3FWD_NIC_DEVARGS = ''
+
+################## RESUME #####################
+# Finished sweep points are recorded in LEDGER_PATH keyed by a hash of their full
+# configuration; reruns skip points with valid results, retry failed ones and
+# re-parse cached raw logs when PARSER_VERSION (run_test.py) changes
+RESUME_SWEEPS = True
+
+################## REPEATS #####################
+# Every eval sweep point runs REPEAT_MIN times, in REPEAT_ORDER ('sequential',
+# 'interleaved' rounds or 'randomized' with REPEAT_SEED, spreading slow drift over
+# all points); then a point gets one more repeat per round while the 95% CI of
+# REPEAT_CI_NODE's REPEAT_CI_METRIC is wider than REPEAT_CI_TARGET (relative to
+# the mean), up to REPEAT_MAX runs. Mean and CI of REPEAT_METRICS per point go to
+# dpdk_repeat_results.txt. REPEAT_MAX = 1: single-shot sweep
+REPEAT_MIN = 1
+REPEAT_MAX = 1
+REPEAT_ORDER = 'interleaved'
+REPEAT_SEED = 1
+REPEAT_CI_NODE = 'L3FWD'
+REPEAT_CI_METRIC = 'tx_rate'
+REPEAT_CI_TARGET = 0.02
+REPEAT_CONFIDENCE = 0.95
+REPEAT_METRICS = ('tx_rate', 'rx_rate', 'ddio_rd_miss', 'ddio_wr_miss', 'dram_rd_bw', 'dram_wr_bw')
+
+################## OFFLINE ANALYSIS #####################
+# run_test.py analyze [results_dir]: re-parse every experiment of a results
+# directory from its raw logs and <experiment_id>.manifest.json (manifest.py),
+# falling back to the ledger for experiments recorded before manifests existed
+ANALYZE_WORKERS = None  # Process pool size (None: one per CPU)
+
+################## REMOTE AGENT #####################
+# One long-lived agent per remote node (remote_agent.py, JSON lines over a single
+# SSH session) runs setup commands (kill_procs, ARP tables);
+# USE_REMOTE_AGENT = False falls back to a new SSH session per command.
+# The test's own processes run as supervised async_runner tasks (multiplexed ssh)
+USE_REMOTE_AGENT = True
+L3FWD_READY_TIMEOUT = 30  # Seconds to wait for all L3FWD_READY_PATTERNS
+# Readiness event -> regex on the l3fwd task's output
+L3FWD_READY_PATTERNS = {
+    'port_up': r'Port\s*\d+\s+Link\s+[Uu]p',
+    'lcore_polling': r'entering main loop on lcore',
+}
+
+################## LCORE PLACEMENT #####################
+# Pick lcores from each node's /sys topology (topology.py): polling cores on the
+# NIC's NUMA node, one hardware thread per physical core, packed by LLC domain.
+# The NIC's socket is also the socket the PCM parsers read. False: lcores 0..N, socket 0
+TOPOLOGY_AWARE_PLACEMENT = True
+
+################## NOISE GUARD #####################
+# Pre-flight and in-flight checks of the polling lcores on both nodes (noise_guard.py).
+# Misconfiguration (governor/turbo off NOISE_LIMITS) and drift (governor/turbo changing,
+# busy lcores or foreign tasks on them, frequency dips) mark a point noise_drift=1;
+# NOISE_ACTION 'retry' reruns drifted points up to NOISE_MAX_RETRIES times, while
+# misconfiguration is warned about once and not retried. Warnings (deep C-states, IRQs,
+# no isolcpus/nohz_full) are only recorded. compare mode leaves drifted runs out
+NOISE_GUARD = True
+NOISE_ACTION = 'retry'  # 'mark' or 'retry'
+NOISE_MAX_RETRIES = 2
+NOISE_WATCH_INTERVAL = 1  # In-flight sampling period (s)
+NOISE_LIMITS = {
+    'governor': 'performance',   # Required scaling governor (None: not checked)
+    'turbo': None,               # Required turbo state True/False (None: not checked, only reported)
+    'max_cstate_latency': 10,    # Enabled C-states with a longer exit latency (us) are a warning
+    'max_busy_pct': 5.0,         # Pre-flight: polling lcores busier than this (%) = co-tenant
+    'max_freq_drop': 0.05,       # In-flight: a sample this far (relative) below the run's median = dip
+    'require_isolation': False,  # Polling lcores outside isolcpus/nohz_full: misconfiguration instead of warning
+}
+
+################## DDIO SWEEP #####################
+# DDIO setting per sweep point, applied on the DDIO_NODES roles ('l3fwd',
+# 'pktgen') before the point and read back to verify (ddio.py): None = leave as
+# is (the state is still recorded), 'off', or an LLC way mask with DDIO on
+# (e.g. 0x600 = the default 2 ways). Changed nodes are restored on exit
+DDIO_VALUES = [None]
+DDIO_NODES = ['l3fwd']
+
+################## SCALING STUDY #####################
+# `run_test.py scaling` sweeps SCALING_L3FWD_LCORE_VALUES; per count, PKTGEN TX
+# cores are added (SCALING_PKTGEN_TX_CORE_VALUES, in order) until pktgen's TX rate
+# exceeds L3FWD's RX rate by SCALING_TX_MARGIN, or an extra TX core raises TX by
+# less than SCALING_MIN_TX_GAIN (generator NIC/wire saturated). The knee is the
+# last core count before an added core yields < SCALING_KNEE_MIN_MARGINAL of the
+# first core's rate. TESTBEDS are assumed identical: one study per NIC generation
+SCALING_L3FWD_LCORE_VALUES = [1, 2, 3, 4, 6, 8]
+SCALING_PKTGEN_TX_CORE_VALUES = [1, 2, 4, 6]
+SCALING_TX_MARGIN = 0.02
+SCALING_MIN_TX_GAIN = 0.02
+SCALING_KNEE_MIN_MARGINAL = 0.5
+
+################## DEVARGS SEARCH #####################
+# run_test.py devargs: successive halving over mlx5 devargs of the
+# DEVARGS_SEARCH_TARGET ('l3fwd' or 'pktgen') NIC, per sweep point.
+# DEVARGS_SEARCH_CANDIDATES combinations of DEVARGS_SEARCH_SPACE (added to
+# *_NIC_DEVARGS) get one run each; the best 1/DEVARGS_SEARCH_ETA (by Mpps; within
+# DEVARGS_MPPS_TOLERANCE of the best, fewer PCIe bytes/packet wins) get
+# DEVARGS_SEARCH_ETA times as many runs, until one is left or DEVARGS_MAX_RUNS
+DEVARGS_SEARCH_TARGET = 'l3fwd'
+DEVARGS_SEARCH_SPACE = {
+    'txqs_min_inline': [0, 4, 8, 16],
+    'txq_mpw_en': [0, 1],
+    'txq_inline_mpw': [128, 256, 512],
+    'rxq_cqe_comp_en': [0, 1],
+}
+DEVARGS_SEARCH_CANDIDATES = 16
+DEVARGS_SEARCH_ETA = 2
+DEVARGS_MAX_RUNS = 8
+DEVARGS_MPPS_TOLERANCE = 0.01
+DEVARGS_SEARCH_SEED = 1
+
+################## REGRESSION COMPARE #####################
+# run_test.py compare [candidate [baseline ...]]: result store campaigns (default:
+# the latest vs. the COMPARE_BASELINE_RUNS before it), matched per sweep point.
+# Each run of a point contributes one value (its mean) to the test; points with
+# fewer than COMPARE_MIN_REPEATS runs on either side are reported untested
+# (run campaigns with REPEAT_MAX > 1; compare is INCONCLUSIVE if nothing is tested).
+# A metric regresses when p < COMPARE_ALPHA and it got worse by more than
+# COMPARE_MIN_CHANGE (relative)
+COMPARE_BASELINE_RUNS = 3
+COMPARE_MIN_REPEATS = 2
+COMPARE_ALPHA = 0.05
+COMPARE_MIN_CHANGE = 0.01
+
+################## NDR SEARCH (zero-loss throughput, RFC 2544-style) #####################
+# `run_test.py ndr` binary-searches pktgen's TX rate (% of line rate) per sweep
+# point using short trials without profilers
+NDR_TRIAL_DURATION = 5      # Seconds of traffic per trial
+NDR_RATE_RESOLUTION = 0.5   # Stop once the pass/fail rate interval is this narrow (%)
+NDR_LOSS_TOLERANCE = 0.0    # Max lost/TX packet ratio still counted as no-drop
+NDR_MAX_TRIALS = 12
+
+################## LATENCY MODE #####################
+# `run_test.py latency` (or ENABLE_LATENCY = True) runs the eval sweep with
+# pktgen's latency sampler on: timestamped packets are sampled once traffic is
+# steady and bucketed into an HDR-style histogram per sweep point (latency.py)
+ENABLE_LATENCY = False
+LATENCY_SAMPLE_RATE = 1000    # Sampled packets per second
+LATENCY_MAX_SAMPLES = 50000   # Pktgen sampler buffer per run
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from repeats import base_point, mean_ci, order_runs, relative_ci_width, repeat_point, t_quantile
+
+
+@pytest.mark.parametrize('p, df, expected', [
+    (0.975, 1, 12.706),
+    (0.975, 4, 2.776),
+    (0.975, 30, 2.042),
+    (0.95, 10, 1.812),
+    (0.995, 5, 4.032),
+])
+def test_t_quantile_matches_tables(p, df, expected):
+    assert t_quantile(p, df) == pytest.approx(expected, abs=1e-3)
+
+
+def test_mean_ci():
+    mean, half_width = mean_ci([1, 2, 3])
+    assert mean == pytest.approx(2.0)
+    assert half_width == pytest.approx(2.484, abs=1e-3)
+
+
+def test_mean_ci_skips_missing_values():
+    assert mean_ci([1, None, 2, 3]) == mean_ci([1, 2, 3])
+
+
+def test_mean_ci_too_few_values():
+    assert mean_ci([]) == (None, None)
+    assert mean_ci([None]) == (None, None)
+    assert mean_ci([5]) == (5.0, None)
+
+
+def test_relative_ci_width():
+    assert relative_ci_width([1, 2, 3]) == pytest.approx(2 * 2.484 / 2, abs=1e-3)
+    assert relative_ci_width([5]) is None
+    assert relative_ci_width([-1, 0, 1]) is None
+
+
+def test_repeat_point_round_trip():
+    point = {'packet_size': 64}
+    assert repeat_point(point, 0) == point
+    assert repeat_point(point, 2) == {'packet_size': 64, 'repeat': 2}
+    assert base_point(repeat_point(point, 2)) == point
+
+
+PENDING = [({'p': 'a'}, [0, 1, 2]), ({'p': 'b'}, [1, 2])]
+
+
+def labels(runs):
+    return [(run['p'], run.get('repeat', 0)) for run in runs]
+
+
+def test_order_runs_sequential():
+    assert labels(order_runs(PENDING, 'sequential', random.Random(1))) == [
+        ('a', 0), ('a', 1), ('a', 2), ('b', 1), ('b', 2)]
+
+
+def test_order_runs_interleaved():
+    assert labels(order_runs(PENDING, 'interleaved', random.Random(1))) == [
+        ('a', 0), ('b', 1), ('a', 1), ('b', 2), ('a', 2)]
+
+
+def test_order_runs_randomized_is_seeded_permutation():
+    runs = labels(order_runs(PENDING, 'randomized', random.Random(1)))
+    assert sorted(runs) == sorted(labels(order_runs(PENDING, 'sequential', None)))
+    assert runs == labels(order_runs(PENDING, 'randomized', random.Random(1)))
+
+
+def test_order_runs_empty():
+    assert order_runs([], 'interleaved', random.Random(1)) == []
+
+
+def test_order_runs_unknown_order():
+    with pytest.raises(ValueError):
+        order_runs(PENDING, 'reversed', random.Random(1))
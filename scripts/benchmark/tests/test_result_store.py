@@ -0,0 +1,32 @@
+import numpy as np
+
+from result_store import append_records, list_campaigns, query
+
+
+def test_string_column_all_missing_in_one_campaign(tmp_path):
+    append_records(tmp_path, 'c1', [{'tx_rate': 1.0, 'imix': None}])
+    append_records(tmp_path, 'c2', [{'tx_rate': 2.0, 'imix': 'imix'}])
+    result = query(tmp_path)
+    assert result['imix'].tolist() == ['', 'imix']
+    assert result['tx_rate'].tolist() == [1.0, 2.0]
+
+
+def test_column_missing_from_one_campaign(tmp_path):
+    append_records(tmp_path, 'c1', [{'tx_rate': 1.0}])
+    append_records(tmp_path, 'c2', [{'tx_rate': 2.0, 'testbed': 'tb1', 'flows': 100}])
+    result = query(tmp_path)
+    assert result['testbed'].tolist() == ['', 'tb1']
+    assert np.isnan(result['flows'][0]) and result['flows'][1] == 100
+
+
+def test_ordering_predicate_on_string_column(tmp_path):
+    append_records(tmp_path, 'c1', [{'tx_rate': 1.0, 'testbed': 'tb1'}])
+    assert query(tmp_path, where=[('testbed', '>', 3)]) == {}
+    assert query(tmp_path, ['tx_rate'], where=[('testbed', '!=', 3)])['tx_rate'].tolist() == [1.0]
+
+
+def test_campaign_files_in_append_order(tmp_path):
+    for rate in range(12):
+        append_records(tmp_path, 'c1', [{'tx_rate': float(rate)}])
+    assert query(tmp_path)['tx_rate'].tolist() == [float(rate) for rate in range(12)]
+    assert [path.rsplit('/', 1)[1] for _, path in list_campaigns(tmp_path)][:3] == ['c1.npz', 'c1.1.npz', 'c1.2.npz']
@@ -0,0 +1,90 @@
+import pytest
+
+from topology import format_cpu_list, parse_cpu_list, place_lcores
+
+
+def make_topology(nic_numa_node=0, sockets=2, cores=4, smt=True, core_llc=None):
+    """Synthetic read_topology() result: CPU = socket * cores + core, HT siblings offset by sockets * cores
+
+    core_llc: {first thread: LLC domain} overrides (default: one domain per socket).
+    """
+    threads = sockets * cores
+    cpus = {}
+    for socket in range(sockets):
+        for core in range(cores):
+            first = socket * cores + core
+            siblings = [first, first + threads] if smt else [first]
+            llc = (core_llc or {}).get(first, socket * cores)
+            for cpu in siblings:
+                cpus[cpu] = {'package': socket, 'core': core, 'numa_node': socket, 'siblings': siblings, 'llc': llc}
+    return {'pci': '0000:3b:00.0', 'nic_numa_node': nic_numa_node, 'cpus': cpus}
+
+
+def test_cpu_list_round_trip():
+    assert parse_cpu_list('0-3,8,10-11') == [0, 1, 2, 3, 8, 10, 11]
+    assert format_cpu_list([8, 0, 1, 2, 3, 10, 11]) == '0-3,8,10-11'
+    assert parse_cpu_list('') == []
+
+
+def test_local_physical_cores_first():
+    placement = place_lcores(make_topology(nic_numa_node=1), 2)
+    assert placement['main'] == 4
+    assert placement['workers'] == [5, 6]
+    assert placement['socket'] == 1
+    assert placement['numa_local'] and not placement['smt_shared']
+    assert placement['warnings'] == []
+
+
+def test_cpu0_core_left_to_the_os():
+    placement = place_lcores(make_topology(nic_numa_node=0), 2)
+    assert 0 not in [placement['main']] + placement['workers']
+    assert placement['main'] == 1 and placement['workers'] == [2, 3]
+
+
+def test_cpu0_core_used_when_nothing_else_is_free():
+    placement = place_lcores(make_topology(nic_numa_node=0), 3)
+    assert sorted([placement['main']] + placement['workers']) == [0, 1, 2, 3]
+    assert not placement['smt_shared']
+
+
+def test_largest_llc_domain_first():
+    # Socket 0: cores 0 and 1 alone in their LLC domains, cores 2-5 sharing one
+    placement = place_lcores(make_topology(nic_numa_node=0, cores=6, core_llc={0: 0, 1: 1, 2: 2, 3: 2, 4: 2, 5: 2}), 2)
+    assert [placement['main']] + placement['workers'] == [2, 3, 4]
+
+
+def test_short_of_cores_main_takes_a_sibling():
+    placement = place_lcores(make_topology(nic_numa_node=1), 4)
+    assert placement['workers'] == [4, 5, 6, 7]
+    assert placement['main'] == 12  # HT sibling of worker 4
+    assert placement['numa_local'] and not placement['smt_shared']
+
+
+def test_siblings_before_remote_socket():
+    placement = place_lcores(make_topology(nic_numa_node=1), 6)
+    assert placement['numa_local']
+    assert placement['smt_shared']
+    assert any('HT siblings' in warning for warning in placement['warnings'])
+
+
+def test_remote_socket_when_local_node_is_full():
+    placement = place_lcores(make_topology(nic_numa_node=1, smt=False), 6)
+    assert not placement['numa_local']
+    assert placement['socket'] == 1
+    assert any('remote socket' in warning for warning in placement['warnings'])
+
+
+def test_unknown_nic_node_assumes_first_cpu_node():
+    placement = place_lcores(make_topology(nic_numa_node=-1), 1)
+    assert placement['numa_node'] == 0
+    assert any('unknown' in warning for warning in placement['warnings'])
+
+
+def test_too_few_cpus():
+    with pytest.raises(ValueError):
+        place_lcores(make_topology(sockets=1, cores=2, smt=False), 2)
+
+
+def test_nic_node_without_cpus():
+    with pytest.raises(ValueError):
+        place_lcores(make_topology(nic_numa_node=2), 1)
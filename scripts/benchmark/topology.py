@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+NUMA/CPU topology and NIC-local lcore placement
+Reads /sys on a node (NUMA node of the NIC's PCI device, CPU packages,
+hyper-thread siblings, LLC domains) and picks DPDK lcores that keep the
+polling cores on the NIC's socket, one hardware thread per physical core,
+packed into the LLC domain with the most free cores. The chosen socket is the
+one the PCM parsers read (target_socket)
+
+Remote nodes are read by running this file there: `topology.py json <pci>`
+"""
+
+import functools
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+
+
+def parse_cpu_list(text):
+    """'0-3,8,10-11' -> [0, 1, 2, 3, 8, 10, 11]"""
+    cpus = []
+    for part in text.strip().split(','):
+        if not part:
+            continue
+        low, _, high = part.partition('-')
+        cpus.extend(range(int(low), int(high or low) + 1))
+    return cpus
+
+
+def format_cpu_list(cpus):
+    """[0, 1, 2, 3, 8] -> '0-3,8' (DPDK -l / pktgen -m lcore list)"""
+    parts = []
+    for cpu in sorted(cpus):
+        if parts and cpu == parts[-1][1] + 1:
+            parts[-1][1] = cpu
+        else:
+            parts.append([cpu, cpu])
+    return ','.join(str(low) if low == high else f'{low}-{high}' for low, high in parts)
+
+
+def _read(path, default=None):
+    try:
+        with open(path, 'r') as file:
+            return file.read().strip()
+    except OSError:
+        return default
+
+
+def read_topology(pci_address, sys_root='/sys'):
+    """Topology of this node as a JSON-serializable dict (None if /sys has no CPU topology)
+
+    {'pci': address, 'nic_numa_node': int (-1 = unknown), 'cpus': {cpu: {'package',
+    'core', 'numa_node', 'siblings', 'llc'}}}; llc is the lowest CPU sharing the
+    CPU's last-level cache.
+    """
+    cpu_root = f'{sys_root}/devices/system/cpu'
+    online = _read(f'{cpu_root}/online')
+    if not online:
+        return None
+
+    numa_of = {}
+    for node_dir in glob.glob(f'{sys_root}/devices/system/node/node[0-9]*'):
+        node = int(re.search(r'node(\d+)$', node_dir).group(1))
+        for cpu in parse_cpu_list(_read(f'{node_dir}/cpulist', '')):
+            numa_of[cpu] = node
+
+    cpus = {}
+    for cpu in parse_cpu_list(online):
+        topo = f'{cpu_root}/cpu{cpu}/topology'
+        package = int(_read(f'{topo}/physical_package_id', '0'))
+        # Last-level cache: the highest cache index (L3 on server CPUs)
+        llc_lists = sorted(glob.glob(f'{cpu_root}/cpu{cpu}/cache/index[0-9]*/shared_cpu_list'))
+        llc = min(parse_cpu_list(_read(llc_lists[-1], str(cpu)))) if llc_lists else package
+        cpus[cpu] = {
+            'package': package,
+            'core': int(_read(f'{topo}/core_id', str(cpu))),
+            'numa_node': numa_of.get(cpu, package),
+            'siblings': parse_cpu_list(_read(f'{topo}/thread_siblings_list', str(cpu))),
+            'llc': llc,
+        }
+
+    address = pci_address if pci_address.count(':') == 2 else f'0000:{pci_address}'
+    nic_numa_node = int(_read(f'{sys_root}/bus/pci/devices/{address}/numa_node', '-1'))
+    return {'pci': address, 'nic_numa_node': nic_numa_node, 'cpus': cpus}
+
+
+@functools.lru_cache(maxsize=None)
+def load_topology(pci_address, node=None, ssh_opts=('-o', 'BatchMode=yes'), timeout=20):
+    """read_topology() locally (node=None) or on node over ssh; None if unavailable (cached)"""
+    if not pci_address:
+        return None
+    if node is None:
+        return read_topology(pci_address)
+    cmd = ['ssh', *ssh_opts, node, f'python3 {os.path.abspath(__file__)} json {pci_address}']
+    try:
+        output = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False).stdout
+        topology = json.loads(output)
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        return None
+    if topology:
+        # JSON object keys are strings
+        topology['cpus'] = {int(cpu): info for cpu, info in topology['cpus'].items()}
+    return topology
+
+
+def place_lcores(topology, worker_count):
+    """Pick a main lcore plus worker_count polling lcores near the NIC
+
+    Physical cores on the NIC's NUMA node come first (one hardware thread each,
+    packed by LLC domain, largest domain first); only when they run out are HT
+    siblings and then other nodes used, each noted in warnings. CPU 0's core is
+    left to the OS unless nothing else is free, and the main lcore gives way to
+    polling lcores when physical cores are short. Returns {'main', 'workers',
+    'socket', 'numa_node', 'numa_local', 'smt_shared', 'warnings'}; raises
+    ValueError if too few CPUs are online or none on the NIC's NUMA node.
+    """
+    cpus = topology['cpus']
+    warnings = []
+    nic_node = topology['nic_numa_node']
+    if nic_node < 0:
+        nic_node = cpus[min(cpus)]['numa_node']
+        warnings.append(f'NUMA node of {topology["pci"]} unknown, assuming node {nic_node}')
+    if not any(info['numa_node'] == nic_node for info in cpus.values()):
+        raise ValueError(f'no online CPUs on NUMA node {nic_node} of {topology["pci"]}')
+
+    def ordered(numa_local):
+        """First hardware thread of each physical core, grouped by LLC (largest domain first)"""
+        first_threads = sorted({min(info['siblings']) for cpu, info in cpus.items()
+                                if (info['numa_node'] == nic_node) == numa_local})
+        domains = {}
+        for cpu in first_threads:
+            domains.setdefault(cpus[cpu]['llc'], []).append(cpu)
+        return [cpu for domain in sorted(domains.values(), key=lambda d: (-len(d), d[0])) for cpu in domain]
+
+    local_cores = ordered(True)
+    os_core = min(cpus[0]['siblings']) if 0 in cpus else None
+    if os_core in local_cores and len(local_cores) > worker_count + 1:
+        local_cores.remove(os_core)
+    local_siblings = [cpu for core in local_cores for cpu in cpus[core]['siblings'] if cpu != core]
+    candidates = local_cores + local_siblings + ordered(False)
+
+    needed = worker_count + 1
+    if len(candidates) < needed:
+        raise ValueError(f'{needed} lcores requested but only {len(candidates)} CPUs online')
+    if len(local_cores) >= needed:
+        main, workers = candidates[0], candidates[1:needed]
+    else:
+        # Short of physical cores: the (mostly idle) main lcore takes a sibling thread, not a worker's core
+        workers, main = candidates[:worker_count], candidates[worker_count]
+
+    numa_local = all(cpus[cpu]['numa_node'] == nic_node for cpu in workers)
+    worker_cores = [min(cpus[cpu]['siblings']) for cpu in workers]
+    smt_shared = len(set(worker_cores)) < len(worker_cores)
+    if smt_shared:
+        warnings.append(f'only {len(local_cores)} physical cores on NUMA node {nic_node}: lcores share HT siblings')
+    if not numa_local:
+        warnings.append(f'not enough CPUs on NUMA node {nic_node}: some polling lcores are on a remote socket')
+    return {
+        'main': main,
+        'workers': workers,
+        'socket': next(info['package'] for info in cpus.values() if info['numa_node'] == nic_node),
+        'numa_node': nic_node,
+        'numa_local': numa_local,
+        'smt_shared': smt_shared,
+        'warnings': warnings,
+    }
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == 'json':
+        print(json.dumps(read_topology(sys.argv[2])))
+    else:
+        print(f'Usage: {sys.argv[0]} json <pci_address>')
+        sys.exit(1)